@@ -0,0 +1,174 @@
+# -*- coding: utf-8 -*-
+"""
+Cold-start cost of the SDK: import time of its main modules and first use of
+the network schemas, each run measured in a fresh interpreter.
+
+    python -m benchmarks.import_time --budget sunrise6g_opensdk=1500 --json results.json
+
+Exits with 1 when a measure exceeds its budget (milliseconds) or regresses
+with respect to a baseline.
+"""
+import argparse
+import json
+import subprocess
+import sys
+from typing import Dict, List, Tuple
+
+MODULES = (
+    "sunrise6g_opensdk",
+    "sunrise6g_opensdk.network.core.schemas",
+)
+
+# Validation of a first CAMARA QoD session, once the schemas are imported
+_FIRST_USE_SNIPPET = """
+import time
+from sunrise6g_opensdk.network.core import schemas
+start = time.perf_counter()
+schemas.CreateSession.model_validate({
+    "duration": 3600,
+    "device": {"ipv4Address": {"publicAddress": "10.45.0.2", "privateAddress": "10.45.0.2"}},
+    "applicationServer": {"ipv4Address": "10.45.0.1"},
+    "qosProfile": "qos-e",
+    "sink": "https://endpoint.example.com/sink",
+})
+print((time.perf_counter() - start) * 1e3)
+"""
+
+# Fresh process instantiating a single network adapter: wall time and peak RSS
+_SINGLE_ADAPTER_SNIPPET = """
+import resource
+import time
+start = time.perf_counter()
+from sunrise6g_opensdk import Sdk
+Sdk.create_adapters_from(
+    {"network": {"client_name": "open5gs", "base_url": "http://nef", "scs_as_id": "scs"}}
+)
+elapsed = (time.perf_counter() - start) * 1e3
+print(elapsed, resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024)
+"""
+
+
+def import_times(module: str) -> Dict[str, float]:
+    """
+    Imports 'module' in a fresh interpreter and returns the cumulative import
+    time, in milliseconds, of every module it loaded.
+    """
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = {}
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|")
+        if cumulative.strip().isdigit():
+            times[name.strip()] = int(cumulative) / 1e3
+    return times
+
+
+def first_use_time() -> float:
+    completed = subprocess.run(
+        [sys.executable, "-c", _FIRST_USE_SNIPPET],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return float(completed.stdout.strip().splitlines()[-1])
+
+
+def single_adapter_cost() -> Tuple[float, float]:
+    """
+    Returns the time, in milliseconds, a fresh interpreter takes to import the
+    SDK and instantiate an open5gs adapter, and its peak RSS in MiB.
+    """
+    completed = subprocess.run(
+        [sys.executable, "-c", _SINGLE_ADAPTER_SNIPPET],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    milliseconds, rss = completed.stdout.strip().splitlines()[-1].split()
+    return float(milliseconds), float(rss)
+
+
+def measure(repeats: int, modules: List[str] = MODULES) -> Dict[str, float]:
+    """
+    Best of 'repeats' fresh runs of every measure, in milliseconds unless
+    stated otherwise.
+    """
+    results = {}
+    for _ in range(repeats):
+        times = import_times(modules[0])
+        for module in modules:
+            if module not in times:
+                times.update(import_times(module))
+            key = f"import {module}"
+            results[key] = min(results.get(key, float("inf")), times[module])
+        key = "schemas first QoD validation"
+        results[key] = min(results.get(key, float("inf")), first_use_time())
+        milliseconds, rss = single_adapter_cost()
+        key = "open5gs adapter cold start"
+        results[key] = min(results.get(key, float("inf")), milliseconds)
+        key = "open5gs adapter peak RSS (MiB)"
+        results[key] = min(results.get(key, float("inf")), rss)
+    return results
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument(
+        "--budget",
+        action="append",
+        default=[],
+        metavar="MODULE=MS",
+        help="maximum import time of a module, can be repeated",
+    )
+    parser.add_argument("--json", help="write the results to this file")
+    parser.add_argument("--baseline", help="results of a previous run to compare to")
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.2,
+        help="accepted increase with respect to the baseline, as a fraction",
+    )
+    args = parser.parse_args(argv)
+
+    budgets = {}
+    for budget in args.budget:
+        module, _, milliseconds = budget.rpartition("=")
+        budgets[f"import {module}"] = float(milliseconds)
+
+    results = measure(args.repeats)
+    baseline = {}
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+
+    print(f"{'measure':<52}{'value':>10}{'baseline':>10}{'budget':>10}")
+    failures = 0
+    for name, milliseconds in results.items():
+        line = f"{name:<52}{milliseconds:>10.1f}"
+        previous = baseline.get(name)
+        line += f"{previous:>10.1f}" if previous is not None else f"{'':>10}"
+        budget = budgets.get(name)
+        line += f"{budget:>10.0f}" if budget is not None else f"{'':>10}"
+        if budget is not None and milliseconds > budget:
+            line += "  OVER BUDGET"
+            failures += 1
+        elif previous is not None and milliseconds > previous * (1 + args.tolerance):
+            line += "  REGRESSION"
+            failures += 1
+        print(line)
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(results, f, indent=2)
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
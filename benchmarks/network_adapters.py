@@ -0,0 +1,307 @@
+# -*- coding: utf-8 -*-
+"""
+Load benchmark of the network adapters against the local NEF emulator.
+
+Every adapter runs the CAMARA operations it supports (QoD for all of them,
+Traffic Influence for OAI, location retrieval for Open5GS) and the suite
+reports, per operation, the throughput, the p50/p99 latency and the client
+CPU time spent per call. Results can be stored as JSON and compared against
+a previous run to catch regressions between releases:
+
+    python benchmarks/network_adapters.py --requests 2000 --concurrency 16 \
+        --json results.json --baseline previous.json
+"""
+import argparse
+import json
+import platform
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from importlib.metadata import PackageNotFoundError, version
+from typing import Callable, Dict, List
+
+from sunrise6g_opensdk.common.batch import percentile
+from sunrise6g_opensdk.common.sdk import Sdk as sdkclient
+from sunrise6g_opensdk.network.core.schemas import Device, RetrievalLocationRequest
+from sunrise6g_opensdk.network.nef_emulator import NefEmulator
+
+ADAPTERS = ("open5gs", "oai", "open5gcore")
+
+
+def qod_session_info(index: int) -> Dict:
+    ip = f"10.45.{index // 250}.{index % 250 + 1}"
+    return {
+        "duration": 3600,
+        "device": {"ipv4Address": {"publicAddress": ip, "privateAddress": ip}},
+        "applicationServer": {"ipv4Address": "10.45.0.1"},
+        "devicePorts": {"ports": [5000]},
+        "applicationServerPorts": {"ports": [6000]},
+        "qosProfile": "qos-e",
+        "sink": "https://endpoint.example.com/sink",
+    }
+
+
+def ti_info(index: int) -> Dict:
+    ip = f"12.1.{index // 250}.{index % 250 + 1}"
+    return {
+        "device": {"ipv4Address": {"publicAddress": ip, "privateAddress": ip}},
+        "edgeCloudZoneId": "edge",
+        "appId": "benchmark-app",
+        "appInstanceId": "172.21.18.3",
+        "notificationUri": "https://endpoint.example.com/sink",
+    }
+
+
+def measure(
+    operation: Callable, arguments: List, concurrency: int
+) -> tuple[Dict, List]:
+    """
+    Runs 'operation' once per argument and returns its statistics and results.
+
+    CPU time is measured with the calling thread's clock, so it only accounts
+    for the work done by the SDK and its HTTP stack, not by the emulator.
+    """
+    samples = []
+
+    def run(argument):
+        cpu_start = time.thread_time()
+        start = time.perf_counter()
+        try:
+            result, error = operation(argument), None
+        except Exception as e:
+            result, error = None, e
+        samples.append(
+            (time.perf_counter() - start, time.thread_time() - cpu_start, error)
+        )
+        return result
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        results = list(pool.map(run, arguments))
+    elapsed = time.perf_counter() - start
+
+    latencies = sorted(sample[0] for sample in samples) or [0.0]
+    stats = {
+        "calls": len(samples),
+        "errors": sum(1 for sample in samples if sample[2] is not None),
+        "ops_per_sec": len(samples) / elapsed if elapsed > 0 else 0.0,
+        "p50_ms": percentile(latencies, 50) * 1000,
+        "p99_ms": percentile(latencies, 99) * 1000,
+        "cpu_per_call_us": sum(sample[1] for sample in samples)
+        / max(len(samples), 1)
+        * 1e6,
+    }
+    return stats, results
+
+
+def benchmark_adapter(
+    client_name: str,
+    base_url: str,
+    requests_count: int,
+    concurrency: int,
+    warmup: int = 0,
+) -> Dict[str, Dict]:
+    adapter_specs = {
+        "network": {
+            "client_name": client_name,
+            "base_url": base_url,
+            "scs_as_id": "benchmark",
+            "pool_maxsize": concurrency,
+        }
+    }
+    network_client = sdkclient.create_adapters_from(adapter_specs)["network"]
+    indexes = list(range(requests_count))
+    report = {}
+    with network_client:
+        # Fill the connection pool and warm up the schemas before measuring
+        _, sessions = measure(
+            lambda i: network_client.create_qod_session(qod_session_info(i)),
+            list(range(warmup)),
+            concurrency,
+        )
+        measure(
+            network_client.delete_qod_session,
+            [str(s["sessionId"]) for s in sessions if s is not None],
+            concurrency,
+        )
+
+        report["qod_create"], sessions = measure(
+            lambda i: network_client.create_qod_session(qod_session_info(i)),
+            indexes,
+            concurrency,
+        )
+        session_ids = [str(s["sessionId"]) for s in sessions if s is not None]
+        report["qod_get"], _ = measure(
+            network_client.get_qod_session, session_ids, concurrency
+        )
+        report["qod_delete"], _ = measure(
+            network_client.delete_qod_session, session_ids, concurrency
+        )
+
+        if "traffic_influence" in network_client.capabilities:
+            report["ti_create"], resources = measure(
+                lambda i: network_client.create_traffic_influence_resource(ti_info(i)),
+                indexes,
+                concurrency,
+            )
+            # trafficInfluenceID holds the NEF "self" link, keep the id segment
+            resource_ids = [
+                str(r["trafficInfluenceID"]).rsplit("/", 1)[-1]
+                for r in resources
+                if r is not None
+            ]
+            report["ti_get"], _ = measure(
+                network_client.get_individual_traffic_influence_resource,
+                resource_ids,
+                concurrency,
+            )
+            report["ti_delete"], _ = measure(
+                network_client.delete_traffic_influence_resource,
+                resource_ids,
+                concurrency,
+            )
+
+        if "location_retrieval" in network_client.capabilities:
+            report["location"], _ = measure(
+                lambda i: network_client.create_monitoring_event_subscription(
+                    RetrievalLocationRequest(device=Device(phoneNumber=f"+3069{i:08d}"))
+                ),
+                indexes,
+                concurrency,
+            )
+    return report
+
+
+def compare(results: Dict, baseline: Dict, tolerance: float) -> List[str]:
+    """
+    Lists the operations whose throughput dropped or whose p99 latency grew
+    by more than 'tolerance' (a fraction) with respect to the baseline.
+    """
+    regressions = []
+    for client_name, operations in results["adapters"].items():
+        for operation, stats in operations.items():
+            previous = baseline.get("adapters", {}).get(client_name, {}).get(operation)
+            if previous is None:
+                continue
+            if stats["ops_per_sec"] < previous["ops_per_sec"] * (1 - tolerance):
+                regressions.append(
+                    f"{client_name}.{operation}: ops/sec "
+                    f"{previous['ops_per_sec']:.1f} -> {stats['ops_per_sec']:.1f}"
+                )
+            if stats["p99_ms"] > previous["p99_ms"] * (1 + tolerance):
+                regressions.append(
+                    f"{client_name}.{operation}: p99 "
+                    f"{previous['p99_ms']:.2f}ms -> {stats['p99_ms']:.2f}ms"
+                )
+    return regressions
+
+
+def print_report(results: Dict) -> None:
+    header = (
+        f"{'adapter':<12}{'operation':<12}{'calls':>8}{'errors':>8}"
+        f"{'ops/sec':>11}{'p50 ms':>10}{'p99 ms':>10}{'cpu/call us':>13}"
+    )
+    print(header)
+    print("-" * len(header))
+    for client_name, operations in results["adapters"].items():
+        for operation, stats in operations.items():
+            print(
+                f"{client_name:<12}{operation:<12}{stats['calls']:>8}"
+                f"{stats['errors']:>8}{stats['ops_per_sec']:>11.1f}"
+                f"{stats['p50_ms']:>10.2f}{stats['p99_ms']:>10.2f}"
+                f"{stats['cpu_per_call_us']:>13.1f}"
+            )
+
+
+def sdk_version() -> str:
+    try:
+        return version("sunrise6g-opensdk")
+    except PackageNotFoundError:
+        return "unknown"
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--adapters", nargs="+", choices=ADAPTERS, default=ADAPTERS)
+    parser.add_argument("--requests", type=int, default=1000)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument(
+        "--warmup", type=int, default=50, help="unmeasured calls before each adapter"
+    )
+    parser.add_argument(
+        "--base-url",
+        help="NEF to benchmark against, e.g. an emulator started with "
+        "'python -m sunrise6g_opensdk.network.nef_emulator' in another process; "
+        "by default an in-process emulator is used",
+    )
+    parser.add_argument(
+        "--latency", type=float, default=0.0, help="emulated NEF latency in seconds"
+    )
+    parser.add_argument(
+        "--jitter", type=float, default=0.0, help="emulated NEF jitter in seconds"
+    )
+    parser.add_argument(
+        "--error-rate", type=float, default=0.0, help="fraction of failed requests"
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", help="write the results to this file")
+    parser.add_argument("--baseline", help="results of a previous run to compare to")
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.1,
+        help="accepted regression with respect to the baseline, as a fraction",
+    )
+    args = parser.parse_args(argv)
+
+    results = {
+        "sdk_version": sdk_version(),
+        "python": platform.python_version(),
+        "config": {
+            "requests": args.requests,
+            "concurrency": args.concurrency,
+            "latency": args.latency,
+            "jitter": args.jitter,
+            "error_rate": args.error_rate,
+        },
+        "adapters": {},
+    }
+    emulator = None
+    base_url = args.base_url
+    if base_url is None:
+        emulator = NefEmulator(
+            latency=args.latency,
+            jitter=args.jitter,
+            error_rate=args.error_rate,
+            seed=args.seed,
+        ).start()
+        base_url = emulator.base_url
+    try:
+        for client_name in args.adapters:
+            results["adapters"][client_name] = benchmark_adapter(
+                client_name,
+                base_url,
+                args.requests,
+                args.concurrency,
+                args.warmup,
+            )
+    finally:
+        if emulator is not None:
+            emulator.stop()
+
+    print_report(results)
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(results, f, indent=2)
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            regressions = compare(results, json.load(f), args.tolerance)
+        for regression in regressions:
+            print(f"REGRESSION {regression}")
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
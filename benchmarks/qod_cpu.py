@@ -0,0 +1,134 @@
+# -*- coding: utf-8 -*-
+"""
+CPU cost of the QoD operations of the network adapters, without any network.
+
+The NEF is replaced by an in-memory session answering with canned responses,
+so the figures only account for the SDK work per call: CAMARA validation,
+subscription building, serialization and response translation.
+
+    python -m benchmarks.qod_cpu --calls 5000 --json results.json
+"""
+import argparse
+import json
+import sys
+import time
+import uuid
+from typing import Callable, Dict
+
+import requests
+
+from benchmarks.network_adapters import ADAPTERS, qod_session_info
+from sunrise6g_opensdk.common.sdk import Sdk as sdkclient
+
+
+class CannedNefSession(requests.Session):
+    """Answers every QoD request with a pre-serialized NEF response."""
+
+    def __init__(self):
+        super().__init__()
+        self.post_response = b""
+        self.get_response = b""
+
+    def prime(self, url: str, subscription: Dict) -> str:
+        subscription_id = str(uuid.uuid4())
+        resource = dict(subscription, self=f"{url}/{subscription_id}")
+        self.post_response = self.get_response = json.dumps(resource).encode()
+        return subscription_id
+
+    def request(self, method, url, **kwargs):
+        response = requests.Response()
+        response.status_code = 201 if method == "POST" else 200
+        response._content = {
+            "POST": self.post_response,
+            "GET": self.get_response,
+        }.get(method, b"")
+        return response
+
+
+def cpu_per_call(operation: Callable, calls: int, repeats: int) -> float:
+    """Best of 'repeats' runs of the mean process CPU time per call, in microseconds."""
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.process_time()
+        for _ in range(calls):
+            operation()
+        best = min(best, (time.process_time() - start) / calls)
+    return best * 1e6
+
+
+def benchmark_adapter(client_name: str, calls: int, repeats: int) -> Dict[str, float]:
+    adapter_specs = {
+        "network": {
+            "client_name": client_name,
+            "base_url": "http://nef.invalid",
+            "scs_as_id": "benchmark",
+        }
+    }
+    network_client = sdkclient.create_adapters_from(adapter_specs)["network"]
+    session = CannedNefSession()
+    network_client.http_session = session
+    session_info = qod_session_info(1)
+    subscription = json.loads(
+        network_client._build_qod_subscription(session_info).model_dump_json(
+            exclude_none=True, by_alias=True
+        )
+    )
+    session_id = session.prime(
+        f"{network_client.base_url}/3gpp-as-session-with-qos/v1/benchmark/subscriptions",
+        subscription,
+    )
+    return {
+        "qod_create_cpu_us": cpu_per_call(
+            lambda: network_client.create_qod_session(session_info), calls, repeats
+        ),
+        "qod_get_cpu_us": cpu_per_call(
+            lambda: network_client.get_qod_session(session_id), calls, repeats
+        ),
+    }
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--adapters", nargs="+", choices=ADAPTERS, default=ADAPTERS)
+    parser.add_argument("--calls", type=int, default=2000)
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--json", help="write the results to this file")
+    parser.add_argument("--baseline", help="results of a previous run to compare to")
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.1,
+        help="accepted CPU increase with respect to the baseline, as a fraction",
+    )
+    args = parser.parse_args(argv)
+
+    results = {
+        client_name: benchmark_adapter(client_name, args.calls, args.repeats)
+        for client_name in args.adapters
+    }
+    baseline = {}
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+
+    print(f"{'adapter':<12}{'operation':<20}{'cpu/call us':>13}{'baseline':>10}")
+    regressions = 0
+    for client_name, operations in results.items():
+        for operation, cpu in operations.items():
+            previous = baseline.get(client_name, {}).get(operation)
+            line = f"{client_name:<12}{operation:<20}{cpu:>13.1f}"
+            if previous is not None:
+                line += f"{previous:>10.1f}"
+                if cpu > previous * (1 + args.tolerance):
+                    line += "  REGRESSION"
+                    regressions += 1
+            print(line)
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(results, f, indent=2)
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -5,24 +5,122 @@
 # Contributors:
 #   - Adrián Pino Martínez (adrian.pino@i2cat.net)
 ##
+import importlib
+import threading
+from importlib.metadata import entry_points
+from typing import Dict, List
 
-from sunrise6g_opensdk.edgecloud.adapters.aeros.client import (
-    EdgeApplicationManager as AerosClient,
-)
-from sunrise6g_opensdk.edgecloud.adapters.i2edge.client import (
-    EdgeApplicationManager as I2EdgeClient,
-)
-from sunrise6g_opensdk.edgecloud.adapters.kubernetes.client import (
-    EdgeApplicationManager as kubernetesClient,
-)
-from sunrise6g_opensdk.network.adapters.oai.client import (
-    NetworkManager as OaiCoreClient,
-)
-from sunrise6g_opensdk.network.adapters.open5gcore.client import (
-    NetworkManager as Open5GCoreClient,
+# Adapters shipped with the SDK, as "module:class" references. Their modules
+# (and dependencies such as the kubernetes client) are only imported when the
+# adapter is first instantiated.
+EDGECLOUD_ADAPTERS = {
+    "aeros": "sunrise6g_opensdk.edgecloud.adapters.aeros.client:EdgeApplicationManager",
+    "i2edge": "sunrise6g_opensdk.edgecloud.adapters.i2edge.client:EdgeApplicationManager",
+    "kubernetes": "sunrise6g_opensdk.edgecloud.adapters.kubernetes.client:EdgeApplicationManager",
+}
+NETWORK_ADAPTERS = {
+    "open5gs": "sunrise6g_opensdk.network.adapters.open5gs.client:NetworkManager",
+    "oai": "sunrise6g_opensdk.network.adapters.oai.client:NetworkManager",
+    "open5gcore": "sunrise6g_opensdk.network.adapters.open5gcore.client:NetworkManager",
+}
+
+# Third-party packages register adapters under these entry point groups, e.g.
+#   [project.entry-points."sunrise6g_opensdk.network_adapters"]
+#   mycore = "mypackage.client:NetworkManager"
+EDGECLOUD_ENTRY_POINT_GROUP = "sunrise6g_opensdk.edgecloud_adapters"
+NETWORK_ENTRY_POINT_GROUP = "sunrise6g_opensdk.network_adapters"
+
+
+def _import_reference(reference: str):
+    module_name, _, attribute = reference.partition(":")
+    target = importlib.import_module(module_name)
+    for name in attribute.split("."):
+        target = getattr(target, name)
+    return target
+
+
+class AdapterRegistry:
+    """
+    Adapter classes of a domain, by client name, imported on first use.
+
+    Built-in adapters take precedence over the ones registered through
+    entry points, which are only looked up for names not registered otherwise.
+
+    args:
+        domain: Name of the domain, used in error messages.
+        adapters: Client names mapped to "module:class" references.
+        entry_point_group: Entry point group of third-party adapters.
+    """
+
+    def __init__(
+        self,
+        domain: str,
+        adapters: Dict[str, str],
+        entry_point_group: str | None = None,
+    ):
+        self.domain = domain
+        self.entry_point_group = entry_point_group
+        self._references: Dict[str, object] = dict(adapters)
+        self._classes: Dict[str, type] = {}
+        self._entry_points_loaded = entry_point_group is None
+        self._lock = threading.Lock()
+
+    def register(self, client_name: str, adapter) -> None:
+        """
+        Registers an adapter class, or a "module:class" reference to it.
+        """
+        with self._lock:
+            self._references[client_name] = adapter
+            self._classes.pop(client_name, None)
+
+    def names(self) -> List[str]:
+        self._load_entry_points()
+        return list(self._references)
+
+    def get(self, client_name: str) -> type:
+        """
+        Returns the adapter class registered under 'client_name', importing
+        its module on the first call.
+
+        raises:
+            ValueError: If no adapter is registered under 'client_name'.
+        """
+        adapter = self._classes.get(client_name)
+        if adapter is not None:
+            return adapter
+        if client_name not in self._references:
+            self._load_entry_points()
+        with self._lock:
+            try:
+                reference = self._references[client_name]
+            except KeyError:
+                raise ValueError(
+                    f"Invalid {self.domain} client '{client_name}'. "
+                    f"Available: {list(self._references)}"
+                )
+            if isinstance(reference, str):
+                adapter = _import_reference(reference)
+            else:
+                adapter = reference
+            self._classes[client_name] = adapter
+            return adapter
+
+    def _load_entry_points(self) -> None:
+        if self._entry_points_loaded:
+            return
+        with self._lock:
+            if self._entry_points_loaded:
+                return
+            for entry_point in entry_points(group=self.entry_point_group):
+                self._references.setdefault(entry_point.name, entry_point.value)
+            self._entry_points_loaded = True
+
+
+edgecloud_adapters = AdapterRegistry(
+    "edgecloud", EDGECLOUD_ADAPTERS, EDGECLOUD_ENTRY_POINT_GROUP
 )
-from sunrise6g_opensdk.network.adapters.open5gs.client import (
-    NetworkManager as Open5GSClient,
+network_adapters = AdapterRegistry(
+    "network", NETWORK_ADAPTERS, NETWORK_ENTRY_POINT_GROUP
 )
 
 
@@ -31,17 +129,8 @@ def _edgecloud_adapters_factory(client_name: str, base_url: str, **kwargs):
         if "flavour_id" not in kwargs:
             raise ValueError("Missing required 'flavour_id' for i2edge client.")
 
-    edge_cloud_factory = {
-        "aeros": lambda url, **kw: AerosClient(base_url=url, **kw),
-        "i2edge": lambda url, **kw: I2EdgeClient(base_url=url, **kw),
-        "kubernetes": lambda url, **kw: kubernetesClient(base_url=url, **kw),
-    }
-    try:
-        return edge_cloud_factory[client_name](base_url, **kwargs)
-    except KeyError:
-        raise ValueError(
-            f"Invalid edgecloud client '{client_name}'. Available: {list(edge_cloud_factory)}"
-        )
+    adapter = edgecloud_adapters.get(client_name)
+    return adapter(base_url=base_url, **kwargs)
 
 
 def _network_adapters_factory(client_name: str, base_url: str, **kwargs):
@@ -49,23 +138,8 @@ def _network_adapters_factory(client_name: str, base_url: str, **kwargs):
         raise ValueError("Missing required 'scs_as_id' for network adapters.")
     scs_as_id = kwargs.pop("scs_as_id")
 
-    network_factory = {
-        "open5gs": lambda url, scs_id, **kw: Open5GSClient(
-            base_url=url, scs_as_id=scs_id, **kw
-        ),
-        "oai": lambda url, scs_id, **kw: OaiCoreClient(
-            base_url=url, scs_as_id=scs_id, **kw
-        ),
-        "open5gcore": lambda url, scs_id, **kw: Open5GCoreClient(
-            base_url=url, scs_as_id=scs_id, **kw
-        ),
-    }
-    try:
-        return network_factory[client_name](base_url, scs_as_id, **kwargs)
-    except KeyError:
-        raise ValueError(
-            f"Invalid network client '{client_name}'. Available: {list(network_factory)}"
-        )
+    adapter = network_adapters.get(client_name)
+    return adapter(base_url=base_url, scs_as_id=scs_as_id, **kwargs)
 
 
 # def _oran_adapters_factory(client_name: str, base_url: str):
@@ -78,6 +152,24 @@ class AdaptersFactory:
         "network": _network_adapters_factory,
         # "oran": _oran_adapters_factory,
     }
+    _registries = {
+        "edgecloud": edgecloud_adapters,
+        "network": network_adapters,
+    }
+
+    @classmethod
+    def register_adapter(cls, domain: str, client_name: str, adapter) -> None:
+        """
+        Registers an adapter class, or a "module:class" reference to it, under
+        'client_name' in 'domain'.
+        """
+        try:
+            registry = cls._registries[domain]
+        except KeyError:
+            raise ValueError(
+                f"Unsupported domain '{domain}'. Supported: {list(cls._registries)}"
+            )
+        registry.register(client_name, adapter)
 
     @classmethod
     def instantiate_and_retrieve_adapters(
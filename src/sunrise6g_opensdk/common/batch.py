@@ -0,0 +1,144 @@
+# -*- coding: utf-8 -*-
+import asyncio
+import math
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, List, Sequence
+
+
+@dataclass
+class BatchItemResult:
+    """Outcome of a single operation of a batch, in input order."""
+
+    index: int
+    result: Any = None
+    error: Exception | None = None
+    latency: float | None = None  # seconds, None when the operation never ran
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+@dataclass
+class BatchStats:
+    total: int = 0
+    succeeded: int = 0
+    failed: int = 0
+    elapsed: float = 0.0  # seconds
+    throughput: float = 0.0  # completed operations per second
+    latency_mean: float | None = None
+    latency_p50: float | None = None
+    latency_p95: float | None = None
+    latency_p99: float | None = None
+    latency_max: float | None = None
+
+
+@dataclass
+class BatchResult:
+    items: List[BatchItemResult] = field(default_factory=list)
+    stats: BatchStats = field(default_factory=BatchStats)
+
+    @property
+    def results(self) -> List[Any]:
+        return [item.result for item in self.items if item.ok]
+
+    @property
+    def errors(self) -> Dict[int, Exception]:
+        return {item.index: item.error for item in self.items if not item.ok}
+
+
+def percentile(sorted_values: Sequence[float], pct: float) -> float | None:
+    """Nearest-rank percentile of an already sorted sequence."""
+    if not sorted_values:
+        return None
+    rank = max(math.ceil(pct / 100 * len(sorted_values)), 1)
+    return sorted_values[rank - 1]
+
+
+def _summarize(items: List[BatchItemResult], elapsed: float) -> BatchStats:
+    latencies = sorted(item.latency for item in items if item.latency is not None)
+    succeeded = sum(1 for item in items if item.ok)
+    return BatchStats(
+        total=len(items),
+        succeeded=succeeded,
+        failed=len(items) - succeeded,
+        elapsed=elapsed,
+        throughput=len(latencies) / elapsed if elapsed > 0 else 0.0,
+        latency_mean=sum(latencies) / len(latencies) if latencies else None,
+        latency_p50=percentile(latencies, 50),
+        latency_p95=percentile(latencies, 95),
+        latency_p99=percentile(latencies, 99),
+        latency_max=latencies[-1] if latencies else None,
+    )
+
+
+def _prepare(
+    count: int, max_in_flight: int, failed: Dict[int, Exception] | None
+) -> List[BatchItemResult]:
+    if max_in_flight < 1:
+        raise ValueError("max_in_flight must be positive.")
+    failed = failed or {}
+    return [BatchItemResult(index=i, error=failed.get(i)) for i in range(count)]
+
+
+def run_batch(
+    operation: Callable[[Any], Any],
+    arguments: Sequence[Any],
+    max_in_flight: int,
+    failed: Dict[int, Exception] | None = None,
+) -> BatchResult:
+    """
+    Runs 'operation' once per argument on a bounded thread pool.
+
+    Errors are recorded per item instead of aborting the batch. Items whose
+    index is in 'failed' (e.g. inputs rejected by validation) are not run and
+    keep the given error.
+    """
+    items = _prepare(len(arguments), max_in_flight, failed)
+
+    def run(item: BatchItemResult) -> None:
+        start = time.perf_counter()
+        try:
+            item.result = operation(arguments[item.index])
+        except Exception as e:
+            item.error = e
+        item.latency = time.perf_counter() - start
+
+    pending = [item for item in items if item.ok]
+    start = time.perf_counter()
+    if pending:
+        with ThreadPoolExecutor(max_workers=min(max_in_flight, len(pending))) as pool:
+            list(pool.map(run, pending))
+    return BatchResult(
+        items=items, stats=_summarize(items, time.perf_counter() - start)
+    )
+
+
+async def run_batch_async(
+    operation: Callable[[Any], Awaitable[Any]],
+    arguments: Sequence[Any],
+    max_in_flight: int,
+    failed: Dict[int, Exception] | None = None,
+) -> BatchResult:
+    """
+    Asyncio counterpart of run_batch, bounding the coroutines in flight with a semaphore.
+    """
+    items = _prepare(len(arguments), max_in_flight, failed)
+    semaphore = asyncio.Semaphore(max_in_flight)
+
+    async def run(item: BatchItemResult) -> None:
+        async with semaphore:
+            start = time.perf_counter()
+            try:
+                item.result = await operation(arguments[item.index])
+            except Exception as e:
+                item.error = e
+            item.latency = time.perf_counter() - start
+
+    start = time.perf_counter()
+    await asyncio.gather(*(run(item) for item in items if item.ok))
+    return BatchResult(
+        items=items, stats=_summarize(items, time.perf_counter() - start)
+    )
@@ -0,0 +1,326 @@
+# -*- coding: utf-8 -*-
+"""
+In-process cache shared by the adapters to avoid redundant platform round-trips.
+"""
+import asyncio
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import Any, Awaitable, Callable, Dict, Hashable
+
+from sunrise6g_opensdk import logger
+
+log = logger.get_logger(__name__)
+
+DEFAULT_CACHE_SIZE = 1024
+
+_MISSING = object()
+
+
+class TTLCache:
+    """
+    Thread-safe mapping whose entries expire 'ttl' seconds after being stored.
+
+    The number of entries is bounded by 'maxsize': storing a new entry in a
+    full cache evicts the least recently used one.
+
+    args:
+        ttl: Lifetime in seconds of the entries.
+        maxsize: Maximum number of entries kept.
+        clock: Monotonic time source, in seconds.
+    """
+
+    def __init__(
+        self,
+        ttl: float,
+        maxsize: int = DEFAULT_CACHE_SIZE,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if ttl <= 0:
+            raise ValueError("ttl must be positive.")
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1.")
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._clock = clock
+        self._lock = threading.Lock()
+        # key -> (expiry, value), least recently used first
+        self._entries: OrderedDict = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(
+        self,
+        key: Hashable,
+        default=None,
+        valid: Callable[[Any], bool] | None = None,
+    ):
+        """
+        Returns the live value stored under 'key', or 'default' counting a miss.
+
+        args:
+            valid: Predicate a live value must also satisfy to be returned. Values
+                   rejected by it are kept, and the lookup counts as a miss.
+        """
+        with self._lock:
+            entry = self._entries.get(key, _MISSING)
+            if entry is not _MISSING:
+                expiry, value = entry
+                if expiry <= self._clock():
+                    del self._entries[key]
+                    self.expirations += 1
+                elif valid is None or valid(value):
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return value
+            self.misses += 1
+            return default
+
+    def set(self, key: Hashable, value, ttl: float | None = None) -> None:
+        """
+        Stores 'value' under 'key' for 'ttl' seconds, the cache TTL by default.
+        """
+        expiry = self._clock() + (self.ttl if ttl is None else ttl)
+        with self._lock:
+            self._entries[key] = (expiry, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, key: Hashable) -> bool:
+        """
+        Drops the entry stored under 'key'.
+
+        returns:
+            Whether an entry was dropped.
+        """
+        with self._lock:
+            if self._entries.pop(key, _MISSING) is _MISSING:
+                return False
+            self.invalidations += 1
+            return True
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def snapshot(self) -> Dict:
+        """
+        Returns the size of the cache and its hit, miss and eviction counters.
+        """
+        with self._lock:
+            return {
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+                "ttl": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "invalidations": self.invalidations,
+            }
+
+
+def _start_thread(function: Callable[[], Any]) -> None:
+    threading.Thread(target=function, daemon=True).start()
+
+
+class RefreshAheadCache:
+    """
+    Cache of values loaded by key, answering reads from memory while the values
+    are reloaded in the background (stale-while-revalidate).
+
+    A value is fresh for 'ttl' seconds after being loaded. The first read made
+    once less than 'refresh_ahead' seconds are left starts reloading it in the
+    background, and reads keep getting the current value meanwhile. Expired
+    values are still returned for 'max_stale' seconds, while being reloaded;
+    past that, reads wait for a new value. A failed background reload keeps the
+    current value, and is tried again by the next read.
+
+    args:
+        load: Returns the value of a key.
+        ttl: Seconds during which a loaded value is fresh.
+        refresh_ahead: Seconds before expiry from which a read reloads the
+                       value in the background. 20% of 'ttl' by default.
+        max_stale: Seconds after expiry during which the value is still
+                   returned while being reloaded.
+        clock: Monotonic time source, in seconds.
+        spawn: Runs a background reload, on a new daemon thread by default.
+    """
+
+    def __init__(
+        self,
+        load: Callable[[Hashable], Any],
+        ttl: float,
+        refresh_ahead: float | None = None,
+        max_stale: float = 0.0,
+        clock: Callable[[], float] = time.monotonic,
+        spawn: Callable[[Callable[[], Any]], Any] = _start_thread,
+    ):
+        if ttl <= 0:
+            raise ValueError("ttl must be positive.")
+        refresh_ahead = ttl * 0.2 if refresh_ahead is None else refresh_ahead
+        if not 0 <= refresh_ahead <= ttl:
+            raise ValueError("refresh_ahead must be between 0 and ttl.")
+        if max_stale < 0:
+            raise ValueError("max_stale must not be negative.")
+        self.ttl = ttl
+        self.refresh_ahead = refresh_ahead
+        self.max_stale = max_stale
+        self._load = load
+        self._clock = clock
+        self._spawn = spawn
+        self._lock = threading.Lock()
+        self._entries: Dict[Hashable, tuple] = {}  # key -> (loaded at, value)
+        self._reloading: set = set()
+        self._flights = SingleFlight()
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.reloads = 0
+        self.reload_failures = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable):
+        """
+        Returns the value of 'key', loading it first when it is missing or
+        expired for more than 'max_stale' seconds.
+        """
+        now = self._clock()
+        reload_in_background = False
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and now - entry[0] < self.ttl + self.max_stale:
+                age = now - entry[0]
+                if age >= self.ttl - self.refresh_ahead and key not in self._reloading:
+                    self._reloading.add(key)
+                    reload_in_background = True
+                if age < self.ttl:
+                    self.hits += 1
+                else:
+                    self.stale_hits += 1
+            else:
+                entry = None
+                self.misses += 1
+        if entry is None:
+            return self._flights.do(key, lambda: self.reload(key))
+        if reload_in_background:
+            self._spawn(lambda: self._reload_in_background(key))
+        return entry[1]
+
+    def _reload_in_background(self, key: Hashable) -> None:
+        try:
+            self.reload(key)
+        except Exception as e:
+            log.warning("Background reload of %r failed: %s", key, e)
+            with self._lock:
+                self.reload_failures += 1
+        finally:
+            with self._lock:
+                self._reloading.discard(key)
+
+    def reload(self, key: Hashable):
+        """Loads the value of 'key' now, and returns it."""
+        value = self._load(key)
+        with self._lock:
+            self._entries[key] = (self._clock(), value)
+            self.reloads += 1
+        return value
+
+    def age(self, key: Hashable) -> float | None:
+        """
+        Returns the seconds elapsed since the value of 'key' was loaded, or
+        None if it is not cached.
+        """
+        entry = self._entries.get(key)
+        return None if entry is None else self._clock() - entry[0]
+
+    def invalidate(self, key: Hashable = _MISSING) -> None:
+        """Drops the value of 'key', or of every key."""
+        with self._lock:
+            if key is _MISSING:
+                self._entries.clear()
+            else:
+                self._entries.pop(key, None)
+
+    def snapshot(self) -> Dict:
+        """
+        Returns the size of the cache, its fresh and stale hits, its misses and
+        the number of reloads, failed background ones included.
+        """
+        with self._lock:
+            return {
+                "size": len(self._entries),
+                "ttl": self.ttl,
+                "hits": self.hits,
+                "stale_hits": self.stale_hits,
+                "misses": self.misses,
+                "reloads": self.reloads,
+                "reload_failures": self.reload_failures,
+            }
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent calls sharing a key into a single execution, whose
+    result (or exception) is handed to every caller.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, Future] = {}
+        self.coalesced = 0
+
+    def do(self, key: Hashable, function: Callable[[], Any]):
+        with self._lock:
+            future = self._calls.get(key)
+            leader = future is None
+            if leader:
+                future = self._calls[key] = Future()
+            else:
+                self.coalesced += 1
+        if not leader:
+            return future.result()
+
+        try:
+            result = function()
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                del self._calls[key]
+
+
+class AsyncSingleFlight:
+    """
+    Asyncio variant of SingleFlight, for coroutines of a single event loop.
+    """
+
+    def __init__(self):
+        self._calls: Dict[Hashable, asyncio.Future] = {}
+        self.coalesced = 0
+
+    async def do(self, key: Hashable, function: Callable[[], Awaitable]):
+        task = self._calls.get(key)
+        if task is None:
+            task = asyncio.ensure_future(function())
+            self._calls[key] = task
+            task.add_done_callback(lambda _: self._calls.pop(key, None))
+        else:
+            self.coalesced += 1
+        # A cancelled caller must not cancel the call shared with the others
+        return await asyncio.shield(task)
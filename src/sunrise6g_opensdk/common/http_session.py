@@ -0,0 +1,107 @@
+# -*- coding: utf-8 -*-
+import requests
+from requests.adapters import HTTPAdapter
+
+from sunrise6g_opensdk.common.resilience import Resilience
+
+DEFAULT_POOL_CONNECTIONS = 10
+DEFAULT_POOL_MAXSIZE = 10
+
+TRANSIENT_ERRORS = (requests.exceptions.ConnectionError, requests.exceptions.Timeout)
+
+
+def _earliest(*timeouts: float | None) -> float | None:
+    bounded = [timeout for timeout in timeouts if timeout is not None]
+    return min(bounded) if bounded else None
+
+
+class ResilientSession(requests.Session):
+    """
+    requests Session whose calls are bounded by a deadline, retried and circuit
+    broken according to a Resilience object.
+
+    An explicit 'timeout' passed to a call overrides the default budget. The
+    connect and read timeouts, when set, bound each attempt within that budget.
+    """
+
+    def __init__(
+        self,
+        resilience: Resilience,
+        connect_timeout: float | None = None,
+        read_timeout: float | None = None,
+    ):
+        super().__init__()
+        self.resilience = resilience
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+
+    def _attempt_timeout(self, remaining: float | None):
+        if self.connect_timeout is None and self.read_timeout is None:
+            return remaining
+        return (
+            _earliest(self.connect_timeout, remaining),
+            _earliest(self.read_timeout, remaining),
+        )
+
+    def request(self, method, url, *args, timeout=None, **kwargs):
+        def send(remaining):
+            return super(ResilientSession, self).request(
+                method, url, *args, timeout=self._attempt_timeout(remaining), **kwargs
+            )
+
+        return self.resilience.call(
+            method,
+            url,
+            send,
+            transient_errors=TRANSIENT_ERRORS,
+            timeout_errors=(requests.exceptions.Timeout,),
+            timeout=timeout,
+        )
+
+
+def build_http_session(
+    pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+    pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+    pool_block: bool = False,
+    keep_alive: bool = True,
+    resilience: Resilience | None = None,
+    connect_timeout: float | None = None,
+    read_timeout: float | None = None,
+) -> requests.Session:
+    """
+    Builds a requests Session backed by a pooled, keep-alive HTTP adapter.
+
+    The underlying urllib3 pools are thread-safe, so a single session can be
+    shared by all the threads issuing requests through the same adapter client.
+
+    args:
+        pool_connections: Number of per-host connection pools to cache.
+        pool_maxsize: Maximum number of connections kept open per host.
+        pool_block: Whether to block when no free connection is available
+                    instead of opening a throwaway one.
+        keep_alive: Whether to reuse connections across requests.
+        resilience: Deadline, retry and circuit breaker settings applied to every
+                    request. None sends each request once, without timeout.
+        connect_timeout: Seconds to wait for each attempt to connect, with 'resilience'.
+        read_timeout: Seconds to wait for each attempt to receive data, with 'resilience'.
+
+    returns:
+        A ready to use requests Session.
+    """
+    if pool_connections < 1 or pool_maxsize < 1:
+        raise ValueError("pool_connections and pool_maxsize must be positive.")
+
+    if resilience is None:
+        session = requests.Session()
+    else:
+        session = ResilientSession(resilience, connect_timeout, read_timeout)
+    adapter = HTTPAdapter(
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
+        pool_block=pool_block,
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    if not keep_alive:
+        session.headers["Connection"] = "close"
+    return session
@@ -0,0 +1,314 @@
+# -*- coding: utf-8 -*-
+"""
+Latency histograms, in-flight gauges and error counters of the calls made by
+the adapters to their platforms, labelled by adapter, operation and status.
+
+Metrics are disabled by default: instrumented calls then only check a global.
+They are enabled by installing a registry, e.g. the built-in one exporting
+the Prometheus text format:
+
+    registry = metrics.enable()
+    ...
+    print(registry.export())
+"""
+import bisect
+import functools
+import threading
+import time
+from typing import Callable, Dict, Sequence, Tuple
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+METRIC_PREFIX = "sunrise6g_opensdk"
+
+OK = "ok"
+
+
+class MetricsRegistry:
+    """
+    Receives the measurements of the instrumented calls. Subclasses forward
+    them to a metrics backend.
+    """
+
+    def observe(self, adapter: str, operation: str, status: str, seconds: float):
+        """Records the latency and the status of a finished call."""
+        raise NotImplementedError
+
+    def observe_phase(self, adapter: str, operation: str, phase: str, seconds: float):
+        """
+        Records the latency of a phase of a call, such as the serialization
+        of its payload or the parsing of its response.
+        """
+        raise NotImplementedError
+
+    def add_in_flight(self, adapter: str, operation: str, delta: int):
+        """Adds 'delta' to the number of calls in progress."""
+        raise NotImplementedError
+
+
+class _Histogram:
+    __slots__ = ("counts", "sum", "count")
+
+    def __init__(self, buckets: int):
+        self.counts = [0] * buckets
+        self.sum = 0.0
+        self.count = 0
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    labels = ",".join(
+        f'{name}="{_escape(str(value))}"' for name, value in zip(names, values)
+    )
+    if extra:
+        labels = f"{labels},{extra}" if labels else extra
+    return f"{{{labels}}}"
+
+
+class PrometheusMetrics(MetricsRegistry):
+    """
+    In-memory registry exporting its metrics in the Prometheus text format.
+
+    args:
+        buckets: Upper bounds in seconds of the latency histogram buckets.
+        prefix: Prefix of the metric names.
+    """
+
+    def __init__(
+        self, buckets: Sequence[float] = DEFAULT_BUCKETS, prefix=METRIC_PREFIX
+    ):
+        self.buckets = tuple(sorted(buckets))
+        self.prefix = prefix
+        self._lock = threading.Lock()
+        self._latencies: Dict[Tuple[str, str, str], _Histogram] = {}
+        self._phases: Dict[Tuple[str, str, str], _Histogram] = {}
+        self._errors: Dict[Tuple[str, str, str], int] = {}
+        self._in_flight: Dict[Tuple[str, str], int] = {}
+
+    def _record(self, histograms: Dict, key: tuple, seconds: float) -> None:
+        histogram = histograms.get(key)
+        if histogram is None:
+            histogram = histograms[key] = _Histogram(len(self.buckets))
+        index = bisect.bisect_left(self.buckets, seconds)
+        if index < len(self.buckets):
+            histogram.counts[index] += 1
+        histogram.sum += seconds
+        histogram.count += 1
+
+    def observe(self, adapter: str, operation: str, status: str, seconds: float):
+        key = (adapter, operation, str(status))
+        with self._lock:
+            self._record(self._latencies, key, seconds)
+            if status != OK:
+                self._errors[key] = self._errors.get(key, 0) + 1
+
+    def observe_phase(self, adapter: str, operation: str, phase: str, seconds: float):
+        with self._lock:
+            self._record(self._phases, (adapter, operation, phase), seconds)
+
+    def add_in_flight(self, adapter: str, operation: str, delta: int):
+        key = (adapter, operation)
+        with self._lock:
+            self._in_flight[key] = self._in_flight.get(key, 0) + delta
+
+    def snapshot(self) -> Dict:
+        """
+        Returns the number of calls and errors, by (adapter, operation, status),
+        and the calls in progress, by (adapter, operation).
+        """
+        with self._lock:
+            return {
+                "calls": {key: h.count for key, h in self._latencies.items()},
+                "errors": dict(self._errors),
+                "in_flight": dict(self._in_flight),
+            }
+
+    def clear(self) -> None:
+        """Resets every metric, to be called while no call is in progress."""
+        with self._lock:
+            self._latencies.clear()
+            self._phases.clear()
+            self._errors.clear()
+            self._in_flight.clear()
+
+    def _export_histogram(
+        self, lines: list, name: str, label_names: tuple, histograms: Dict
+    ) -> None:
+        for key, histogram in sorted(histograms.items()):
+            cumulative = 0
+            for bound, count in zip(self.buckets, histogram.counts):
+                cumulative += count
+                labels = _labels(label_names, key, f'le="{bound}"')
+                lines.append(f"{name}_bucket{labels} {cumulative}")
+            labels = _labels(label_names, key, 'le="+Inf"')
+            lines.append(f"{name}_bucket{labels} {histogram.count}")
+            labels = _labels(label_names, key)
+            lines.append(f"{name}_sum{labels} {histogram.sum}")
+            lines.append(f"{name}_count{labels} {histogram.count}")
+
+    def export(self) -> str:
+        """Returns the metrics in the Prometheus text exposition format."""
+        call_labels = ("adapter", "operation", "status")
+        lines = []
+        with self._lock:
+            name = f"{self.prefix}_request_duration_seconds"
+            lines.append(f"# HELP {name} Latency of the calls to the platforms.")
+            lines.append(f"# TYPE {name} histogram")
+            self._export_histogram(lines, name, call_labels, self._latencies)
+
+            name = f"{self.prefix}_request_phase_duration_seconds"
+            lines.append(f"# HELP {name} Latency of the phases of the calls.")
+            lines.append(f"# TYPE {name} histogram")
+            self._export_histogram(
+                lines, name, ("adapter", "operation", "phase"), self._phases
+            )
+
+            name = f"{self.prefix}_request_errors_total"
+            lines.append(f"# HELP {name} Calls to the platforms that failed.")
+            lines.append(f"# TYPE {name} counter")
+            for key, count in sorted(self._errors.items()):
+                lines.append(f"{name}{_labels(call_labels, key)} {count}")
+
+            name = f"{self.prefix}_requests_in_flight"
+            lines.append(f"# HELP {name} Calls to the platforms in progress.")
+            lines.append(f"# TYPE {name} gauge")
+            for key, count in sorted(self._in_flight.items()):
+                lines.append(f"{name}{_labels(('adapter', 'operation'), key)} {count}")
+        return "\n".join(lines) + "\n"
+
+
+_registry: MetricsRegistry | None = None
+
+
+def enable(registry: MetricsRegistry | None = None) -> MetricsRegistry:
+    """
+    Installs 'registry', a new PrometheusMetrics by default, as the receiver
+    of the measurements of every adapter.
+    """
+    global _registry
+    _registry = registry if registry is not None else PrometheusMetrics()
+    return _registry
+
+
+def disable() -> None:
+    global _registry
+    _registry = None
+
+
+def registry() -> MetricsRegistry | None:
+    return _registry
+
+
+def error_status(error: BaseException) -> str:
+    """
+    Returns the status label of a failed call: the HTTP status code of the
+    error or of its cause when known, else the name of the error type (of
+    its cause, for wrapped errors).
+    """
+    for candidate in (error, error.__cause__):
+        if candidate is None:
+            continue
+        response = getattr(candidate, "response", None)
+        status = getattr(response, "status_code", None)
+        if status is None:
+            # e.g. kubernetes ApiException
+            status = getattr(candidate, "status", None)
+        if isinstance(status, int):
+            return str(status)
+    # Wrapped errors are labelled by their cause, e.g. a timeout
+    return type(error.__cause__ or error).__name__
+
+
+class _Measurement:
+    __slots__ = ("registry", "adapter", "operation", "status", "start", "last")
+
+    def __init__(self, registry: MetricsRegistry, adapter: str, operation: str):
+        self.registry = registry
+        self.adapter = adapter
+        self.operation = operation
+        self.status = None
+
+    def __enter__(self):
+        self.registry.add_in_flight(self.adapter, self.operation, 1)
+        self.start = self.last = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        elapsed = time.perf_counter() - self.start
+        self.registry.add_in_flight(self.adapter, self.operation, -1)
+        # A stream closed before its end was not a failed call
+        if exc_value is not None and not isinstance(exc_value, GeneratorExit):
+            status = error_status(exc_value)
+        elif self.status is None or (
+            isinstance(self.status, int) and self.status < 400
+        ):
+            status = OK
+        else:
+            status = str(self.status)
+        self.registry.observe(self.adapter, self.operation, status, elapsed)
+        return False
+
+    def mark(self, phase: str) -> None:
+        """Records the time elapsed since the previous mark as 'phase'."""
+        now = time.perf_counter()
+        self.registry.observe_phase(
+            self.adapter, self.operation, phase, now - self.last
+        )
+        self.last = now
+
+
+class _NullMeasurement:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        return False
+
+    def __setattr__(self, name, value):
+        pass
+
+    def mark(self, phase: str) -> None:
+        pass
+
+
+_NULL_MEASUREMENT = _NullMeasurement()
+
+
+def measure(adapter: str, operation: str):
+    """
+    Context manager measuring a call. The HTTP status of the call can be set
+    on it as 'status'; calls raising an error are labelled by error_status.
+    """
+    if _registry is None:
+        return _NULL_MEASUREMENT
+    return _Measurement(_registry, adapter, operation)
+
+
+def instrument(adapter: str, operation: str | None = None) -> Callable:
+    """
+    Decorator measuring every call of a function, labelled by 'operation' or
+    else by the function name.
+    """
+
+    def decorator(function):
+        name = operation or function.__name__
+
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            if _registry is None:
+                return function(*args, **kwargs)
+            with _Measurement(_registry, adapter, name):
+                return function(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def observe_phase(adapter: str, operation: str, phase: str, seconds: float) -> None:
+    if _registry is not None:
+        _registry.observe_phase(adapter, operation, phase, seconds)
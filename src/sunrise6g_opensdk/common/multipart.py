@@ -0,0 +1,119 @@
+# -*- coding: utf-8 -*-
+"""
+multipart/form-data request bodies streamed from disk.
+"""
+import os
+import uuid
+from typing import Callable, Dict, Iterator
+
+DEFAULT_CHUNK_SIZE = 1024 * 1024  # bytes
+
+
+def _quote(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"')
+
+
+class MultipartFileStream:
+    """
+    multipart/form-data body made of form fields followed by one file, encoded
+    incrementally as it is read so that the file is never held in memory.
+
+    Its length is known upfront, so requests sends it with a Content-Length
+    header, chunk by chunk.
+
+    args:
+        fields: Form fields sent before the file.
+        file_field: Name of the form field of the file.
+        path: Path of the file to send.
+        chunk_size: Maximum number of bytes read from the file at once.
+        on_progress: Called with the bytes sent so far and the total size of
+                     the body, each time a chunk is read.
+        content_type: Content type of the file.
+    """
+
+    def __init__(
+        self,
+        fields: Dict[str, str],
+        file_field: str,
+        path: str,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        on_progress: Callable[[int, int], None] | None = None,
+        content_type: str = "application/octet-stream",
+    ):
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be positive.")
+        self.path = path
+        self.chunk_size = chunk_size
+        self.on_progress = on_progress
+        self.boundary = uuid.uuid4().hex
+        preamble = "".join(
+            f"--{self.boundary}\r\n"
+            f'Content-Disposition: form-data; name="{_quote(name)}"\r\n\r\n'
+            f"{value}\r\n"
+            for name, value in fields.items()
+        )
+        preamble += (
+            f"--{self.boundary}\r\n"
+            f'Content-Disposition: form-data; name="{_quote(file_field)}"; '
+            f'filename="{_quote(os.path.basename(path))}"\r\n'
+            f"Content-Type: {content_type}\r\n\r\n"
+        )
+        self._preamble = preamble.encode()
+        self._epilogue = f"\r\n--{self.boundary}--\r\n".encode()
+        self.file_size = os.path.getsize(path)
+        self._file = None
+        self.sent = 0
+
+    @property
+    def content_type(self) -> str:
+        return f"multipart/form-data; boundary={self.boundary}"
+
+    def __len__(self) -> int:
+        return len(self._preamble) + self.file_size + len(self._epilogue)
+
+    def read(self, size: int = -1) -> bytes:
+        """Returns up to 'size' bytes of the body, at most one chunk of the file."""
+        if size is None or size < 0:
+            size = self.chunk_size
+        data = self._next(min(size, self.chunk_size))
+        self.sent += len(data)
+        if data and self.on_progress is not None:
+            self.on_progress(self.sent, len(self))
+        return data
+
+    def _next(self, size: int) -> bytes:
+        preamble_size = len(self._preamble)
+        if self.sent < preamble_size:
+            return self._preamble[self.sent : self.sent + size]
+        if self.sent < preamble_size + self.file_size:
+            if self._file is None:
+                self._file = open(self.path, "rb")
+            self._file.seek(self.sent - preamble_size)
+            data = self._file.read(size)
+            if not data:
+                raise IOError(f"{self.path} shrank while being sent.")
+            return data
+        offset = self.sent - preamble_size - self.file_size
+        return self._epilogue[offset : offset + size]
+
+    def __iter__(self) -> Iterator[bytes]:
+        while True:
+            data = self.read()
+            if not data:
+                return
+            yield data
+
+    def rewind(self) -> None:
+        """Sends the body from its beginning again, e.g. to retry a request."""
+        self.sent = 0
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
@@ -0,0 +1,324 @@
+# -*- coding: utf-8 -*-
+"""
+Deadlines, retries and circuit breaking for outgoing HTTP calls.
+
+A Resilience object is shared by every call of a client. Each call gets a
+deadline budget covering all of its attempts, idempotent verbs are retried
+with exponential backoff and full jitter on transient failures, and one
+circuit breaker per target origin (scheme://host:port) fails calls fast once
+that origin keeps failing. The HTTP library specific parts (how to send one
+attempt and which exceptions are transient) are supplied by the caller.
+"""
+import asyncio
+import random
+import threading
+import time
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Dict, FrozenSet
+from urllib.parse import urlsplit
+
+DEFAULT_TIMEOUT = 30.0  # seconds, budget of a call including its retries
+DEFAULT_MAX_RETRIES = 2
+DEFAULT_FAILURE_THRESHOLD = 5
+DEFAULT_RESET_TIMEOUT = 30.0  # seconds
+
+
+class CircuitOpenError(Exception):
+    """Raised when a call is rejected because the circuit of its target is open."""
+
+    pass
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """
+    Which calls are retried and how long to wait between attempts.
+
+    The wait before retry n (starting at 0) is drawn uniformly from
+    [0, min(backoff_max, backoff_base * 2 ** n)].
+    """
+
+    max_retries: int = DEFAULT_MAX_RETRIES
+    backoff_base: float = 0.1  # seconds
+    backoff_max: float = 2.0  # seconds
+    idempotent_methods: FrozenSet[str] = frozenset({"GET", "PUT", "DELETE"})
+    retry_statuses: FrozenSet[int] = frozenset({500, 502, 503, 504})
+
+    def backoff(self, retry: int, rng: random.Random | None = None) -> float:
+        ceiling = min(self.backoff_max, self.backoff_base * 2**retry)
+        return (rng or random).uniform(0, ceiling)
+
+
+class CircuitBreaker:
+    """
+    Consecutive-failure circuit breaker.
+
+    After 'failure_threshold' consecutive failures the circuit opens and calls
+    are rejected with CircuitOpenError. Once 'reset_timeout' seconds have
+    elapsed a single probe call is let through (half-open): its success closes
+    the circuit again, its failure re-opens it.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(
+        self,
+        failure_threshold: int = DEFAULT_FAILURE_THRESHOLD,
+        reset_timeout: float = DEFAULT_RESET_TIMEOUT,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if failure_threshold < 1:
+            raise ValueError("failure_threshold must be positive.")
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._state = self.CLOSED
+        self._consecutive_failures = 0
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+        self._times_opened = 0
+        self._rejected = 0
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            if (
+                self._state == self.OPEN
+                and self._clock() - self._opened_at >= self.reset_timeout
+            ):
+                return self.HALF_OPEN
+            return self._state
+
+    def before_call(self) -> None:
+        with self._lock:
+            if self._state == self.OPEN:
+                if self._clock() - self._opened_at < self.reset_timeout:
+                    self._rejected += 1
+                    raise CircuitOpenError("circuit breaker is open")
+                self._state = self.HALF_OPEN
+            if self._state == self.HALF_OPEN:
+                if self._probe_in_flight:
+                    self._rejected += 1
+                    raise CircuitOpenError("circuit breaker is half-open")
+                self._probe_in_flight = True
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._state = self.CLOSED
+            self._consecutive_failures = 0
+            self._probe_in_flight = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._consecutive_failures += 1
+            if (
+                self._state == self.HALF_OPEN
+                or self._consecutive_failures >= self.failure_threshold
+            ):
+                if self._state != self.OPEN:
+                    self._times_opened += 1
+                self._state = self.OPEN
+                self._opened_at = self._clock()
+            self._probe_in_flight = False
+
+    def release(self) -> None:
+        """Ends a call whose outcome says nothing about the target's health."""
+        with self._lock:
+            self._probe_in_flight = False
+
+    def snapshot(self) -> Dict:
+        state = self.state
+        with self._lock:
+            return {
+                "state": state,
+                "consecutive_failures": self._consecutive_failures,
+                "times_opened": self._times_opened,
+                "rejected": self._rejected,
+            }
+
+
+class _Call:
+    """Book-keeping of the attempts of a single call."""
+
+    def __init__(self, resilience: "Resilience", method: str, url: str, timeout):
+        budget = resilience.timeout if timeout is None else timeout
+        self.resilience = resilience
+        self.deadline = None if budget is None else time.monotonic() + budget
+        self.breaker = resilience.breaker_for(url)
+        self.retryable = method.upper() in resilience.retry_policy.idempotent_methods
+        self.retries = 0
+
+    def remaining(self) -> float | None:
+        if self.deadline is None:
+            return None
+        return max(self.deadline - time.monotonic(), 0.001)
+
+    def before_attempt(self) -> None:
+        if self.breaker is not None:
+            try:
+                self.breaker.before_call()
+            except CircuitOpenError:
+                self.resilience._count("rejected")
+                raise
+        self.resilience._count("attempts")
+
+    def on_response(self, status_code: int) -> float | None:
+        """Returns the delay before retrying, or None when the response is final."""
+        if status_code not in self.resilience.retry_policy.retry_statuses:
+            if self.breaker is not None:
+                self.breaker.record_success()
+            return None
+        return self._on_failure()
+
+    def on_error(self, is_timeout: bool) -> float | None:
+        """Returns the delay before retrying, or None when the error must be raised."""
+        if is_timeout:
+            self.resilience._count("timeouts")
+        return self._on_failure()
+
+    def on_unexpected_error(self) -> None:
+        if self.breaker is not None:
+            self.breaker.release()
+
+    def _on_failure(self) -> float | None:
+        self.resilience._count("failures")
+        if self.breaker is not None:
+            self.breaker.record_failure()
+        policy = self.resilience.retry_policy
+        if not self.retryable or self.retries >= policy.max_retries:
+            return None
+        delay = policy.backoff(self.retries, self.resilience._random)
+        if self.deadline is not None and time.monotonic() + delay >= self.deadline:
+            return None
+        self.retries += 1
+        self.resilience._count("retries")
+        return delay
+
+
+class Resilience:
+    """
+    Deadline, retry and circuit breaker settings and state shared by the calls of a client.
+
+    args:
+        timeout: Budget in seconds of a call, including its retries. None disables it.
+        retry_policy: Which calls are retried and how. Defaults to RetryPolicy().
+        failure_threshold: Consecutive failures that open the circuit of a target.
+                           None disables circuit breaking.
+        reset_timeout: Seconds an open circuit waits before letting a probe through.
+    """
+
+    def __init__(
+        self,
+        timeout: float | None = DEFAULT_TIMEOUT,
+        retry_policy: RetryPolicy | None = None,
+        failure_threshold: int | None = DEFAULT_FAILURE_THRESHOLD,
+        reset_timeout: float = DEFAULT_RESET_TIMEOUT,
+    ):
+        self.timeout = timeout
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._random = random.Random()
+        self._lock = threading.Lock()
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self._counters = dict.fromkeys(
+            ("calls", "attempts", "retries", "failures", "timeouts", "rejected"), 0
+        )
+
+    def breaker_for(self, url: str) -> CircuitBreaker | None:
+        if self.failure_threshold is None:
+            return None
+        parts = urlsplit(url)
+        origin = f"{parts.scheme}://{parts.netloc}"
+        with self._lock:
+            breaker = self._breakers.get(origin)
+            if breaker is None:
+                breaker = CircuitBreaker(self.failure_threshold, self.reset_timeout)
+                self._breakers[origin] = breaker
+            return breaker
+
+    def _count(self, counter: str) -> None:
+        with self._lock:
+            self._counters[counter] += 1
+
+    def call(
+        self,
+        method: str,
+        url: str,
+        send: Callable,
+        transient_errors: tuple,
+        timeout_errors: tuple,
+        timeout: float | None = None,
+    ):
+        """
+        Sends a request through 'send(remaining_seconds)', retrying it as allowed.
+
+        Responses with a retryable status are returned once retries are exhausted,
+        transient exceptions are re-raised.
+        """
+        self._count("calls")
+        call = _Call(self, method, url, timeout)
+        while True:
+            call.before_attempt()
+            try:
+                response = send(call.remaining())
+            except transient_errors as e:
+                delay = call.on_error(isinstance(e, timeout_errors))
+                if delay is None:
+                    raise
+            except Exception:
+                call.on_unexpected_error()
+                raise
+            else:
+                delay = call.on_response(response.status_code)
+                if delay is None:
+                    return response
+                response.close()
+            time.sleep(delay)
+
+    async def acall(
+        self,
+        method: str,
+        url: str,
+        send: Callable[[float | None], Awaitable],
+        transient_errors: tuple,
+        timeout_errors: tuple,
+        timeout: float | None = None,
+    ):
+        """
+        Asyncio counterpart of call, 'send' being a coroutine function.
+        """
+        self._count("calls")
+        call = _Call(self, method, url, timeout)
+        while True:
+            call.before_attempt()
+            try:
+                response = await send(call.remaining())
+            except transient_errors as e:
+                delay = call.on_error(isinstance(e, timeout_errors))
+                if delay is None:
+                    raise
+            except Exception:
+                call.on_unexpected_error()
+                raise
+            else:
+                delay = call.on_response(response.status_code)
+                if delay is None:
+                    return response
+                await response.aclose()
+            await asyncio.sleep(delay)
+
+    def snapshot(self) -> Dict:
+        """
+        Returns the call counters and the state of every circuit breaker, keyed by origin.
+        """
+        with self._lock:
+            stats = dict(self._counters)
+            breakers = dict(self._breakers)
+        stats["circuit_breakers"] = {
+            origin: breaker.snapshot() for origin, breaker in breakers.items()
+        }
+        return stats
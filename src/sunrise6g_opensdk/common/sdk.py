@@ -25,6 +25,14 @@ class Sdk:
                                  - 'client_name' (str): The specific name of the client (e.g., 'i2edge', 'open5gs').
                                  - 'base_url' (str): The base URL for the client's API.
                                  Additional parameters like 'scs_as_id' may also be included.
+                                 Network adapters also accept the HTTP connection pool
+                                 settings 'pool_connections', 'pool_maxsize', 'pool_block'
+                                 and 'keep_alive', and the NEF call deadline, retry and
+                                 circuit breaker settings 'timeout', 'max_retries',
+                                 'failure_threshold' and 'reset_timeout', and the QoD
+                                 session registry settings 'session_cache_ttl' and
+                                 'session_cache_size', and the location cache settings
+                                 'location_cache_ttl' and 'location_cache_size'.
 
         Returns:
             dict: A dictionary where keys are the 'client_name' (str) and values are
@@ -43,7 +51,8 @@ class Sdk:
             >>>     'network': {
             >>>         'client_name': 'open5gs',
             >>>         'base_url': 'http://ip_network:port',
-            >>>         'additionalNetworkParamater1': 'example'
+            >>>         'scs_as_id': 'id_example',
+            >>>         'pool_maxsize': 50
             >>>     }
             >>> }
             >>>
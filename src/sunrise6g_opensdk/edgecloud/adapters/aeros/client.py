@@ -5,6 +5,7 @@
 #   - Vasilis Pitsilis (vpitsilis@dat.demokritos.gr, vpitsilis@iit.demokritos.gr)
 #   - Andreas Sakellaropoulos (asakellaropoulos@iit.demokritos.gr)
 ##
+import threading
 import uuid
 from typing import Any, Dict, List, Optional
 
@@ -16,6 +17,11 @@ from sunrise6g_opensdk.edgecloud.adapters.errors import EdgeCloudPlatformError
 from sunrise6g_opensdk.edgecloud.core.edgecloud_interface import (
     EdgeCloudManagementInterface,
 )
+from sunrise6g_opensdk.edgecloud.core.multi_zone import (
+    DEFAULT_MAX_IN_FLIGHT,
+    deploy_to_zones,
+    zone_id_of,
+)
 from sunrise6g_opensdk.logger import setup_logger
 
 
@@ -31,6 +37,8 @@ class EdgeApplicationManager(EdgeCloudManagementInterface):
         self._app_store: Dict[str, Dict] = {}
         self._deployed_services: Dict[str, List[str]] = {}
         self._stopped_services: Dict[str, List[str]] = {}
+        # Zones are deployed and rolled back from several threads
+        self._tracking_lock = threading.Lock()
 
         # Overwrite config values if provided via kwargs
         if "aerOS_API_URL" in kwargs:
@@ -95,9 +103,7 @@ class EdgeApplicationManager(EdgeCloudManagementInterface):
     def _generate_service_id(self, app_id: str) -> str:
         return f"urn:ngsi-ld:Service:{app_id}-{uuid.uuid4().hex[:4]}"
 
-    def _generate_tosca_yaml_dict(
-        self, app_manifest: Dict, app_zones: List[Dict]
-    ) -> Dict:
+    def _generate_tosca_yaml_dict(self, app_manifest: Dict, zone_id: str) -> Dict:
         component = app_manifest.get("componentSpec", [{}])[0]
         component_name = component.get("componentName", "application")
 
@@ -106,9 +112,6 @@ class EdgeApplicationManager(EdgeCloudManagementInterface):
         repository_url = (
             "/".join(image_path.split("/")[:-1]) if "/" in image_path else "docker_hub"
         )
-        zone_id = (
-            app_zones[0].get("EdgeCloudZone", {}).get("edgeCloudZoneId", "default-zone")
-        )
 
         # Extract minNodeMemory
         min_node_memory = (
@@ -199,22 +202,70 @@ class EdgeApplicationManager(EdgeCloudManagementInterface):
 
         return yaml_dict
 
-    def deploy_app(self, app_id: str, app_zones: List[Dict]) -> Dict:
-        # 1. Get app CAMARA manifest
+    def _get_app_manifest(self, app_id: str) -> Dict:
         app_manifest = self._app_store.get(app_id)
         if not app_manifest:
             raise EdgeCloudPlatformError(
                 f"Application with id '{app_id}' does not exist"
             )
+        return app_manifest
+
+    def deploy_app(self, app_id: str, app_zones: List[Dict]) -> Dict:
+        # 1. Get app CAMARA manifest
+        app_manifest = self._get_app_manifest(app_id)
+        if len(app_zones) > 1:
+            self.logger.warning(
+                "deploy_app only deploys app '%s' in the first of %d zones, "
+                "use deploy_app_to_zones to deploy it in all of them",
+                app_id,
+                len(app_zones),
+            )
+        zone_id = zone_id_of(app_zones[0]) or "default-zone"
+        return self._deploy_app_in_zone(app_id, app_manifest, zone_id)
+
+    def deploy_app_to_zones(
+        self,
+        app_id: str,
+        app_zones: List[Dict],
+        max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
+        quorum: Optional[int] = None,
+        rollback: bool = False,
+    ) -> Dict:
+        """
+        Deploys the app as one aerOS service per zone of 'app_zones',
+        concurrently.
+
+        args:
+            max_in_flight: Maximum number of zones deployed at the same time.
+            quorum: Minimum number of zones that must succeed, all by default.
+            rollback: Whether to undeploy the successful zones when the quorum
+                      is not met.
+        returns:
+            The outcome by zone, as returned by MultiZoneDeployment.as_dict,
+            whatever the number of zones.
+        """
+        app_manifest = self._get_app_manifest(app_id)
+        zone_ids = [zone_id_of(app_zone) or "default-zone" for app_zone in app_zones]
+        deployment = deploy_to_zones(
+            lambda zone_id: self._deploy_app_in_zone(app_id, app_manifest, zone_id),
+            zone_ids,
+            instance_id=lambda response: response["appInstanceId"],
+            max_in_flight=max_in_flight,
+            quorum=quorum,
+            undeploy=self.undeploy_app if rollback else None,
+        )
+        return deployment.as_dict()
 
+    def _deploy_app_in_zone(
+        self, app_id: str, app_manifest: Dict, zone_id: str
+    ) -> Dict:
         # 2. Generate unique service ID
         service_id = self._generate_service_id(app_id)
 
         # 3. Convert dict to YAML string
-        yaml_dict = self._generate_tosca_yaml_dict(app_manifest, app_zones)
+        yaml_dict = self._generate_tosca_yaml_dict(app_manifest, zone_id)
         tosca_yaml = yaml.dump(yaml_dict, sort_keys=False)
-        self.logger.info("Generated TOSCA YAML:")
-        self.logger.info(tosca_yaml)
+        self.logger.debug("Generated TOSCA YAML:\n%s", tosca_yaml)
 
         # 4. Instantiate client and call continuum to deploy service
         aeros_client = ContinuumClient(self.base_url)
@@ -226,9 +277,8 @@ class EdgeApplicationManager(EdgeCloudManagementInterface):
             )
 
         # 5. Track deployment
-        if app_id not in self._deployed_services:
-            self._deployed_services[app_id] = []
-        self._deployed_services[app_id].append(service_id)
+        with self._tracking_lock:
+            self._deployed_services.setdefault(app_id, []).append(service_id)
 
         # 6. Return expected format
         return {"appInstanceId": response["serviceId"]}
@@ -282,14 +332,15 @@ class EdgeApplicationManager(EdgeCloudManagementInterface):
         # self._purge_deployed_app_from_continuum(app_instance_id)
 
         # 4. Clean up internal tracking
-        self._deployed_services[found_app_id].remove(app_instance_id)
-        # Add instance to _stopped_services to purge it later
-        if found_app_id not in self._stopped_services:
-            self._stopped_services[found_app_id] = []
-        self._stopped_services[found_app_id].append(app_instance_id)
-        # If app has no instances left, remove it from deployed services
-        if not self._deployed_services[found_app_id]:
-            del self._deployed_services[found_app_id]
+        with self._tracking_lock:
+            self._deployed_services[found_app_id].remove(app_instance_id)
+            # Add instance to _stopped_services to purge it later
+            if found_app_id not in self._stopped_services:
+                self._stopped_services[found_app_id] = []
+            self._stopped_services[found_app_id].append(app_instance_id)
+            # If app has no instances left, remove it from deployed services
+            if not self._deployed_services[found_app_id]:
+                del self._deployed_services[found_app_id]
 
     def get_edge_cloud_zones(
         self, region: Optional[str] = None, status: Optional[str] = None
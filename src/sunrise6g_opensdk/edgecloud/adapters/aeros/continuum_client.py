@@ -12,6 +12,7 @@ aerOS REST API Client
 
 import requests
 
+from sunrise6g_opensdk.common import metrics
 from sunrise6g_opensdk.edgecloud.adapters.aeros import config
 from sunrise6g_opensdk.edgecloud.adapters.aeros.utils import catch_requests_exceptions
 from sunrise6g_opensdk.logger import setup_logger
@@ -61,7 +62,9 @@ class ContinuumClient:
         ngsi-ld object
         """
         entity_url = f"{self.api_url}/entities/{entity_id}?{ngsild_params}"
-        response = requests.get(entity_url, headers=self.headers, timeout=15)
+        with metrics.measure("aeros", "query_entity") as measurement:
+            response = requests.get(entity_url, headers=self.headers, timeout=15)
+            measurement.status = response.status_code
         if response is None:
             return None
         else:
@@ -82,7 +85,9 @@ class ContinuumClient:
         ngsi-ld object
         """
         entities_url = f"{self.api_url}/entities?{ngsild_params}"
-        response = requests.get(entities_url, headers=self.headers, timeout=15)
+        with metrics.measure("aeros", "query_entities") as measurement:
+            response = requests.get(entities_url, headers=self.headers, timeout=15)
+            measurement.status = response.status_code
         if response is None:
             return None
         # else:
@@ -102,7 +107,11 @@ class ContinuumClient:
         the re-allocated service json object
         """
         re_allocate_url = f"{self.api_url}/hlo_fe/services/{service_id}"
-        response = requests.put(re_allocate_url, headers=self.hlo_headers, timeout=15)
+        with metrics.measure("aeros", "deploy_service") as measurement:
+            response = requests.put(
+                re_allocate_url, headers=self.hlo_headers, timeout=15
+            )
+            measurement.status = response.status_code
         if response is None:
             return None
         else:
@@ -125,7 +134,11 @@ class ContinuumClient:
         the undeployed service json object
         """
         undeploy_url = f"{self.api_url}/hlo_fe/services/{service_id}"
-        response = requests.delete(undeploy_url, headers=self.hlo_headers, timeout=15)
+        with metrics.measure("aeros", "undeploy_service") as measurement:
+            response = requests.delete(
+                undeploy_url, headers=self.hlo_headers, timeout=15
+            )
+            measurement.status = response.status_code
         if response is None:
             return None
         else:
@@ -154,9 +167,14 @@ class ContinuumClient:
             self.logger.debug(
                 "Onboard service request body (TOSCA-YAML): %s", tosca_str
             )
-        response = requests.post(
-            onboard_url, data=tosca_str, headers=self.hlo_onboard_headers, timeout=15
-        )
+        with metrics.measure("aeros", "onboard_and_deploy_service") as measurement:
+            response = requests.post(
+                onboard_url,
+                data=tosca_str,
+                headers=self.hlo_onboard_headers,
+                timeout=15,
+            )
+            measurement.status = response.status_code
         if response is None:
             return None
         else:
@@ -179,7 +197,9 @@ class ContinuumClient:
         the purge result message from aerOS continuum
         """
         purge_url = f"{self.api_url}/hlo_fe/services/{service_id}/purge"
-        response = requests.delete(purge_url, headers=self.hlo_headers, timeout=15)
+        with metrics.measure("aeros", "purge_service") as measurement:
+            response = requests.delete(purge_url, headers=self.hlo_headers, timeout=15)
+            measurement.status = response.status_code
         if response is None:
             return False
         else:
@@ -6,12 +6,32 @@
 #   - Adrián Pino Martínez (adrian.pino@i2cat.net)
 #   - Sergio Giménez (sergio.gimenez@i2cat.net)
 ##
-from typing import Dict, List, Optional
+import copy
+from typing import Callable, Dict, List, Mapping, Optional
+
+import requests
 
 from sunrise6g_opensdk import logger
+from sunrise6g_opensdk.common.cache import DEFAULT_CACHE_SIZE, SingleFlight, TTLCache
+from sunrise6g_opensdk.common.http_session import (
+    DEFAULT_POOL_CONNECTIONS,
+    DEFAULT_POOL_MAXSIZE,
+    build_http_session,
+)
+from sunrise6g_opensdk.common.multipart import DEFAULT_CHUNK_SIZE
+from sunrise6g_opensdk.common.resilience import (
+    DEFAULT_MAX_RETRIES,
+    Resilience,
+    RetryPolicy,
+)
 from sunrise6g_opensdk.edgecloud.core.edgecloud_interface import (
     EdgeCloudManagementInterface,
 )
+from sunrise6g_opensdk.edgecloud.core.flavour_selection import (
+    BIN_PACKING,
+    FlavourCatalog,
+)
+from sunrise6g_opensdk.edgecloud.core.multi_zone import deploy_to_zones, zone_id_of
 
 from ...adapters.i2edge import schemas
 from .common import (
@@ -20,19 +40,142 @@ from .common import (
     i2edge_get,
     i2edge_post,
     i2edge_post_multiform_data,
+    i2edge_post_multipart_file,
 )
+from .instances import DEFAULT_REFRESH_INTERVAL, DeployedAppIndex
+from .onboarding import OnboardingProgress, onboard_in_batch
 
 log = logger.get_logger(__name__)
 
+DEFAULT_CONNECT_TIMEOUT = 5.0  # seconds
+DEFAULT_READ_TIMEOUT = 60.0  # seconds
+DEFAULT_APP_CACHE_TTL = 60.0  # seconds
+
+
+class _UnknownApp:
+    """Negative cache entry of an app id i2Edge does not know."""
+
+    __slots__ = ("message",)
+
+    def __init__(self, message: str):
+        self.message = message
+
+
+def _is_not_found(error: I2EdgeError) -> bool:
+    cause = error.__cause__
+    return (
+        isinstance(cause, requests.exceptions.HTTPError)
+        and cause.response is not None
+        and cause.response.status_code == 404
+    )
+
 
 class EdgeApplicationManager(EdgeCloudManagementInterface):
     """
     i2Edge Client
     """
 
-    def __init__(self, base_url: str, flavour_id: str):
+    def __init__(
+        self,
+        base_url: str,
+        flavour_id: str | None,
+        pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+        pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+        connect_timeout: float | None = DEFAULT_CONNECT_TIMEOUT,
+        read_timeout: float | None = DEFAULT_READ_TIMEOUT,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        app_cache_ttl: float | None = DEFAULT_APP_CACHE_TTL,
+        app_cache_size: int = DEFAULT_CACHE_SIZE,
+        unknown_app_ttl: float | None = None,
+        deployed_apps_refresh: float = DEFAULT_REFRESH_INTERVAL,
+        flavour_policy: str = BIN_PACKING,
+    ):
+        """
+        Sets up the pooled HTTP session shared by every i2Edge call of this client.
+
+        args:
+            flavour_id: Flavour every app is deployed with. None selects, in
+                        each zone, the flavour best fitting the
+                        'requiredResources' of the app manifest.
+            pool_connections: Number of per-host connection pools to cache.
+            pool_maxsize: Maximum number of connections kept open per host.
+            connect_timeout: Seconds to wait for a connection to i2Edge.
+                             None waits indefinitely.
+            read_timeout: Seconds to wait for i2Edge to send data, per attempt.
+                          None waits indefinitely.
+            max_retries: Retries of idempotent calls (GET/DELETE) failing with
+                         a connection error, a timeout or a transient 5xx.
+            app_cache_ttl: Seconds during which the profile of an onboarded app
+                           is served from a local cache instead of i2Edge.
+                           None disables the cache.
+            app_cache_size: Maximum number of app profiles kept in the cache,
+                            the least recently used ones are evicted first.
+            unknown_app_ttl: Seconds during which an app id unknown to i2Edge
+                             is answered as such from the cache. None disables
+                             this negative caching.
+            deployed_apps_refresh: Seconds after which the local index of the
+                                   deployed app instances is fetched again.
+                                   0 fetches it on every lookup.
+            flavour_policy: Policy of the flavour selection, BIN_PACKING or
+                            LEAST_WASTE, when no flavour_id is given.
+        """
         self.base_url = base_url
         self.flavour_id = flavour_id
+        self.flavour_policy = flavour_policy
+        # 'requiredResources' of the apps onboarded by this client, by app id
+        self._required_resources: Dict[str, Dict] = {}
+        self.pool_maxsize = pool_maxsize
+        self.resilience = Resilience(
+            timeout=None,
+            retry_policy=RetryPolicy(max_retries=max_retries),
+            failure_threshold=None,
+        )
+        self.http_session = build_http_session(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            resilience=self.resilience,
+            connect_timeout=connect_timeout,
+            read_timeout=read_timeout,
+        )
+        self.app_cache = None
+        if app_cache_ttl is not None:
+            self.app_cache = TTLCache(ttl=app_cache_ttl, maxsize=app_cache_size)
+        elif unknown_app_ttl is not None:
+            raise ValueError("unknown_app_ttl requires the app cache.")
+        self.unknown_app_ttl = unknown_app_ttl
+        # Concurrent lookups of the same app share one i2Edge call
+        self._app_flights = SingleFlight()
+        self.deployed_apps = DeployedAppIndex(
+            self.get_all_deployed_apps, refresh_interval=deployed_apps_refresh
+        )
+
+    def app_cache_stats(self) -> Dict:
+        """
+        Returns the hit/miss counters of the onboarded app cache and the number
+        of lookups coalesced into an in-flight i2Edge call.
+        """
+        stats = {"coalesced": self._app_flights.coalesced}
+        if self.app_cache is not None:
+            stats.update(self.app_cache.snapshot())
+        return stats
+
+    def _invalidate_app(self, app_id: str) -> None:
+        if self.app_cache is not None:
+            self.app_cache.invalidate(app_id)
+
+    def close(self) -> None:
+        """
+        Closes the pooled HTTP session and releases its connections.
+        """
+        if self.http_session is not None:
+            self.http_session.close()
+            self.http_session = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
 
     def get_edge_cloud_zones(
         self, region: Optional[str] = None, status: Optional[str] = None
@@ -40,7 +183,7 @@ class EdgeApplicationManager(EdgeCloudManagementInterface):
         url = "{}/zones/list".format(self.base_url)
         params = {}
         try:
-            response = i2edge_get(url, params=params)
+            response = i2edge_get(url, params=params, session=self.http_session)
             log.info("Availability zones retrieved successfully")
             return response
         except I2EdgeError as e:
@@ -52,7 +195,7 @@ class EdgeApplicationManager(EdgeCloudManagementInterface):
         url = "{}zone/{}".format(self.base_url, zone_id)
         params = {}
         try:
-            response = i2edge_get(url, params=params)
+            response = i2edge_get(url, params=params, session=self.http_session)
             log.info("Availability zone details retrieved successfully")
             return response
         except I2EdgeError as e:
@@ -82,15 +225,56 @@ class EdgeApplicationManager(EdgeCloudManagementInterface):
             repo_user_name=user_name,
         )
         try:
-            i2edge_post_multiform_data(url, payload)
+            i2edge_post_multiform_data(url, payload, session=self.http_session)
             log.info("Artifact added successfully")
         except I2EdgeError as e:
             raise e
 
+    def _upload_artefact(
+        self,
+        artefact_id: str,
+        artefact_name: str,
+        chart_path: str,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        on_progress: Callable[[int, int], None] | None = None,
+    ):
+        """
+        Creates an artefact from a local Helm chart or package, streamed from
+        disk so that large charts are never held in memory.
+
+        Failed uploads are retried from the beginning as many times as the
+        idempotent calls of this client.
+
+        args:
+            chart_path: Path of the chart archive.
+            chunk_size: Maximum number of bytes of the chart read at once.
+            on_progress: Called with the bytes sent so far and the body size.
+        """
+        url = "{}/artefact".format(self.base_url)
+        payload = schemas.ArtefactOnboarding(
+            artefact_id=artefact_id,
+            name=artefact_name,
+            repo_type=schemas.RepoType.UPLOAD,
+        )
+        try:
+            i2edge_post_multipart_file(
+                url,
+                payload,
+                "chart",
+                chart_path,
+                session=self.http_session,
+                chunk_size=chunk_size,
+                on_progress=on_progress,
+                retry_policy=self.resilience.retry_policy,
+            )
+            log.info("Artifact uploaded successfully")
+        except I2EdgeError as e:
+            raise e
+
     def _get_artefact(self, artefact_id: str) -> Dict:
         url = "{}/artefact/{}".format(self.base_url, artefact_id)
         try:
-            response = i2edge_get(url, artefact_id)
+            response = i2edge_get(url, artefact_id, session=self.http_session)
             log.info("Artifact retrieved successfully")
             return response
         except I2EdgeError as e:
@@ -99,7 +283,7 @@ class EdgeApplicationManager(EdgeCloudManagementInterface):
     def _get_all_artefacts(self) -> List[Dict]:
         url = "{}/artefact".format(self.base_url)
         try:
-            response = i2edge_get(url, {})
+            response = i2edge_get(url, {}, session=self.http_session)
             log.info("Artifacts retrieved successfully")
             return response
         except I2EdgeError as e:
@@ -108,11 +292,71 @@ class EdgeApplicationManager(EdgeCloudManagementInterface):
     def _delete_artefact(self, artefact_id: str):
         url = "{}/artefact".format(self.base_url)
         try:
-            i2edge_delete(url, artefact_id)
+            i2edge_delete(url, artefact_id, session=self.http_session)
             log.info("Artifact deleted successfully")
         except I2EdgeError as e:
             raise e
 
+    def _create_artefact_of(
+        self, app_manifest: Dict, artefact: Dict | None = None
+    ) -> None:
+        """
+        Creates the artefact of an app, from the given arguments of
+        _create_artefact (_upload_artefact with a 'chart_path') or else from
+        the 'appRepo' of its manifest.
+        """
+        if artefact is None:
+            app_repo = app_manifest.get("appRepo") or {}
+            artefact = {
+                "artefact_name": app_manifest.get("name", app_manifest["appId"]),
+                "repo_name": app_manifest.get("name"),
+                "repo_type": app_repo.get("type", schemas.RepoType.PUBLICREPO),
+                "repo_url": app_repo.get("imagePath"),
+                "password": app_repo.get("credentials"),
+                "user_name": app_repo.get("userName"),
+            }
+        if "chart_path" in artefact:
+            self._upload_artefact(artefact_id=app_manifest["appId"], **artefact)
+        else:
+            self._create_artefact(artefact_id=app_manifest["appId"], **artefact)
+
+    def onboard_apps(
+        self,
+        app_manifests: List[Dict],
+        artefacts: Mapping[str, Dict] | None = None,
+        max_in_flight: int | None = None,
+        on_progress: Callable[[OnboardingProgress], None] | None = None,
+    ) -> Dict:
+        """
+        Creates the artefact and onboards each app of 'app_manifests', many
+        apps at a time. The artefact of an app whose onboarding fails is
+        deleted again.
+
+        args:
+            artefacts: Arguments of _create_artefact, or of _upload_artefact
+                       with a 'chart_path', but artefact_id, by app ID.
+                       Apps not listed get an artefact built from the
+                       'appRepo' of their manifest.
+            max_in_flight: Maximum number of apps onboarded at the same time,
+                           the connection pool size by default.
+            on_progress: Called with an OnboardingProgress each time the
+                         onboarding of an app finishes.
+        returns:
+            The outcome of the batch, as returned by BatchOnboarding.as_dict.
+        """
+        artefacts = artefacts or {}
+        onboarding = onboard_in_batch(
+            lambda manifest: self._create_artefact_of(
+                manifest, artefacts.get(manifest["appId"])
+            ),
+            self.onboard_app,
+            self._delete_artefact,
+            app_manifests,
+            max_in_flight=max_in_flight or self.pool_maxsize,
+            on_progress=on_progress,
+        )
+        return onboarding.as_dict()
+
     def onboard_app(self, app_manifest: Dict) -> Dict:
         try:
             app_id = app_manifest["appId"]
@@ -124,7 +368,12 @@ class EdgeApplicationManager(EdgeCloudManagementInterface):
             )
             payload = schemas.ApplicationOnboardingRequest(profile_data=data)
             url = "{}/application/onboarding".format(self.base_url)
-            i2edge_post(url, payload)
+            try:
+                i2edge_post(url, payload, session=self.http_session)
+            finally:
+                self._invalidate_app(app_id)
+            if "requiredResources" in app_manifest:
+                self._required_resources[app_id] = app_manifest["requiredResources"]
         except I2EdgeError as e:
             raise e
         except KeyError as e:
@@ -133,14 +382,40 @@ class EdgeApplicationManager(EdgeCloudManagementInterface):
     def delete_onboarded_app(self, app_id: str) -> None:
         url = "{}/application/onboarding".format(self.base_url)
         try:
-            i2edge_delete(url, app_id)
+            i2edge_delete(url, app_id, session=self.http_session)
         except I2EdgeError as e:
             raise e
+        finally:
+            self._invalidate_app(app_id)
+            self._required_resources.pop(app_id, None)
 
     def get_onboarded_app(self, app_id: str) -> Dict:
+        if self.app_cache is None:
+            return self._fetch_onboarded_app(app_id)
+        app = self.app_cache.get(app_id)
+        if app is None:
+            app = self._app_flights.do(app_id, lambda: self._load_onboarded_app(app_id))
+        if isinstance(app, _UnknownApp):
+            raise I2EdgeError(app.message)
+        # Callers own the returned app, keep the cached one untouched
+        return copy.deepcopy(app)
+
+    def _load_onboarded_app(self, app_id: str) -> Dict | _UnknownApp:
+        try:
+            app = self._fetch_onboarded_app(app_id)
+        except I2EdgeError as e:
+            if self.unknown_app_ttl is None or not _is_not_found(e):
+                raise
+            app = _UnknownApp(str(e))
+            self.app_cache.set(app_id, app, ttl=self.unknown_app_ttl)
+        else:
+            self.app_cache.set(app_id, app)
+        return app
+
+    def _fetch_onboarded_app(self, app_id: str) -> Dict:
         url = "{}/application/onboarding/{}".format(self.base_url, app_id)
         try:
-            response = i2edge_get(url, app_id)
+            response = i2edge_get(url, app_id, session=self.http_session)
             return response
         except I2EdgeError as e:
             raise e
@@ -149,47 +424,100 @@ class EdgeApplicationManager(EdgeCloudManagementInterface):
         url = "{}/applications/onboarding".format(self.base_url)
         params = {}
         try:
-            response = i2edge_get(url, params)
+            response = i2edge_get(url, params, session=self.http_session)
             return response
         except I2EdgeError as e:
             raise e
 
-    # def _select_best_flavour_for_app(self, zone_id) -> str:
-    #     # list_of_flavours = self.get_edge_cloud_zones_details(zone_id)
-    #     # <logic that select the best flavour>
-    #     return flavourId
+    def _select_best_flavour_for_app(self, app_id: str, zone_id: str) -> str:
+        required_resources = self._required_resources.get(app_id)
+        if required_resources is None:
+            raise I2EdgeError(
+                "No flavour_id given and the requiredResources of app '{}' "
+                "are unknown".format(app_id)
+            )
+        catalog = FlavourCatalog([self.get_edge_cloud_zones_details(zone_id)])
+        choices = catalog.select(required_resources, policy=self.flavour_policy)
+        if not choices:
+            raise I2EdgeError(
+                "No flavour of zone '{}' fits app '{}'".format(zone_id, app_id)
+            )
+        return choices[0].flavour_id
 
     def deploy_app(self, app_id: str, app_zones: List[Dict]) -> Dict:
+        if len(app_zones) > 1:
+            log.warning(
+                "deploy_app only deploys app '%s' in the first of %d zones, "
+                "use deploy_app_to_zones to deploy it in all of them",
+                app_id,
+                len(app_zones),
+            )
+        return self._deploy_app_in_zone(app_id, zone_id_of(app_zones[0]))
+
+    def deploy_app_to_zones(
+        self,
+        app_id: str,
+        app_zones: List[Dict],
+        max_in_flight: int | None = None,
+        quorum: int | None = None,
+        rollback: bool = False,
+    ) -> Dict:
+        """
+        Deploys the app in every zone of 'app_zones' concurrently.
+
+        args:
+            max_in_flight: Maximum number of zones deployed at the same time,
+                           the connection pool size by default.
+            quorum: Minimum number of zones that must succeed, all by default.
+            rollback: Whether to undeploy the successful zones when the quorum
+                      is not met.
+        returns:
+            The outcome by zone, as returned by MultiZoneDeployment.as_dict,
+            whatever the number of zones.
+        """
+        zone_ids = [zone_id_of(app_zone) for app_zone in app_zones]
+        deployment = deploy_to_zones(
+            lambda zone_id: self._deploy_app_in_zone(app_id, zone_id),
+            zone_ids,
+            instance_id=lambda response: response["deploy_name"],
+            max_in_flight=max_in_flight or self.pool_maxsize,
+            quorum=quorum,
+            undeploy=self.undeploy_app if rollback else None,
+        )
+        return deployment.as_dict()
+
+    def _deploy_app_in_zone(self, app_id: str, zone_id: str) -> Dict:
         appId = app_id
         app = self.get_onboarded_app(appId)
         profile_data = app["profile_data"]
         appProviderId = profile_data["appProviderId"]
         appVersion = profile_data["appMetaData"]["version"]
-        zone_info = app_zones[0]["EdgeCloudZone"]
-        zone_id = zone_info["edgeCloudZoneId"]
-        # TODO: atm the flavour id is specified as an input parameter
-        # flavourId = self._select_best_flavour_for_app(zone_id=zone_id)
+        flavourId = self.flavour_id
+        if flavourId is None:
+            flavourId = self._select_best_flavour_for_app(appId, zone_id)
         app_deploy_data = schemas.AppDeployData(
             appId=appId,
             appProviderId=appProviderId,
             appVersion=appVersion,
-            zoneInfo=schemas.ZoneInfo(flavourId=self.flavour_id, zoneId=zone_id),
+            zoneInfo=schemas.ZoneInfo(flavourId=flavourId, zoneId=zone_id),
         )
         url = "{}/app/".format(self.base_url)
         payload = schemas.AppDeploy(app_deploy_data=app_deploy_data)
         try:
-            response = i2edge_post(url, payload)
+            response = i2edge_post(url, payload, session=self.http_session)
             log.info("App deployed successfully")
-            print(response)
+            log.debug("i2Edge deployment: %s", response)
             return response
         except I2EdgeError as e:
             raise e
+        finally:
+            self.deployed_apps.invalidate()
 
     def get_all_deployed_apps(self) -> List[Dict]:
         url = "{}/app/".format(self.base_url)
         params = {}
         try:
-            response = i2edge_get(url, params=params)
+            response = i2edge_get(url, params=params, session=self.http_session)
             log.info("All app instances retrieved successfully")
             return response
         except I2EdgeError as e:
@@ -208,33 +536,30 @@ class EdgeApplicationManager(EdgeCloudManagementInterface):
         except KeyError as e:
             raise ValueError(f"Onboarded app missing required field: {e}")
 
-        # Step 2) Retrieve all deployed apps and filter the one(s) where release_name == app_name
-        deployed_apps = self.get_all_deployed_apps()
-        if not deployed_apps:
+        # Step 2) Look up the deployed app whose release_name == app_name in the zone
+        app_instance = self.deployed_apps.by_release(app_name, zone_id)
+        if app_instance is None and not len(self.deployed_apps):
             return []
+        return app_instance
 
-        # Filter apps where release_name matches our app_name and zone matches
-        for app_instance_name in deployed_apps:
-            if (
-                app_instance_name.get("release_name") == app_name
-                and app_instance_name.get("zone_id") == zone_id
-            ):
-                return app_instance_name
-        return None
+    def get_deployed_app_by_namespace(self, namespace: str) -> Dict | None:
+        """
+        Returns the deployed app instance running in a Kubernetes namespace.
+        """
+        return self.deployed_apps.by_namespace(namespace)
 
-        url = "{}/app/{}/{}".format(self.base_url, zone_id, app_instance_name)
-        params = {}
-        try:
-            response = i2edge_get(url, params=params)
-            log.info("App instance retrieved successfully")
-            return response
-        except I2EdgeError as e:
-            raise e
+    def get_deployed_app_by_name(self, app_instance_name: str) -> Dict | None:
+        """
+        Returns the deployed app instance named 'app_instance_name' by i2Edge.
+        """
+        return self.deployed_apps.by_name(app_instance_name)
 
     def undeploy_app(self, app_instance_id: str) -> None:
         url = "{}/app".format(self.base_url)
         try:
-            i2edge_delete(url, app_instance_id)
+            i2edge_delete(url, app_instance_id, session=self.http_session)
             log.info("App instance deleted successfully")
         except I2EdgeError as e:
             raise e
+        finally:
+            self.deployed_apps.invalidate()
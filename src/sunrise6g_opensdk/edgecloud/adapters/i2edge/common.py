@@ -7,12 +7,17 @@
 #   - Sergio Giménez (sergio.gimenez@i2cat.net)
 ##
 import json
-from typing import Optional
+import time
+from typing import Callable, Optional
 
 import requests
 from pydantic import BaseModel
 
 from sunrise6g_opensdk import logger
+from sunrise6g_opensdk.common import metrics
+from sunrise6g_opensdk.common.http_session import TRANSIENT_ERRORS
+from sunrise6g_opensdk.common.multipart import DEFAULT_CHUNK_SIZE, MultipartFileStream
+from sunrise6g_opensdk.common.resilience import RetryPolicy
 from sunrise6g_opensdk.edgecloud.adapters.errors import EdgeCloudPlatformError
 
 log = logger.get_logger(__name__)
@@ -27,6 +32,16 @@ class I2EdgeErrorResponse(BaseModel):
     detail: dict
 
 
+def _requester(session: requests.Session | None):
+    return session if session is not None else requests
+
+
+def _unreachable(url: str, error: Exception) -> I2EdgeError:
+    err_msg = "i2Edge did not answer {}: {}".format(url, error)
+    log.error(err_msg)
+    return I2EdgeError(err_msg)
+
+
 def get_error_message_from(response: requests.Response) -> str:
     try:
         error_response = I2EdgeErrorResponse(**response.json())
@@ -36,62 +51,150 @@ def get_error_message_from(response: requests.Response) -> str:
         return response.text
 
 
-def i2edge_post(url: str, model_payload: BaseModel) -> dict:
+def i2edge_post(
+    url: str, model_payload: BaseModel, session: requests.Session | None = None
+) -> dict:
     headers = {
         "Content-Type": "application/json",
         "accept": "application/json",
     }
     json_payload = json.dumps(model_payload.model_dump(mode="json"))
     try:
-        response = requests.post(url, data=json_payload, headers=headers)
-        response.raise_for_status()
-        return response.json()
+        with metrics.measure("i2edge", "post"):
+            response = _requester(session).post(url, data=json_payload, headers=headers)
+            response.raise_for_status()
+            return response.json()
     except requests.exceptions.HTTPError as e:
         i2edge_err_msg = get_error_message_from(response)
         err_msg = "Failed to deploy app: {}. Detail: {}".format(i2edge_err_msg, e)
         log.error(err_msg)
-        raise I2EdgeError(err_msg)
+        raise I2EdgeError(err_msg) from e
+    except TRANSIENT_ERRORS as e:
+        raise _unreachable(url, e) from e
 
 
-def i2edge_post_multiform_data(url: str, model_payload: BaseModel) -> dict:
+def i2edge_post_multiform_data(
+    url: str, model_payload: BaseModel, session: requests.Session | None = None
+) -> dict:
     headers = {
         "accept": "application/json",
     }
     payload_dict = model_payload.model_dump(mode="json")
     payload_in_str = {k: str(v) for k, v in payload_dict.items()}
     try:
-        response = requests.post(url, data=payload_in_str, headers=headers)
-        response.raise_for_status()
-        return response.json()
+        with metrics.measure("i2edge", "post_multiform_data"):
+            response = _requester(session).post(
+                url, data=payload_in_str, headers=headers
+            )
+            response.raise_for_status()
+            return response.json()
     except requests.exceptions.HTTPError as e:
         i2edge_err_msg = get_error_message_from(response)
         err_msg = "Failed to deploy app: {}. Detail: {}".format(i2edge_err_msg, e)
         log.error(err_msg)
-        raise I2EdgeError(err_msg)
-
-
-def i2edge_delete(url: str, id: str) -> dict:
+        raise I2EdgeError(err_msg) from e
+    except TRANSIENT_ERRORS as e:
+        raise _unreachable(url, e) from e
+
+
+def i2edge_post_multipart_file(
+    url: str,
+    model_payload: BaseModel,
+    file_field: str,
+    path: str,
+    session: requests.Session | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    on_progress: Callable[[int, int], None] | None = None,
+    retry_policy: RetryPolicy | None = None,
+) -> dict:
+    """
+    Posts the fields of 'model_payload' and the file at 'path' as a
+    multipart/form-data body streamed from disk, chunk by chunk.
+
+    Uploads failing with a connection error, a timeout or a transient 5xx are
+    sent again from the beginning, as i2Edge cannot resume them.
+
+    args:
+        file_field: Name of the form field of the file.
+        on_progress: Called with the bytes sent so far and the body size.
+        retry_policy: Number of retries and backoff of failed uploads. None
+                      sends the body once.
+    """
+    headers = {"accept": "application/json"}
+    fields = {
+        k: str(v)
+        for k, v in model_payload.model_dump(mode="json").items()
+        if v is not None
+    }
+    retry_policy = retry_policy or RetryPolicy(max_retries=0)
+    with MultipartFileStream(
+        fields, file_field, path, chunk_size=chunk_size, on_progress=on_progress
+    ) as body:
+        headers["Content-Type"] = body.content_type
+        for retry in range(retry_policy.max_retries + 1):
+            if retry:
+                time.sleep(retry_policy.backoff(retry - 1))
+                body.rewind()
+            try:
+                with metrics.measure("i2edge", "post_multipart_file"):
+                    response = _requester(session).post(url, data=body, headers=headers)
+                if (
+                    response.status_code in retry_policy.retry_statuses
+                    and retry < retry_policy.max_retries
+                ):
+                    log.warning(
+                        "Upload of %s failed with status %d, retrying",
+                        path,
+                        response.status_code,
+                    )
+                    # Releases the connection to the pool before the retry
+                    response.close()
+                    continue
+                response.raise_for_status()
+                return response.json()
+            except requests.exceptions.HTTPError as e:
+                i2edge_err_msg = get_error_message_from(response)
+                err_msg = "Failed to upload {}: {}. Detail: {}".format(
+                    path, i2edge_err_msg, e
+                )
+                log.error(err_msg)
+                raise I2EdgeError(err_msg) from e
+            except TRANSIENT_ERRORS as e:
+                if retry == retry_policy.max_retries:
+                    raise _unreachable(url, e) from e
+                log.warning("Upload of %s failed: %s, retrying", path, e)
+
+
+def i2edge_delete(url: str, id: str, session: requests.Session | None = None) -> dict:
     headers = {"accept": "application/json"}
     try:
         query = "{}/{}".format(url, id)
-        response = requests.delete(query, headers=headers)
-        response.raise_for_status()
-        return response.json()
+        with metrics.measure("i2edge", "delete"):
+            response = _requester(session).delete(query, headers=headers)
+            response.raise_for_status()
+            return response.json()
     except requests.exceptions.HTTPError as e:
         i2edge_err_msg = get_error_message_from(response)
         err_msg = "Failed to undeploy app: {}. Detail: {}".format(i2edge_err_msg, e)
         log.error(err_msg)
-        raise I2EdgeError(err_msg)
+        raise I2EdgeError(err_msg) from e
+    except TRANSIENT_ERRORS as e:
+        raise _unreachable(url, e) from e
 
 
-def i2edge_get(url: str, params: Optional[dict]):
+def i2edge_get(
+    url: str, params: Optional[dict], session: requests.Session | None = None
+):
     headers = {"accept": "application/json"}
     try:
-        response = requests.get(url, params=params, headers=headers)
-        response.raise_for_status()
-        return response.json()
+        with metrics.measure("i2edge", "get"):
+            response = _requester(session).get(url, params=params, headers=headers)
+            response.raise_for_status()
+            return response.json()
     except requests.exceptions.HTTPError as e:
         i2edge_err_msg = get_error_message_from(response)
         err_msg = "Failed to get apps: {}. Detail: {}".format(i2edge_err_msg, e)
         log.error(err_msg)
-        raise I2EdgeError(err_msg)
+        raise I2EdgeError(err_msg) from e
+    except TRANSIENT_ERRORS as e:
+        raise _unreachable(url, e) from e
@@ -0,0 +1,115 @@
+# -*- coding: utf-8 -*-
+"""
+Local index of the app instances deployed on i2Edge.
+"""
+import copy
+import threading
+import time
+from typing import Callable, Dict, List, Tuple
+
+DEFAULT_REFRESH_INTERVAL = 30.0  # seconds
+
+
+class DeployedAppIndex:
+    """
+    Indexes the deployed app instances by (release name, zone), namespace and
+    instance name, so each lookup is a dictionary access instead of a scan of
+    the whole listing.
+
+    The listing is fetched again on the first lookup made 'refresh_interval'
+    seconds after the previous fetch, or after invalidate(). Concurrent lookups
+    of a stale index share a single fetch.
+
+    args:
+        fetch: Returns the listing of the deployed app instances.
+        refresh_interval: Seconds after which the listing is fetched again.
+        clock: Monotonic time source, in seconds.
+    """
+
+    def __init__(
+        self,
+        fetch: Callable[[], List[Dict]],
+        refresh_interval: float = DEFAULT_REFRESH_INTERVAL,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if refresh_interval < 0:
+            raise ValueError("refresh_interval must not be negative.")
+        self.refresh_interval = refresh_interval
+        self._fetch = fetch
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._expiry = None  # None: the index must be fetched
+        self._by_release: Dict[Tuple[str, str], Dict] = {}
+        self._by_namespace: Dict[str, Dict] = {}
+        self._by_name: Dict[str, Dict] = {}
+        self.refreshes = 0
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._by_name)
+
+    def invalidate(self) -> None:
+        """Fetches the listing again on the next lookup."""
+        with self._lock:
+            self._expiry = None
+
+    def _is_fresh(self) -> bool:
+        return self._expiry is not None and self._expiry > self._clock()
+
+    def _refresh(self) -> None:
+        if self._is_fresh():
+            return
+        with self._lock:
+            # Another thread refreshed the index while this one waited
+            if self._is_fresh():
+                return
+            instances = self._fetch() or []
+            by_release, by_namespace, by_name = {}, {}, {}
+            for instance in instances:
+                release = (instance.get("release_name"), instance.get("zone_id"))
+                by_release.setdefault(release, instance)
+                namespace = (instance.get("bodytosend") or {}).get("namespace")
+                if namespace is not None:
+                    by_namespace.setdefault(namespace, instance)
+                if instance.get("name") is not None:
+                    by_name.setdefault(instance["name"], instance)
+            self._by_release = by_release
+            self._by_namespace = by_namespace
+            self._by_name = by_name
+            self._expiry = self._clock() + self.refresh_interval
+            self.refreshes += 1
+
+    def _lookup(self, index: str, key) -> Dict | None:
+        self._refresh()
+        instance = getattr(self, index).get(key)
+        if instance is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        # Callers own the returned instance, keep the indexed one untouched
+        return copy.deepcopy(instance)
+
+    def by_release(self, release_name: str, zone_id: str) -> Dict | None:
+        """Returns the instance of the Helm release 'release_name' in a zone."""
+        return self._lookup("_by_release", (release_name, zone_id))
+
+    def by_namespace(self, namespace: str) -> Dict | None:
+        """Returns the instance deployed in the Kubernetes namespace 'namespace'."""
+        return self._lookup("_by_namespace", namespace)
+
+    def by_name(self, name: str) -> Dict | None:
+        """Returns the instance named 'name' by i2Edge."""
+        return self._lookup("_by_name", name)
+
+    def snapshot(self) -> Dict:
+        """
+        Returns the number of indexed instances, of listing fetches and the
+        hit/miss counters of the lookups.
+        """
+        return {
+            "size": len(self._by_name),
+            "refreshes": self.refreshes,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
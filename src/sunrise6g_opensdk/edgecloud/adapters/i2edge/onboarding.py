@@ -0,0 +1,183 @@
+# -*- coding: utf-8 -*-
+"""
+Concurrent onboarding of many applications in i2Edge, artefact then app.
+"""
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Sequence
+
+from sunrise6g_opensdk import logger
+from sunrise6g_opensdk.common.batch import BatchStats, run_batch
+
+from .common import I2EdgeError
+
+log = logger.get_logger(__name__)
+
+# Steps of the onboarding of an app
+ARTEFACT = "artefact"
+APP = "app"
+
+
+@dataclass
+class OnboardingProgress:
+    """Apps whose onboarding finished so far, passed to 'on_progress'."""
+
+    done: int
+    total: int
+    succeeded: int
+    failed: int
+    elapsed: float  # seconds
+    throughput: float  # apps onboarded or failed per second
+
+
+@dataclass
+class AppOnboarding:
+    """Outcome of the onboarding of one app."""
+
+    app_id: str | None
+    error: Exception | None = None
+    failed_step: str | None = None  # ARTEFACT or APP
+    rolled_back: bool = False
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+@dataclass
+class BatchOnboarding:
+    apps: List[AppOnboarding] = field(default_factory=list)
+    stats: BatchStats = field(default_factory=BatchStats)
+
+    @property
+    def onboarded(self) -> List[str]:
+        return [app.app_id for app in self.apps if app.ok]
+
+    @property
+    def errors(self) -> Dict[int, Exception]:
+        """Errors by index of the app manifest, as app IDs may be missing or repeated."""
+        return {i: app.error for i, app in enumerate(self.apps) if not app.ok}
+
+    def as_dict(self) -> Dict:
+        """
+        Returns the onboarded app IDs, the failed apps with the index of their
+        manifest, their app ID and error message, the apps whose artefact was
+        deleted again, and the throughput of the batch.
+        """
+        return {
+            "onboarded": self.onboarded,
+            "errors": [
+                {"index": i, "appId": self.apps[i].app_id, "error": str(error)}
+                for i, error in self.errors.items()
+            ],
+            "rolledBack": [app.app_id for app in self.apps if app.rolled_back],
+            "elapsed": self.stats.elapsed,
+            "throughput": self.stats.throughput,
+        }
+
+
+class _Progress:
+    def __init__(
+        self, total: int, on_progress: Callable[[OnboardingProgress], None] | None
+    ):
+        self.total = total
+        self.on_progress = on_progress
+        self.start = time.perf_counter()
+        self.succeeded = 0
+        self.failed = 0
+        self._lock = threading.Lock()
+
+    def finished(self, ok: bool) -> None:
+        with self._lock:
+            if ok:
+                self.succeeded += 1
+            else:
+                self.failed += 1
+            done = self.succeeded + self.failed
+            elapsed = time.perf_counter() - self.start
+            progress = OnboardingProgress(
+                done=done,
+                total=self.total,
+                succeeded=self.succeeded,
+                failed=self.failed,
+                elapsed=elapsed,
+                throughput=done / elapsed if elapsed > 0 else 0.0,
+            )
+        log.debug("Onboarded %d/%d apps", progress.done, progress.total)
+        if self.on_progress is not None:
+            try:
+                self.on_progress(progress)
+            except Exception as e:
+                log.warning("Onboarding progress callback failed: %s", e)
+
+
+def onboard_in_batch(
+    create_artefact: Callable[[Dict], Any],
+    onboard_app: Callable[[Dict], Any],
+    delete_artefact: Callable[[str], Any],
+    app_manifests: Sequence[Dict],
+    max_in_flight: int,
+    on_progress: Callable[[OnboardingProgress], None] | None = None,
+) -> BatchOnboarding:
+    """
+    Onboards every app on a bounded thread pool. The artefact of an app is
+    created before the app is onboarded, while the other apps go through
+    either step concurrently.
+
+    Errors are recorded per app instead of aborting the batch. The artefact
+    of an app whose onboarding fails is deleted again.
+
+    args:
+        create_artefact: Creates the artefact of the app manifest it is given.
+        onboard_app: Onboards the app manifest it is given.
+        delete_artefact: Deletes the artefact whose ID (the app ID) it is given.
+        app_manifests: Manifests of the apps to onboard.
+        max_in_flight: Maximum number of apps onboarded at the same time.
+        on_progress: Called with the progress of the batch each time the
+                     onboarding of an app finishes, from a worker thread.
+    """
+    apps = [AppOnboarding(app_id=manifest.get("appId")) for manifest in app_manifests]
+    invalid = {
+        i: I2EdgeError("Missing required field in app_manifest: 'appId'")
+        for i, app in enumerate(apps)
+        if app.app_id is None
+    }
+    progress = _Progress(len(apps), on_progress)
+    progress.failed = len(invalid)
+
+    def onboard(i: int) -> None:
+        app, manifest = apps[i], app_manifests[i]
+        try:
+            app.failed_step = ARTEFACT
+            create_artefact(manifest)
+            app.failed_step = APP
+            onboard_app(manifest)
+            app.failed_step = None
+        except Exception as e:
+            app.error = e
+            if app.failed_step == APP:
+                try:
+                    delete_artefact(app.app_id)
+                    app.rolled_back = True
+                except Exception as rollback_error:
+                    log.warning(
+                        "Rollback of the artefact of app '%s' failed: %s",
+                        app.app_id,
+                        rollback_error,
+                    )
+            raise
+        finally:
+            progress.finished(app.ok)
+
+    batch = run_batch(onboard, range(len(apps)), max_in_flight, failed=invalid)
+    for i, error in invalid.items():
+        apps[i].error = error
+    result = BatchOnboarding(apps=apps, stats=batch.stats)
+    log.info(
+        "Batch onboarding finished [ok=%d, failed=%d, apps/s=%.1f]",
+        len(result.onboarded),
+        len(result.errors),
+        batch.stats.throughput,
+    )
+    return result
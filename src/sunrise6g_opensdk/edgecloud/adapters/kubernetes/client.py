@@ -4,6 +4,7 @@ from typing import Dict, List, Optional
 
 from kubernetes.client import V1Deployment
 
+from sunrise6g_opensdk.edgecloud.adapters.errors import EdgeCloudPlatformError
 from sunrise6g_opensdk.edgecloud.adapters.kubernetes.lib.core.piedge_encoder import (
     deploy_service_function,
 )
@@ -25,6 +26,11 @@ from sunrise6g_opensdk.edgecloud.adapters.kubernetes.lib.utils.kubernetes_connec
 from sunrise6g_opensdk.edgecloud.core.edgecloud_interface import (
     EdgeCloudManagementInterface,
 )
+from sunrise6g_opensdk.edgecloud.core.multi_zone import (
+    DEFAULT_MAX_IN_FLIGHT,
+    deploy_to_zones,
+    zone_id_of,
+)
 
 
 class EdgeApplicationManager(EdgeCloudManagementInterface):
@@ -143,6 +149,55 @@ class EdgeApplicationManager(EdgeCloudManagementInterface):
             response = {"Error": result}
         return response
 
+    def deploy_app_to_zones(
+        self,
+        app_id: str,
+        app_zones: List[Dict],
+        max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
+        quorum: Optional[int] = None,
+        rollback: bool = False,
+        name: Optional[str] = None,
+    ) -> Dict:
+        """
+        Deploys the app once per zone of 'app_zones', concurrently, each
+        instance named after the zone so that they do not collide in the
+        namespace.
+
+        args:
+            max_in_flight: Maximum number of zones deployed at the same time.
+            quorum: Minimum number of zones that must succeed, all by default.
+            rollback: Whether to undeploy the successful zones when the quorum
+                      is not met.
+            name: Prefix of the instance names, the app ID by default.
+        returns:
+            The outcome by zone, as returned by MultiZoneDeployment.as_dict,
+            whatever the number of zones.
+        """
+        deployment = deploy_to_zones(
+            lambda zone_id: self.deploy_app(
+                {
+                    "appId": app_id,
+                    "name": f"{name or app_id}-{zone_id}",
+                    "edgeCloudZoneId": zone_id,
+                }
+            ),
+            [zone_id_of(app_zone) for app_zone in app_zones],
+            instance_id=self._instance_id_of,
+            max_in_flight=max_in_flight,
+            quorum=quorum,
+            undeploy=self.undeploy_app if rollback else None,
+        )
+        return deployment.as_dict()
+
+    @staticmethod
+    def _instance_id_of(response) -> str:
+        # deploy_app returns the error instead of raising it
+        if isinstance(response, tuple):
+            raise EdgeCloudPlatformError(response[0])
+        if "Error" in response:
+            raise EdgeCloudPlatformError(str(response["Error"]))
+        return response["appInstanceId"]
+
     def get_all_deployed_apps(
         self,
         app_id: Optional[str] = None,
@@ -7,6 +7,7 @@ import urllib3
 from kubernetes import client
 from kubernetes.client.rest import ApiException
 
+from sunrise6g_opensdk.common import metrics as sdk_metrics
 from sunrise6g_opensdk.edgecloud.adapters.kubernetes.lib.utils import (
     auxiliary_functions,
 )
@@ -69,6 +70,7 @@ class KubernetesConnector:
                     % e
                 )
 
+    @sdk_metrics.instrument("kubernetes")
     def get_node_details(self):
         try:
             url = self.host + "/api/v1/nodes"
@@ -80,6 +82,7 @@ class KubernetesConnector:
             # logging.error(traceback.format_exc())
             return "Exception when calling Kubernetes API:" + e.args
 
+    @sdk_metrics.instrument("kubernetes")
     def get_PoP_statistics(self, nodeName):
 
         # x1 = v1.list_node().to_dict()
@@ -199,6 +202,7 @@ class KubernetesConnector:
 
         return pop_output
 
+    @sdk_metrics.instrument("kubernetes")
     def get_PoPs(self):
 
         try:
@@ -232,6 +236,7 @@ class KubernetesConnector:
 
     #
 
+    @sdk_metrics.instrument("kubernetes")
     def delete_service_function(self, connector_db: ConnectorDB, service_function_name):
         self.api_instance_appsv1.delete_namespaced_deployment(
             name=service_function_name, namespace=self.namespace
@@ -270,6 +275,7 @@ class KubernetesConnector:
         doc["instance_name"] = service_function_name
         connector_db.delete_document_deployed_service_functions(document=doc)
 
+    @sdk_metrics.instrument("kubernetes")
     def deploy_service_function(self, descriptor_service_function):
         # deploys a Deployment yaml file, a service, a pvc and a hpa
 
@@ -349,6 +355,7 @@ class KubernetesConnector:
             )
         # Exception("An exception occurred : ", e)
 
+    @sdk_metrics.instrument("kubernetes")
     def create_deployment(self, descriptor_service_function):
         metadata = client.V1ObjectMeta(name=descriptor_service_function["name"])
         dict_label = {self.namespace: descriptor_service_function["name"]}
@@ -515,6 +522,7 @@ class KubernetesConnector:
                 volumes=volumes if volumes else None,
             )
 
+    @sdk_metrics.instrument("kubernetes")
     def create_service(self, descriptor_service_function):
         dict_label = {}
         dict_label[self.namespace] = descriptor_service_function["name"]
@@ -568,6 +576,7 @@ class KubernetesConnector:
 
         return body
 
+    @sdk_metrics.instrument("kubernetes")
     def create_pvc(self, name, volumes):
         dict_label = {}
         name_vol = name + str("-") + volumes["name"]
@@ -654,6 +663,7 @@ class KubernetesConnector:
 
         return body
 
+    @sdk_metrics.instrument("kubernetes")
     def check_for_update_hpas(self, deployed_hpas):
 
         for hpa in deployed_hpas:
@@ -723,6 +733,7 @@ class KubernetesConnector:
 
         return body
 
+    @sdk_metrics.instrument("kubernetes")
     def get_deployed_dataspace_connector(self, instance_name):
         api_response = self.api_instance_appsv1.list_namespaced_deployment(
             self.namespace
@@ -781,6 +792,7 @@ class KubernetesConnector:
                 return app_
         return app_
 
+    @sdk_metrics.instrument("kubernetes")
     def get_deployed_service_functions(self, connector_db: ConnectorDB):
         self.get_deployed_hpas(connector_db)
         api_response = self.api_instance_appsv1.list_namespaced_deployment(
@@ -904,6 +916,7 @@ class KubernetesConnector:
                 app_["ports"] = svc_ports
                 break
 
+    @sdk_metrics.instrument("kubernetes")
     def get_deployed_hpas(self, connector_db: ConnectorDB):
         # APPV1 Implementation!
         api_response = (
@@ -971,6 +984,7 @@ class KubernetesConnector:
 
         return hpas
 
+    @sdk_metrics.instrument("kubernetes")
     def is_job_completed(self, job_name):
         job = self.api_instance_batchv1.read_namespaced_job(
             name=job_name, namespace=self.namespace
@@ -980,6 +994,7 @@ class KubernetesConnector:
         return False
 
     # Create storageClass resource for a node - useless for now
+    @sdk_metrics.instrument("kubernetes")
     def create_immediate_storageclass(self, node=None):
         api_version = "storage.k8s.io/v1"
         kind = "StorageClass"
@@ -1012,6 +1027,7 @@ class KubernetesConnector:
         except ApiException as e:
             print("Exception when calling StorageV1Api->create_storage_class: %s\n" % e)
 
+    @sdk_metrics.instrument("kubernetes")
     def immediate_storage_class_exists(self):
         try:
             storage_classes = (
@@ -9,6 +9,12 @@
 from abc import ABC, abstractmethod
 from typing import Dict, List, Optional
 
+from sunrise6g_opensdk.edgecloud.core.multi_zone import (
+    DEFAULT_MAX_IN_FLIGHT,
+    deploy_to_zones,
+    zone_id_of,
+)
+
 
 class EdgeCloudManagementInterface(ABC):
     """
@@ -66,6 +72,40 @@ class EdgeCloudManagementInterface(ABC):
         """
         pass
 
+    def deploy_app_to_zones(
+        self,
+        app_id: str,
+        app_zones: List[Dict],
+        max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
+        quorum: Optional[int] = None,
+        rollback: bool = False,
+    ) -> Dict:
+        """
+        Requests the instantiation of an application instance in every zone
+        of app_zones, concurrently, calling deploy_app once per zone.
+
+        :param app_id: Unique identifier of the application.
+        :param app_zones: List of Edge Cloud Zones where the app should be
+        instantiated.
+        :param max_in_flight: Maximum number of zones deployed at the same time.
+        :param quorum: Minimum number of zones that must succeed, all by default.
+        :param rollback: Whether to undeploy the successful zones when the
+        quorum is not met.
+        :return: Dictionary with the instance IDs and the errors by zone ID,
+        the zones rolled back and whether the quorum was met, as returned by
+        MultiZoneDeployment.as_dict, whatever the number of zones.
+        """
+        zones = {zone_id_of(app_zone): app_zone for app_zone in app_zones}
+        deployment = deploy_to_zones(
+            lambda zone_id: self.deploy_app(app_id, [zones[zone_id]]),
+            [zone_id_of(app_zone) for app_zone in app_zones],
+            instance_id=lambda response: response["appInstanceId"],
+            max_in_flight=max_in_flight,
+            quorum=quorum,
+            undeploy=self.undeploy_app if rollback else None,
+        )
+        return deployment.as_dict()
+
     @abstractmethod
     def get_all_deployed_apps(
         self,
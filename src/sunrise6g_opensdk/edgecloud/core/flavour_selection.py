@@ -0,0 +1,195 @@
+# -*- coding: utf-8 -*-
+"""
+Selection of the flavour that best fits the resources required by an app,
+among the flavours supported by the candidate edge cloud zones.
+"""
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Sequence, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    np = None
+
+from sunrise6g_opensdk import logger
+
+log = logger.get_logger(__name__)
+
+# Policies
+BIN_PACKING = "bin_packing"  # Flavour whose capacity the app uses the most
+LEAST_WASTE = "least_waste"  # Flavour leaving the least capacity unused
+
+POLICIES = (BIN_PACKING, LEAST_WASTE)
+
+# Resources compared, in this order: CPUs, memory (MB) and storage (GB)
+_RESOURCES = ("numCPU", "memorySize", "storageSize")
+
+_MEMORY_UNITS = {"MB": 1, "GB": 1024, "MI": 1, "GI": 1024}
+
+
+def _require_numpy():
+    if np is None:
+        raise ImportError(
+            "Flavour selection requires 'numpy'. Install it with: "
+            "pip install sunrise6g-opensdk[placement]"
+        )
+
+
+def _megabytes(memory) -> float:
+    """Returns a memory size such as 2048, '1024MB' or '2GB' in megabytes."""
+    if isinstance(memory, str):
+        value = memory.strip()
+        unit = value[-2:].upper()
+        if unit in _MEMORY_UNITS:
+            return float(value[:-2]) * _MEMORY_UNITS[unit]
+        return float(value)
+    return float(memory or 0)
+
+
+def required_resources_of(required_resources: Dict) -> Tuple[float, float, float]:
+    """
+    Returns the CPUs, memory (MB) and storage (GB) required by the cpuPool of
+    the 'requiredResources' of an app manifest.
+    """
+    application_resources = required_resources.get("applicationResources") or {}
+    cpu_pool = application_resources.get("cpuPool") or {}
+    return (
+        float(cpu_pool.get("numCPU") or 0),
+        _megabytes(cpu_pool.get("memory")),
+        float(cpu_pool.get("storage") or 0),
+    )
+
+
+@dataclass
+class FlavourChoice:
+    """Flavour of a zone able to host the app, with its policy score."""
+
+    zone_id: str
+    flavour: Dict
+    score: float
+
+    @property
+    def flavour_id(self) -> str | None:
+        return self.flavour.get("flavourId")
+
+
+class FlavourCatalog:
+    """
+    Capacities of the flavours supported by a set of zones, kept as a single
+    array so that every flavour of every zone is scored in one vectorized pass.
+
+    args:
+        zones: Zone details, as returned by get_edge_cloud_zones_details, each
+               with its 'zoneId' and 'flavoursSupported'.
+    """
+
+    def __init__(self, zones: Iterable[Dict]):
+        _require_numpy()
+        self.zone_ids: List[str] = []
+        self.flavours: List[Dict] = []
+        zone_of_flavour = []
+        capacities = []
+        for zone in zones:
+            self.zone_ids.append(zone.get("zoneId"))
+            for flavour in zone.get("flavoursSupported") or []:
+                try:
+                    capacity = (
+                        float(flavour.get("numCPU") or 0),
+                        _megabytes(flavour.get("memorySize")),
+                        float(flavour.get("storageSize") or 0),
+                    )
+                except ValueError:
+                    log.warning(
+                        "Skipping flavour '%s' of zone '%s' with unknown capacity",
+                        flavour.get("flavourId"),
+                        zone.get("zoneId"),
+                    )
+                    continue
+                self.flavours.append(flavour)
+                zone_of_flavour.append(len(self.zone_ids) - 1)
+                capacities.append(capacity)
+        self._zone_of_flavour = np.array(zone_of_flavour, dtype=np.intp)
+        self._capacities = np.array(capacities, dtype=np.float64).reshape(
+            -1, len(_RESOURCES)
+        )
+        # Largest capacity of each resource, normalising the waste of each
+        largest = self._capacities.max(axis=0, initial=0)
+        self._scale = np.where(largest > 0, largest, 1.0)
+
+    @classmethod
+    def from_adapter(cls, adapter, zone_ids: Sequence[str]) -> "FlavourCatalog":
+        """
+        Builds the catalog from the details of every zone of 'zone_ids', as
+        returned by an edge cloud adapter or a ZoneCatalog.
+        """
+        return cls(
+            adapter.get_edge_cloud_zones_details(zone_id) for zone_id in zone_ids
+        )
+
+    def __len__(self) -> int:
+        return len(self.flavours)
+
+    def select(
+        self,
+        required_resources: Dict,
+        policy: str = BIN_PACKING,
+        zone_ids: Sequence[str] | None = None,
+        limit: int | None = 1,
+    ) -> List[FlavourChoice]:
+        """
+        Returns the flavours able to host the app, best first.
+
+        args:
+            required_resources: 'requiredResources' of the app manifest.
+            policy: BIN_PACKING ranks first the flavour whose capacity the app
+                    uses the most, on average over the requested resources.
+                    LEAST_WASTE ranks first the flavour leaving the least
+                    capacity unused, every resource counted.
+            zone_ids: Zones the flavours are selected from, all by default.
+            limit: Maximum number of flavours returned, None for all of them.
+        returns:
+            The fitting flavours, best first. Ties keep the catalog order. The
+            score is the average usage of the flavour with BIN_PACKING, and
+            its unused capacity relative to the largest flavours with
+            LEAST_WASTE.
+        """
+        if policy not in POLICIES:
+            raise ValueError(f"Unknown policy '{policy}', expected one of {POLICIES}.")
+        required = np.array(required_resources_of(required_resources))
+        capacities = self._capacities
+
+        fits = np.all(capacities >= required, axis=1)
+        if zone_ids is not None:
+            zone_ids = set(zone_ids)
+            candidates = [
+                i for i, zone_id in enumerate(self.zone_ids) if zone_id in zone_ids
+            ]
+            fits &= np.isin(self._zone_of_flavour, candidates)
+
+        if policy == BIN_PACKING:
+            requested = required > 0
+            usage = np.divide(
+                required[requested],
+                capacities[:, requested],
+                out=np.zeros((len(capacities), requested.sum())),
+                where=capacities[:, requested] > 0,
+            )
+            scores = usage.mean(axis=1) if requested.any() else np.zeros(len(usage))
+            # The highest usage ranks first
+            order = -scores
+        else:
+            scores = ((capacities - required) / self._scale).sum(axis=1)
+            order = scores
+
+        (indices,) = np.nonzero(fits)
+        ranked = indices[np.argsort(order[indices], kind="stable")]
+        if limit is not None:
+            ranked = ranked[:limit]
+        return [
+            FlavourChoice(
+                zone_id=self.zone_ids[self._zone_of_flavour[i]],
+                flavour=self.flavours[i],
+                score=float(scores[i]),
+            )
+            for i in ranked
+        ]
@@ -0,0 +1,135 @@
+# -*- coding: utf-8 -*-
+"""
+Concurrent deployment of an application in several edge cloud zones.
+"""
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Sequence
+
+from sunrise6g_opensdk import logger
+from sunrise6g_opensdk.common.batch import BatchStats, run_batch
+
+log = logger.get_logger(__name__)
+
+DEFAULT_MAX_IN_FLIGHT = 8
+
+
+def zone_id_of(app_zone: Dict) -> str | None:
+    """Returns the zone ID of an entry of the 'app_zones' of deploy_app."""
+    return app_zone.get("EdgeCloudZone", {}).get("edgeCloudZoneId")
+
+
+@dataclass
+class ZoneDeployment:
+    """Outcome of the deployment of an application in one zone."""
+
+    zone_id: str
+    instance_id: Any = None
+    result: Any = None
+    error: Exception | None = None
+    rolled_back: bool = False
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+@dataclass
+class MultiZoneDeployment:
+    zones: List[ZoneDeployment] = field(default_factory=list)
+    quorum: int = 0
+    stats: BatchStats = field(default_factory=BatchStats)
+
+    @property
+    def quorum_met(self) -> bool:
+        return sum(1 for zone in self.zones if zone.ok) >= self.quorum
+
+    @property
+    def instance_ids(self) -> Dict[str, Any]:
+        """Instances still deployed, by zone ID."""
+        return {
+            zone.zone_id: zone.instance_id
+            for zone in self.zones
+            if zone.ok and not zone.rolled_back
+        }
+
+    @property
+    def errors(self) -> Dict[str, Exception]:
+        return {zone.zone_id: zone.error for zone in self.zones if not zone.ok}
+
+    def as_dict(self) -> Dict:
+        """
+        Returns the instance IDs and the error messages by zone ID, the zones
+        whose instance was rolled back and whether the quorum was met.
+        """
+        return {
+            "appInstanceIds": self.instance_ids,
+            "errors": {zone_id: str(error) for zone_id, error in self.errors.items()},
+            "rolledBack": [zone.zone_id for zone in self.zones if zone.rolled_back],
+            "quorumMet": self.quorum_met,
+        }
+
+
+def deploy_to_zones(
+    deploy: Callable[[str], Any],
+    zone_ids: Sequence[str],
+    instance_id: Callable[[Any], Any],
+    max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
+    quorum: int | None = None,
+    undeploy: Callable[[Any], None] | None = None,
+) -> MultiZoneDeployment:
+    """
+    Deploys an application in every zone concurrently, on a bounded thread pool.
+
+    Errors are recorded per zone instead of aborting the other deployments.
+    When fewer than 'quorum' zones succeed and 'undeploy' is given, the
+    instances deployed in the successful zones are removed again.
+
+    args:
+        deploy: Deploys the application in the zone whose ID it is given and
+                returns the platform response.
+        zone_ids: IDs of the zones to deploy the application in.
+        instance_id: Returns the instance ID of a platform response.
+        max_in_flight: Maximum number of zones deployed at the same time.
+        quorum: Minimum number of zones that must succeed, all by default.
+        undeploy: Removes the instance whose ID it is given, for rollbacks.
+                  None keeps the successful zones whatever the outcome.
+    """
+    if not zone_ids:
+        raise ValueError("At least one zone is required.")
+    quorum = len(zone_ids) if quorum is None else quorum
+    if not 0 < quorum <= len(zone_ids):
+        raise ValueError("quorum must be between 1 and the number of zones.")
+
+    batch = run_batch(deploy, zone_ids, max_in_flight)
+    deployment = MultiZoneDeployment(quorum=quorum, stats=batch.stats)
+    for zone_id, item in zip(zone_ids, batch.items):
+        zone = ZoneDeployment(zone_id, result=item.result, error=item.error)
+        if zone.ok:
+            try:
+                zone.instance_id = instance_id(item.result)
+            except Exception as e:
+                zone.error = e
+        deployment.zones.append(zone)
+    log.info(
+        "Multi-zone deployment finished [ok=%d, failed=%d, quorum=%d]",
+        len(deployment.instance_ids),
+        len(deployment.errors),
+        quorum,
+    )
+
+    if deployment.quorum_met or undeploy is None:
+        return deployment
+    deployed = [zone for zone in deployment.zones if zone.ok]
+    rollback = run_batch(
+        undeploy, [zone.instance_id for zone in deployed], max_in_flight
+    )
+    for zone, item in zip(deployed, rollback.items):
+        if item.ok:
+            zone.rolled_back = True
+        else:
+            log.warning(
+                "Rollback of the deployment in zone '%s' failed: %s",
+                zone.zone_id,
+                item.error,
+            )
+    return deployment
@@ -0,0 +1,98 @@
+# -*- coding: utf-8 -*-
+"""
+Catalog of the edge cloud zones of an adapter, answered from memory.
+"""
+import copy
+from typing import Dict, List, Optional
+
+from sunrise6g_opensdk.common.cache import RefreshAheadCache
+from sunrise6g_opensdk.edgecloud.core.edgecloud_interface import (
+    EdgeCloudManagementInterface,
+)
+
+DEFAULT_ZONES_TTL = 300.0  # seconds
+
+
+class ZoneCatalog:
+    """
+    Wraps an edge cloud adapter, answering get_edge_cloud_zones and
+    get_edge_cloud_zones_details from memory. Every other call goes to the
+    adapter.
+
+    Zones are reloaded in the background shortly before they expire, and
+    expired zones are still returned while being reloaded for 'max_stale'
+    seconds, so reads rarely wait for the platform.
+
+    args:
+        adapter: Edge cloud adapter whose zones are cached.
+        ttl: Seconds during which the zones are fresh.
+        refresh_ahead: Seconds before expiry from which reads reload the
+                       zones in the background. 20% of 'ttl' by default.
+        max_stale: Seconds after expiry during which the zones are still
+                   returned while being reloaded, 'ttl' by default.
+        kwargs: Other arguments of RefreshAheadCache.
+    """
+
+    def __init__(
+        self,
+        adapter: EdgeCloudManagementInterface,
+        ttl: float = DEFAULT_ZONES_TTL,
+        refresh_ahead: float | None = None,
+        max_stale: float | None = None,
+        **kwargs,
+    ):
+        self.adapter = adapter
+        self._zones = RefreshAheadCache(
+            self._load,
+            ttl=ttl,
+            refresh_ahead=refresh_ahead,
+            max_stale=ttl if max_stale is None else max_stale,
+            **kwargs,
+        )
+
+    def __getattr__(self, name):
+        if name == "adapter":
+            raise AttributeError(name)
+        return getattr(self.adapter, name)
+
+    def _load(self, key: tuple):
+        method, *args = key
+        return getattr(self.adapter, method)(*args)
+
+    def get_edge_cloud_zones(
+        self, region: Optional[str] = None, status: Optional[str] = None
+    ) -> List[Dict]:
+        # Callers own the returned zones, keep the cached ones untouched
+        return copy.deepcopy(self._zones.get(("get_edge_cloud_zones", region, status)))
+
+    def get_edge_cloud_zones_details(
+        self, zone_id: str, flavour_id: Optional[str] = None
+    ) -> Dict:
+        return copy.deepcopy(
+            self._zones.get(("get_edge_cloud_zones_details", zone_id, flavour_id))
+        )
+
+    def zones_age(
+        self, region: Optional[str] = None, status: Optional[str] = None
+    ) -> float | None:
+        """
+        Returns the seconds elapsed since the zones were loaded, or None if
+        they are not cached.
+        """
+        return self._zones.age(("get_edge_cloud_zones", region, status))
+
+    def zone_details_age(
+        self, zone_id: str, flavour_id: Optional[str] = None
+    ) -> float | None:
+        """
+        Returns the seconds elapsed since the details of a zone were loaded,
+        or None if they are not cached.
+        """
+        return self._zones.age(("get_edge_cloud_zones_details", zone_id, flavour_id))
+
+    def invalidate(self) -> None:
+        """Loads the zones from the adapter again on the next read."""
+        self._zones.invalidate()
+
+    def stats(self) -> Dict:
+        return self._zones.snapshot()
@@ -6,9 +6,18 @@
 # Contributors:
 #   - Sergio Giménez (sergio.gimenez@i2cat.net)
 ##
+import atexit
 import logging
+import random
 import sys
+import threading
+import time
+import uuid
+from datetime import date, datetime, timedelta
+from enum import Enum
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
+from queue import SimpleQueue
 
 from colorlog import ColoredFormatter
 
@@ -21,25 +30,199 @@ COLORED_FORMATERR = (
 FILE_FORMATTER = "[%(asctime)s] {%(name)s: %(lineno)d} %(levelname)s - %(message)s"
 
 
-def setup_logger(logger_name=APP_LOGGER_NAME, is_debug=True, file_name=None):
-    logger = logging.getLogger(logger_name)
-    logger.setLevel(logging.DEBUG if is_debug else logging.INFO)
+# Log call arguments that cannot change before the listener thread formats them
+_IMMUTABLE_ARGS = (str, bytes, int, float, complex, type(None), uuid.UUID)
+_IMMUTABLE_ARGS += (date, datetime, timedelta, Enum)
 
-    colored_formatter = ColoredFormatter(COLORED_FORMATERR)
-    sh = logging.StreamHandler(sys.stdout)
-    sh.setFormatter(colored_formatter)
-    logger.handlers.clear()
-    logger.addHandler(sh)
+# Configuration and queue listener of every logger set up by setup_logger
+_configured = {}
+_listeners = {}
+_setup_lock = threading.Lock()
 
-    if file_name:
-        log_path = Path(file_name)
-        log_path.parent.mkdir(parents=True, exist_ok=True)
-        fh = logging.FileHandler(file_name)
-        fh.setFormatter(logging.Formatter(FILE_FORMATTER))
-        logger.addHandler(fh)
+
+class DeferredQueueHandler(QueueHandler):
+    """
+    QueueHandler leaving the formatting of the records to the listener thread.
+
+    Records with arguments that may be mutated after the log call (lists,
+    dictionaries, models...) are formatted on the calling thread instead, as
+    QueueHandler does for every record.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        args = record.args
+        if args:
+            values = args.values() if isinstance(args, dict) else args
+            if not all(isinstance(value, _IMMUTABLE_ARGS) for value in values):
+                record.msg = record.getMessage()
+                record.args = None
+        return record
+
+
+class _OnceFilter(logging.Filter):
+    # A record goes through the filter of each handler: decide only once
+    def filter(self, record: logging.LogRecord) -> bool:
+        decision = record.__dict__.get(self._attribute)
+        if decision is None:
+            decision = self.decide(record)
+            record.__dict__[self._attribute] = decision
+        return decision
+
+    @property
+    def _attribute(self) -> str:
+        return f"_opensdk_filter_{id(self)}"
+
+    def decide(self, record: logging.LogRecord) -> bool:
+        raise NotImplementedError
+
+
+class RateLimitFilter(_OnceFilter):
+    """
+    Token bucket per logger: each logger emits up to 'burst' records at once
+    and 'rate' records per second on average. Records at or above 'level'
+    always pass.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        burst: int | None = None,
+        level: int = logging.WARNING,
+        clock=time.monotonic,
+    ):
+        super().__init__()
+        if rate <= 0:
+            raise ValueError("rate must be positive.")
+        self.rate = rate
+        self.burst = burst if burst is not None else max(int(rate), 1)
+        self.level = level
+        self.dropped = 0
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._buckets = {}  # logger name -> (tokens, last refill)
+
+    def decide(self, record: logging.LogRecord) -> bool:
+        if record.levelno >= self.level:
+            return True
+        now = self._clock()
+        with self._lock:
+            tokens, last = self._buckets.get(record.name, (self.burst, now))
+            tokens = min(self.burst, tokens + (now - last) * self.rate)
+            allowed = tokens >= 1
+            self._buckets[record.name] = (tokens - 1 if allowed else tokens, now)
+            if not allowed:
+                self.dropped += 1
+            return allowed
+
+
+class SamplingFilter(_OnceFilter):
+    """
+    Keeps a random 'rate' fraction of the records below 'level'.
+    """
+
+    def __init__(self, rate: float, level: int = logging.WARNING, seed=None):
+        super().__init__()
+        if not 0 < rate <= 1:
+            raise ValueError("rate must be in (0, 1].")
+        self.rate = rate
+        self.level = level
+        self.dropped = 0
+        self._random = random.Random(seed)
+
+    def decide(self, record: logging.LogRecord) -> bool:
+        if record.levelno >= self.level or self._random.random() < self.rate:
+            return True
+        self.dropped += 1
+        return False
+
+
+def setup_logger(
+    logger_name=APP_LOGGER_NAME,
+    is_debug=True,
+    file_name=None,
+    queued=False,
+    rate_limit=None,
+    burst=None,
+    sample_rate=None,
+):
+    """
+    Sets up the console (and file) handlers of a logger. Setting up a logger
+    again with the same arguments leaves it untouched.
+
+    args:
+        queued: Whether to format and write the records on a background
+                thread, the calling thread only enqueues them.
+        rate_limit: Records per second each logger may emit below WARNING.
+        burst: Records a logger may emit at once, 'rate_limit' by default.
+        sample_rate: Fraction of the records below WARNING that are kept.
+    """
+    config = (is_debug, file_name, queued, rate_limit, burst, sample_rate)
+    with _setup_lock:
+        logger = logging.getLogger(logger_name)
+        if _configured.get(logger_name) == config and logger.handlers:
+            return logger
+        listener = _listeners.pop(logger_name, None)
+        if listener is not None:
+            listener.stop()
+
+        logger.setLevel(logging.DEBUG if is_debug else logging.INFO)
+
+        colored_formatter = ColoredFormatter(COLORED_FORMATERR)
+        sh = logging.StreamHandler(sys.stdout)
+        sh.setFormatter(colored_formatter)
+        handlers = [sh]
+
+        if file_name:
+            log_path = Path(file_name)
+            log_path.parent.mkdir(parents=True, exist_ok=True)
+            fh = logging.FileHandler(file_name)
+            fh.setFormatter(logging.Formatter(FILE_FORMATTER))
+            handlers.append(fh)
+
+        filters = []
+        if sample_rate is not None:
+            filters.append(SamplingFilter(sample_rate))
+        if rate_limit is not None:
+            filters.append(RateLimitFilter(rate_limit, burst))
+
+        for handler in logger.handlers:
+            handler.close()
+        logger.handlers.clear()
+        if queued:
+            queue = SimpleQueue()
+            front_handlers = [DeferredQueueHandler(queue)]
+            listener = QueueListener(queue, *handlers, respect_handler_level=True)
+            listener.start()
+            _listeners[logger_name] = listener
+        else:
+            front_handlers = handlers
+        for handler in front_handlers:
+            for log_filter in filters:
+                handler.addFilter(log_filter)
+            logger.addHandler(handler)
+        _configured[logger_name] = config
 
     return logger
 
 
+def flush_loggers():
+    """
+    Waits until the records already enqueued by the queued loggers are written.
+    """
+    with _setup_lock:
+        for listener in _listeners.values():
+            listener.stop()
+            listener.start()
+
+
+@atexit.register
+def _stop_listeners():
+    with _setup_lock:
+        for listener in _listeners.values():
+            listener.stop()
+        _listeners.clear()
+        _configured.clear()
+
+
 def get_logger(module_name):
     return logging.getLogger(APP_LOGGER_NAME).getChild(module_name)
@@ -29,17 +29,19 @@ class NetworkManager(BaseNetworkClient):
 
     capabilities = {"qod", "traffic_influence"}
 
-    def __init__(self, base_url: str, scs_as_id: str = None):
+    def __init__(self, base_url: str, scs_as_id: str = None, **kwargs):
         try:
-            super().__init__()
+            super().__init__(**kwargs)
             self.base_url = base_url
             self.scs_as_id = scs_as_id
             log.info(
-                f"Initialized OaiNefClient with base_url: {self.base_url} and scs_as_id: {self.scs_as_id}"
+                "Initialized OaiNefClient with base_url: %s and scs_as_id: %s",
+                self.base_url,
+                self.scs_as_id,
             )
 
         except Exception as e:
-            log.error(f"Failed to initialize OaiNefClient: {e}")
+            log.error("Failed to initialize OaiNefClient: %s", e)
             raise e
 
     def core_specific_qod_validation(self, session_info: CreateSession):
@@ -64,6 +66,9 @@ class NetworkManager(BaseNetworkClient):
             raise OaiValidationError("OAI requires App IPv4 Address to activate QoS")
         return
 
+    def core_specific_qod_template(self, qos_profile: str) -> dict:
+        return {"snssai": Snssai(sst=1, sd="FFFFFF"), "dnn": "oai"}
+
     def add_core_specific_qod_parameters(
         self,
         session_info: CreateSession,
@@ -75,8 +80,6 @@ class NetworkManager(BaseNetworkClient):
         # build flow descriptor in oai format using device ip and server ip
         flow_descriptor = f"permit out ip from {device_ip}/32 to {server_ip}/32"
         _add_qod_flow_descriptor(subscription, flow_descriptor)
-        _add_qod_snssai(subscription, 1, "FFFFFF")
-        subscription.dnn = "oai"
 
     def add_core_specific_ti_parameters(
         self,
@@ -129,9 +132,5 @@ def _add_qod_flow_descriptor(
     )
 
 
-def _add_qod_snssai(qos_sub: AsSessionWithQoSSubscription, sst: int, sd: str = None):
-    qos_sub.snssai = Snssai(sst=sst, sd=sd)
-
-
 class OaiValidationError(Exception):
     pass
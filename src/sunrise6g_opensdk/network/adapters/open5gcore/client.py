@@ -34,12 +34,13 @@ class NetworkManager(BaseNetworkClient):
 
     capabilities = {"qod"}
 
-    def __init__(self, base_url: str, scs_as_id: str):
+    def __init__(self, base_url: str, scs_as_id: str, **kwargs):
         if not base_url:
             raise ValueError("base_url is required and cannot be empty.")
         if not scs_as_id:
             raise ValueError("scs_as_id is required and cannot be empty.")
 
+        super().__init__(**kwargs)
         self.base_url = base_url
         self.scs_as_id = scs_as_id
 
@@ -0,0 +1,18 @@
+# -*- coding: utf-8 -*-
+"""
+Asyncio variant of the Open5GS adapter, kept apart from client.py so that the
+synchronous adapter does not require httpx.
+"""
+from sunrise6g_opensdk.network.core.async_base_network_client import (
+    AsyncBaseNetworkClient,
+)
+
+from .client import NetworkManager
+
+
+class AsyncNetworkManager(AsyncBaseNetworkClient, NetworkManager):
+    """
+    Asyncio variant of the Open5GS NetworkManager, exposing awaitable CAMARA operations.
+    """
+
+    pass
@@ -21,6 +21,8 @@ log = logger.get_logger(__name__)
 
 flow_id_mapping = {"qos-e": 3, "qos-s": 4, "qos-m": 5, "qos-l": 6}
 
+DEFAULT_NOTIFICATION_DESTINATION = "http://127.0.0.1:8001"
+
 
 class NetworkManager(BaseNetworkClient):
     """
@@ -30,19 +32,32 @@ class NetworkManager(BaseNetworkClient):
 
     capabilities = {"qod", "location_retrieval"}
 
-    def __init__(self, base_url: str, scs_as_id):
+    def __init__(
+        self,
+        base_url: str,
+        scs_as_id,
+        notification_destination: str = DEFAULT_NOTIFICATION_DESTINATION,
+        **kwargs,
+    ):
         """
         Initializes the Open5GS Client.
+
+        args:
+            notification_destination: URL the NEF sends location notifications
+                                      to, e.g. NotificationSink.url("monitoring-event").
         """
         try:
+            super().__init__(**kwargs)
             self.base_url = base_url
             self.scs_as_id = scs_as_id
+            self.notification_destination = notification_destination
             log.info(
-                f"Initialized Open5GSClient with base_url: {self.base_url} "
-                f"and scs_as_id: {self.scs_as_id}"
+                "Initialized Open5GSClient with base_url: %s and scs_as_id: %s",
+                self.base_url,
+                self.scs_as_id,
             )
         except Exception as e:
-            log.error(f"Failed to initialize Open5GSClient: {e}")
+            log.error("Failed to initialize Open5GSClient: %s", e)
             raise e
 
     def core_specific_qod_validation(self, session_info: schemas.CreateSession):
@@ -51,12 +66,14 @@ class NetworkManager(BaseNetworkClient):
                 f"Open5Gs only supports these qos-profiles: {', '.join(flow_id_mapping.keys())}"
             )
 
+    def core_specific_qod_template(self, qos_profile: str) -> dict:
+        return {"supportedFeatures": schemas.SupportedFeatures("003C")}
+
     def add_core_specific_qod_parameters(
         self,
         session_info: schemas.CreateSession,
         subscription: schemas.AsSessionWithQoSSubscription,
     ) -> None:
-        subscription.supportedFeatures = schemas.SupportedFeatures("003C")
         flow_id = flow_id_mapping[session_info.qosProfile.root]
         subscription.flowInfo = build_flows(flow_id, session_info)
 
@@ -75,7 +92,7 @@ class NetworkManager(BaseNetworkClient):
         """Add core specific location parameters to support location retrieval scenario in NEF."""
         return schemas.MonitoringEventSubscriptionRequest(
             msisdn=retrieve_location_request.device.phoneNumber.root.lstrip("+"),
-            notificationDestination="http://127.0.0.1:8001",
+            notificationDestination=self.notification_destination,
             monitoringType=schemas.MonitoringType.LOCATION_REPORTING,
             locationType=schemas.LocationType.LAST_KNOWN,
         )
@@ -0,0 +1,294 @@
+# -*- coding: utf-8 -*-
+from typing import AsyncIterator, Dict, List
+
+from sunrise6g_opensdk import logger
+from sunrise6g_opensdk.common.batch import BatchResult, run_batch_async
+from sunrise6g_opensdk.common.cache import AsyncSingleFlight
+from sunrise6g_opensdk.network.core import async_common, schemas
+from sunrise6g_opensdk.network.core.base_network_client import BaseNetworkClient
+from sunrise6g_opensdk.network.core.common import requires_capability
+
+log = logger.get_logger(__name__)
+
+
+class AsyncBaseNetworkClient(BaseNetworkClient):
+    """
+    Asyncio variant of BaseNetworkClient.
+
+    Every CAMARA operation is a coroutine sharing one pooled httpx client, so a
+    single event loop can keep many NEF requests in flight. Payloads are built
+    and responses translated with the same schema builders and core-specific
+    hooks as the synchronous client, which lets each adapter provide its async
+    variant by combining this class with its NetworkManager:
+
+        class AsyncNetworkManager(AsyncBaseNetworkClient, NetworkManager):
+            pass
+    """
+
+    http_client = None
+    _single_flight_class = AsyncSingleFlight
+
+    def _setup_http(
+        self,
+        pool_connections: int,
+        pool_maxsize: int,
+        pool_block: bool,
+        keep_alive: bool,
+    ) -> None:
+        self.http_client = async_common.build_async_http_client(
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+            keep_alive=keep_alive,
+            resilience=self.resilience,
+        )
+
+    async def aclose(self) -> None:
+        """
+        Closes the pooled HTTP client and releases its connections.
+        """
+        if self.http_client is not None:
+            await self.http_client.aclose()
+            self.http_client = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.aclose()
+
+    @requires_capability("location_retrieval")
+    async def create_monitoring_event_subscription(
+        self, retrieve_location_request: schemas.RetrievalLocationRequest
+    ) -> schemas.Location:
+        """
+        Creates a Monitoring Event subscription based on CAMARA Location API input.
+
+        args:
+            retrieve_location_request: Dictionary containing location retrieval details conforming to
+                                        the CAMARA Location API parameters.
+
+        returns:
+            Location of the device, see BaseNetworkClient for its caching.
+        """
+        key = self._location_key(retrieve_location_request)
+        if key is None:
+            return await self._retrieve_location(retrieve_location_request)
+        location = self._cached_location(key, retrieve_location_request.maxAge)
+        if location is not None:
+            return location
+
+        async def retrieve() -> schemas.Location:
+            location = await self._retrieve_location(retrieve_location_request)
+            self._cache_location(key, location)
+            return location
+
+        location = await self._location_flights.do(key, retrieve)
+        return location.model_copy(deep=True)
+
+    @requires_capability("location_retrieval")
+    async def _retrieve_location(
+        self, retrieve_location_request: schemas.RetrievalLocationRequest
+    ) -> schemas.Location:
+        subscription = self._build_monitoring_event_subscription(
+            retrieve_location_request
+        )
+        response = await async_common.monitoring_event_post(
+            self.http_client, self.base_url, self.scs_as_id, subscription
+        )
+        return self._build_camara_location(response)
+
+    @requires_capability("qod")
+    async def create_qod_session(self, session_info: Dict) -> Dict:
+        """
+        Creates a QoS session based on CAMARA QoD API input.
+
+        args:
+            session_info: Dictionary containing session details conforming to
+                          the CAMARA QoD session creation parameters.
+
+        returns:
+            dictionary containing the created session details, including its ID.
+        """
+        valid_session_info = schemas.CreateSession.model_validate(session_info)
+        subscription = self._build_qod_subscription(valid_session_info)
+        response = await async_common.as_session_with_qos_post(
+            self.http_client, self.base_url, self.scs_as_id, subscription
+        )
+        created = self._build_created_qod_session(valid_session_info, response)
+        self._register_qod_session(created)
+        return created
+
+    @requires_capability("qod")
+    async def get_qod_session(self, session_id: str) -> Dict:
+        """
+        Retrieves details of a specific Quality on Demand (QoS) session.
+
+        args:
+            session_id: The unique identifier of the QoS session.
+
+        returns:
+            Dictionary containing the details of the requested QoS session.
+        """
+        registered = self._registered_qod_session(session_id)
+        if registered is not None:
+            return registered
+        response = await async_common.as_session_with_qos_get(
+            self.http_client, self.base_url, self.scs_as_id, session_id
+        )
+        session = self._build_camara_qod_session(response)
+        self._register_qod_session(session)
+        return session
+
+    @requires_capability("qod")
+    async def delete_qod_session(self, session_id: str) -> None:
+        """
+        Deletes a specific Quality on Demand (QoS) session.
+
+        args:
+            session_id: The unique identifier of the QoS session to delete.
+        """
+        try:
+            await async_common.as_session_with_qos_delete(
+                self.http_client, self.base_url, self.scs_as_id, session_id
+            )
+        finally:
+            self._unregister_qod_session(session_id)
+        log.info("QoD session deleted successfully [id=%s]", session_id)
+
+    @requires_capability("qod")
+    async def create_qod_sessions(
+        self, list_of_session_info: List[Dict], max_in_flight: int | None = None
+    ) -> BatchResult:
+        """
+        Creates many QoS sessions, keeping up to 'max_in_flight' NEF requests in flight.
+
+        See BaseNetworkClient.create_qod_sessions for the result layout.
+        """
+
+        async def post(prepared_item):
+            session_info, subscription = prepared_item
+            response = await async_common.as_session_with_qos_post(
+                self.http_client, self.base_url, self.scs_as_id, subscription
+            )
+            created = self._build_created_qod_session(session_info, response)
+            self._register_qod_session(created)
+            return created
+
+        prepared, failed = self._prepare_qod_batch(list_of_session_info)
+        return await run_batch_async(
+            post, prepared, max_in_flight or self.pool_maxsize, failed
+        )
+
+    @requires_capability("qod")
+    async def delete_qod_sessions(
+        self, session_ids: List[str], max_in_flight: int | None = None
+    ) -> BatchResult:
+        """
+        Deletes many QoS sessions, keeping up to 'max_in_flight' NEF requests in flight.
+        """
+
+        async def delete(session_id):
+            try:
+                await async_common.as_session_with_qos_delete(
+                    self.http_client, self.base_url, self.scs_as_id, str(session_id)
+                )
+            finally:
+                self._unregister_qod_session(session_id)
+
+        return await run_batch_async(
+            delete, session_ids, max_in_flight or self.pool_maxsize
+        )
+
+    @requires_capability("traffic_influence")
+    async def create_traffic_influence_resource(
+        self, traffic_influence_info: Dict
+    ) -> Dict:
+        """
+        Creates a Traffic Influence resource based on CAMARA TI API input.
+
+        args:
+            traffic_influence_info: Dictionary containing traffic influence details conforming to
+                                    the CAMARA TI resource creation parameters.
+
+        returns:
+            dictionary containing the created traffic influence resource details, including its ID.
+        """
+        subscription = self._build_ti_subscription(traffic_influence_info)
+        response = await async_common.traffic_influence_post(
+            self.http_client, self.base_url, self.scs_as_id, subscription
+        )
+        return self._build_created_ti_resource(traffic_influence_info, response)
+
+    @requires_capability("traffic_influence")
+    async def put_traffic_influence_resource(
+        self, resource_id: str, traffic_influence_info: Dict
+    ) -> Dict:
+        """
+        Updates a specific Traffic Influence resource.
+
+        args:
+            resource_id: The unique identifier of the Traffic Influence resource.
+            traffic_influence_info: Dictionary containing the new traffic influence details.
+
+        returns:
+            Dictionary containing the details of the updated Traffic Influence resource.
+        """
+        subscription = self._build_ti_subscription(traffic_influence_info)
+        await async_common.traffic_influence_put(
+            self.http_client, self.base_url, self.scs_as_id, resource_id, subscription
+        )
+        traffic_influence_info["trafficInfluenceID"] = resource_id
+        return traffic_influence_info
+
+    @requires_capability("traffic_influence")
+    async def delete_traffic_influence_resource(self, resource_id: str) -> None:
+        """
+        Deletes a specific Traffic Influence resource.
+
+        args:
+            resource_id: The unique identifier of the Traffic Influence resource to delete.
+        """
+        await async_common.traffic_influence_delete(
+            self.http_client, self.base_url, self.scs_as_id, resource_id
+        )
+
+    @requires_capability("traffic_influence")
+    async def get_individual_traffic_influence_resource(self, resource_id: str) -> Dict:
+        nef_response = await async_common.traffic_influence_get(
+            self.http_client, self.base_url, self.scs_as_id, resource_id
+        )
+        return self._build_camara_ti(nef_response)
+
+    @requires_capability("traffic_influence")
+    async def get_all_traffic_influence_resource(self) -> list[Dict]:
+        return [ti async for ti in self.iter_traffic_influence_resources()]
+
+    @requires_capability("traffic_influence")
+    async def iter_traffic_influence_resources(
+        self, page_size: int | None = None
+    ) -> AsyncIterator[schemas.CreateTrafficInfluence]:
+        """
+        Lazily iterates over the Traffic Influence resources of the AF.
+
+        See BaseNetworkClient.iter_traffic_influence_resources for the paging.
+        """
+        self._ti_page_params(0, page_size)
+        offset = 0
+        first_links = set()
+        while True:
+            count = 0
+            async for item in async_common.traffic_influence_iter(
+                self.http_client,
+                self.base_url,
+                self.scs_as_id,
+                params=self._ti_page_params(offset, page_size),
+            ):
+                if count == 0:
+                    if item.get("self") in first_links:
+                        return
+                    first_links.add(item.get("self"))
+                count += 1
+                yield self._build_camara_ti(item)
+            if page_size is None or count != page_size:
+                return
+            offset += count
@@ -0,0 +1,251 @@
+# -*- coding: utf-8 -*-
+from typing import AsyncIterator
+
+from pydantic import BaseModel
+
+from sunrise6g_opensdk import logger
+from sunrise6g_opensdk.common import metrics
+from sunrise6g_opensdk.common.resilience import CircuitOpenError, Resilience
+from sunrise6g_opensdk.network.core.common import (
+    NETWORK_ADAPTER,
+    STREAM_CHUNK_SIZE,
+    CoreHttpError,
+    JsonArrayParser,
+    _build_headers,
+    _serialize,
+    as_session_with_qos_build_url,
+    monitoring_event_build_url,
+    nef_operation,
+    traffic_influence_build_url,
+)
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover - optional dependency
+    httpx = None
+
+log = logger.get_logger(__name__)
+
+if httpx is not None:
+
+    class ResilientAsyncClient(httpx.AsyncClient):
+        """
+        httpx AsyncClient whose calls are bounded by a deadline, retried and
+        circuit broken according to a Resilience object.
+        """
+
+        def __init__(self, resilience: Resilience, **kwargs):
+            super().__init__(**kwargs)
+            self.resilience = resilience
+
+        async def request(self, method, url, *args, timeout=None, **kwargs):
+            async def send(remaining):
+                return await super(ResilientAsyncClient, self).request(
+                    method, url, *args, timeout=remaining, **kwargs
+                )
+
+            return await self.resilience.acall(
+                method,
+                str(url),
+                send,
+                transient_errors=(httpx.TransportError,),
+                timeout_errors=(httpx.TimeoutException,),
+                timeout=timeout,
+            )
+
+
+def build_async_http_client(
+    pool_maxsize: int,
+    pool_block: bool,
+    keep_alive: bool,
+    resilience: Resilience | None = None,
+) -> "httpx.AsyncClient":
+    """
+    Builds the pooled httpx client used by the asyncio network clients.
+
+    The pool settings mirror the ones of the synchronous requests session:
+    'pool_maxsize' bounds the idle keep-alive connections and, when
+    'pool_block' is set, the total number of open connections as well.
+    'resilience' applies the same deadline, retry and circuit breaker
+    handling as the synchronous session.
+    """
+    if httpx is None:
+        raise ImportError(
+            "Asyncio network clients require 'httpx'. "
+            "Install it with: pip install sunrise6g-opensdk[async]"
+        )
+    if pool_maxsize < 1:
+        raise ValueError("pool_maxsize must be positive.")
+    limits = httpx.Limits(
+        max_connections=pool_maxsize if pool_block else None,
+        max_keepalive_connections=pool_maxsize if keep_alive else 0,
+    )
+    if resilience is None:
+        return httpx.AsyncClient(limits=limits, timeout=httpx.Timeout(None))
+    return ResilientAsyncClient(resilience, limits=limits, timeout=httpx.Timeout(None))
+
+
+async def _make_async_request(
+    client: "httpx.AsyncClient", method: str, url: str, data=None
+):
+    with metrics.measure(NETWORK_ADAPTER, nef_operation(method, url)) as measurement:
+        try:
+            headers = _build_headers(method)
+            response = await client.request(method, url, headers=headers, content=data)
+            measurement.status = response.status_code
+            measurement.mark("send")
+            response.raise_for_status()
+            if response.content:
+                payload = response.json()
+                measurement.mark("parse")
+                return payload
+        except httpx.HTTPStatusError as e:
+            raise CoreHttpError(e) from e
+        except httpx.TimeoutException as e:
+            raise CoreHttpError("timeout") from e
+        except httpx.TransportError as e:
+            raise CoreHttpError("connection error") from e
+        except CircuitOpenError as e:
+            raise CoreHttpError(f"{e} for {url}") from e
+
+
+async def _send_streaming(
+    client: "httpx.AsyncClient", method: str, url: str, params: dict | None
+) -> "httpx.Response":
+    headers = _build_headers(method)
+
+    async def send(remaining):
+        request = client.build_request(
+            method, url, headers=headers, params=params, timeout=remaining
+        )
+        return await client.send(request, stream=True)
+
+    # httpx streams bypass AsyncClient.request, apply the client resilience here
+    resilience = getattr(client, "resilience", None)
+    if resilience is None:
+        return await send(client.timeout)
+    return await resilience.acall(
+        method,
+        url,
+        send,
+        transient_errors=(httpx.TransportError,),
+        timeout_errors=(httpx.TimeoutException,),
+    )
+
+
+async def _iter_async_request(
+    client: "httpx.AsyncClient", method: str, url: str, params: dict | None = None
+) -> AsyncIterator:
+    """
+    Sends a request whose response is a JSON array and yields its items as they
+    are received.
+    """
+    with metrics.measure(NETWORK_ADAPTER, nef_operation(method, url)) as measurement:
+        try:
+            response = await _send_streaming(client, method, url, params)
+            measurement.status = response.status_code
+            measurement.mark("send")
+            try:
+                response.raise_for_status()
+                parser = JsonArrayParser()
+                async for chunk in response.aiter_bytes(STREAM_CHUNK_SIZE):
+                    for item in parser.feed(chunk):
+                        yield item
+                for item in parser.feed(b"", final=True):
+                    yield item
+            finally:
+                await response.aclose()
+        except httpx.HTTPStatusError as e:
+            raise CoreHttpError(e) from e
+        except httpx.TimeoutException as e:
+            raise CoreHttpError("timeout") from e
+        except httpx.TransportError as e:
+            raise CoreHttpError("connection error") from e
+        except CircuitOpenError as e:
+            raise CoreHttpError(f"{e} for {url}") from e
+
+
+# Monitoring Event Methods
+async def monitoring_event_post(
+    client: "httpx.AsyncClient",
+    base_url: str,
+    scs_as_id: str,
+    model_payload: BaseModel,
+) -> dict:
+    url = monitoring_event_build_url(base_url, scs_as_id)
+    data = _serialize("POST", url, model_payload, by_alias=True)
+    return await _make_async_request(client, "POST", url, data=data)
+
+
+# QoD methods
+async def as_session_with_qos_post(
+    client: "httpx.AsyncClient",
+    base_url: str,
+    scs_as_id: str,
+    model_payload: BaseModel,
+) -> dict:
+    url = as_session_with_qos_build_url(base_url, scs_as_id)
+    data = _serialize("POST", url, model_payload, by_alias=True)
+    return await _make_async_request(client, "POST", url, data=data)
+
+
+async def as_session_with_qos_get(
+    client: "httpx.AsyncClient", base_url: str, scs_as_id: str, session_id: str
+) -> dict:
+    url = as_session_with_qos_build_url(base_url, scs_as_id, session_id)
+    return await _make_async_request(client, "GET", url)
+
+
+async def as_session_with_qos_delete(
+    client: "httpx.AsyncClient", base_url: str, scs_as_id: str, session_id: str
+):
+    url = as_session_with_qos_build_url(base_url, scs_as_id, session_id)
+    return await _make_async_request(client, "DELETE", url)
+
+
+# Traffic Influence Methods
+async def traffic_influence_post(
+    client: "httpx.AsyncClient",
+    base_url: str,
+    scs_as_id: str,
+    model_payload: BaseModel,
+) -> dict:
+    url = traffic_influence_build_url(base_url, scs_as_id)
+    data = _serialize("POST", url, model_payload)
+    return await _make_async_request(client, "POST", url, data=data)
+
+
+async def traffic_influence_delete(
+    client: "httpx.AsyncClient", base_url: str, scs_as_id: str, session_id: str
+):
+    url = traffic_influence_build_url(base_url, scs_as_id, session_id)
+    return await _make_async_request(client, "DELETE", url)
+
+
+async def traffic_influence_put(
+    client: "httpx.AsyncClient",
+    base_url: str,
+    scs_as_id: str,
+    session_id: str,
+    model_payload: BaseModel,
+) -> dict:
+    url = traffic_influence_build_url(base_url, scs_as_id, session_id)
+    data = _serialize("PUT", url, model_payload)
+    return await _make_async_request(client, "PUT", url, data=data)
+
+
+async def traffic_influence_get(
+    client: "httpx.AsyncClient", base_url: str, scs_as_id: str, sessionId: str = None
+) -> dict:
+    url = traffic_influence_build_url(base_url, scs_as_id, sessionId)
+    return await _make_async_request(client, "GET", url)
+
+
+def traffic_influence_iter(
+    client: "httpx.AsyncClient",
+    base_url: str,
+    scs_as_id: str,
+    params: dict | None = None,
+) -> AsyncIterator[dict]:
+    url = traffic_influence_build_url(base_url, scs_as_id)
+    return _iter_async_request(client, "GET", url, params=params)
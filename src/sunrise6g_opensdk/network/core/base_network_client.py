@@ -9,34 +9,106 @@
 #   - Giulio Carota (giulio.carota@eurecom.fr)
 #   - Panagiotis Pavlidis (p.pavlidis@iit.demokritos.gr)
 ##
+import copy
 import uuid
 from datetime import datetime, timedelta, timezone
 from itertools import product
-from typing import Dict
+from typing import Dict, Iterator, List
+
+import requests
 
 from sunrise6g_opensdk import logger
+from sunrise6g_opensdk.common.batch import BatchResult, run_batch
+from sunrise6g_opensdk.common.cache import DEFAULT_CACHE_SIZE, SingleFlight, TTLCache
+from sunrise6g_opensdk.common.http_session import (
+    DEFAULT_POOL_CONNECTIONS,
+    DEFAULT_POOL_MAXSIZE,
+    build_http_session,
+)
+from sunrise6g_opensdk.common.resilience import (
+    DEFAULT_FAILURE_THRESHOLD,
+    DEFAULT_MAX_RETRIES,
+    DEFAULT_RESET_TIMEOUT,
+    DEFAULT_TIMEOUT,
+    Resilience,
+    RetryPolicy,
+)
 from sunrise6g_opensdk.network.adapters.errors import NetworkPlatformError
 from sunrise6g_opensdk.network.core import common, schemas
 from sunrise6g_opensdk.network.core.common import requires_capability
 
 log = logger.get_logger(__name__)
 
+# QoD subscription templates, keyed by adapter class and QoS profile. Bounded,
+# since some adapters accept any QoS profile string.
+_QOD_TEMPLATES_SIZE = 256
+_QOD_TEMPLATES_TTL = 3600.0  # seconds
+_qod_templates = TTLCache(ttl=_QOD_TEMPLATES_TTL, maxsize=_QOD_TEMPLATES_SIZE)
+_SESSION_INFO_FIELDS = tuple(schemas.SessionInfo.model_fields)
 
-def flatten_port_spec(ports_spec: schemas.PortsSpec | None) -> list[str]:
-    has_ports = False
-    has_ranges = False
-    flat_ports = []
+# Upper bound of device/server port combinations in a QoD flow description
+MAX_FLOW_PORT_COMBINATIONS = 256
+
+
+def qod_subscription_id(response: Dict) -> str:
+    """
+    Returns the subscription ID, the last segment of the self link of a NEF response.
+    """
+    subscription_id = (response.get("self") or "").split("/")[-1]
+    if not subscription_id:
+        log.error("Failed to retrieve QoS session ID from response")
+        raise NetworkPlatformError("QoS session ID not found in response")
+    return subscription_id
+
+
+def merge_port_spec(ports_spec: schemas.PortsSpec | None) -> list[tuple[int, int]]:
+    """
+    Returns the ports of a CAMARA ports spec as sorted, disjoint intervals.
+
+    Overlapping and adjacent ports and ranges are merged, and an empty spec
+    matches every port.
+    """
+    intervals = []
     if ports_spec and ports_spec.ports:
-        has_ports = True
-        flat_ports.extend([str(port) for port in ports_spec.ports])
+        intervals.extend((port.root, port.root) for port in ports_spec.ports)
     if ports_spec and ports_spec.ranges:
-        has_ranges = True
-        flat_ports.extend(
-            [f"{range.from_.root}-{range.to.root}" for range in ports_spec.ranges]
-        )
-    if not has_ports and not has_ranges:
-        flat_ports.append("0-65535")
-    return flat_ports
+        for range in ports_spec.ranges:
+            if range.from_.root > range.to.root:
+                raise NetworkPlatformError(
+                    f"Invalid port range {range.from_.root}-{range.to.root}"
+                )
+            intervals.append((range.from_.root, range.to.root))
+    if not intervals:
+        return [(0, 65535)]
+
+    intervals.sort()
+    merged = [intervals[0]]
+    for start, end in intervals[1:]:
+        last_start, last_end = merged[-1]
+        if start <= last_end + 1:
+            merged[-1] = (last_start, max(last_end, end))
+        else:
+            merged.append((start, end))
+    return merged
+
+
+def location_is_fresh(location: schemas.Location, max_age: int | None) -> bool:
+    """
+    Whether a location satisfies the CAMARA 'maxAge' of a retrieval request.
+
+    A missing 'maxAge' accepts a location of any age.
+    """
+    if max_age is None:
+        return True
+    age = datetime.now(timezone.utc) - location.lastLocationTime.root
+    return age.total_seconds() <= max_age
+
+
+def flatten_port_spec(ports_spec: schemas.PortsSpec | None) -> list[str]:
+    return [
+        str(start) if start == end else f"{start}-{end}"
+        for start, end in merge_port_spec(ports_spec)
+    ]
 
 
 def build_flows(
@@ -45,7 +117,13 @@ def build_flows(
 ) -> list[schemas.FlowInfo]:
     device_ports = flatten_port_spec(session_info.devicePorts)
     server_ports = flatten_port_spec(session_info.applicationServerPorts)
-    ports_combis = list(product(device_ports, server_ports))
+    combinations = len(device_ports) * len(server_ports)
+    if combinations > MAX_FLOW_PORT_COMBINATIONS:
+        raise NetworkPlatformError(
+            f"Ports spec expands to {combinations} device/server port combinations, "
+            f"above the limit of {MAX_FLOW_PORT_COMBINATIONS}. Use port ranges "
+            "instead of individual ports."
+        )
 
     device_ip = session_info.device.ipv4Address or session_info.device.ipv6Address
     if isinstance(device_ip, schemas.DeviceIpv6Address):
@@ -60,17 +138,15 @@ def build_flows(
         or session_info.applicationServer.ipv6Address
     )
     server_ip = server_ip.root
-    flow_descrs = []
-    for device_port, server_port in ports_combis:
-        flow_descrs.append(
-            f"permit in ip from {device_ip} {device_port} to {server_ip} {server_port}"
+    flow_descriptions = ", ".join(
+        rule
+        for device_port, server_port in product(device_ports, server_ports)
+        for rule in (
+            f"permit in ip from {device_ip} {device_port} to {server_ip} {server_port}",
+            f"permit out ip from {server_ip} {server_port} to {device_ip} {device_port}",
         )
-        flow_descrs.append(
-            f"permit out ip from {server_ip} {server_port} to {device_ip} {device_port}"
-        )
-    flows = [
-        schemas.FlowInfo(flowId=flow_id, flowDescriptions=[", ".join(flow_descrs)])
-    ]
+    )
+    flows = [schemas.FlowInfo(flowId=flow_id, flowDescriptions=[flow_descriptions])]
     return flows
 
 
@@ -85,6 +161,208 @@ class BaseNetworkClient:
 
     base_url: str
     scs_as_id: str
+    http_session: requests.Session | None = None
+    pool_maxsize: int = DEFAULT_POOL_MAXSIZE
+    resilience: Resilience | None = None
+    session_registry: TTLCache | None = None
+    location_cache: TTLCache | None = None
+    _single_flight_class = SingleFlight
+
+    def __init__(
+        self,
+        pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+        pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+        pool_block: bool = False,
+        keep_alive: bool = True,
+        timeout: float | None = DEFAULT_TIMEOUT,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        failure_threshold: int | None = DEFAULT_FAILURE_THRESHOLD,
+        reset_timeout: float = DEFAULT_RESET_TIMEOUT,
+        session_cache_ttl: float | None = None,
+        session_cache_size: int = DEFAULT_CACHE_SIZE,
+        location_cache_ttl: float | None = None,
+        location_cache_size: int = DEFAULT_CACHE_SIZE,
+    ):
+        """
+        Sets up the pooled HTTP session shared by every NEF call of this client.
+
+        args:
+            pool_connections: Number of per-host connection pools to cache.
+            pool_maxsize: Maximum number of connections kept open per host.
+            pool_block: Whether to wait for a free connection when the pool is exhausted.
+            keep_alive: Whether to reuse connections across NEF calls.
+            timeout: Deadline in seconds of a NEF call, including its retries.
+                     None waits indefinitely.
+            max_retries: Retries of idempotent calls (GET/PUT/DELETE) failing
+                         with a connection error, a timeout or a transient 5xx.
+            failure_threshold: Consecutive failures after which calls to the NEF
+                               fail fast. None disables the circuit breaker.
+            reset_timeout: Seconds to wait before probing a failing NEF again.
+            session_cache_ttl: Seconds during which QoD sessions created or read
+                               by this client are served from a local registry
+                               instead of the NEF. None disables the registry.
+            session_cache_size: Maximum number of QoD sessions kept in the registry,
+                                the least recently used ones are evicted first.
+            location_cache_ttl: Seconds during which the location retrieved for a
+                                device is kept, to answer later requests whose
+                                'maxAge' it satisfies. None disables the cache.
+            location_cache_size: Maximum number of devices kept in the location cache.
+        """
+        self.pool_maxsize = pool_maxsize
+        if session_cache_ttl is not None:
+            self.session_registry = TTLCache(
+                ttl=session_cache_ttl, maxsize=session_cache_size
+            )
+        if location_cache_ttl is not None:
+            self.location_cache = TTLCache(
+                ttl=location_cache_ttl, maxsize=location_cache_size
+            )
+        # Concurrent retrievals of the same device share one NEF call
+        self._location_flights = self._single_flight_class()
+        self.resilience = Resilience(
+            timeout=timeout,
+            retry_policy=RetryPolicy(max_retries=max_retries),
+            failure_threshold=failure_threshold,
+            reset_timeout=reset_timeout,
+        )
+        self._setup_http(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+            keep_alive=keep_alive,
+        )
+
+    def _setup_http(
+        self,
+        pool_connections: int,
+        pool_maxsize: int,
+        pool_block: bool,
+        keep_alive: bool,
+    ) -> None:
+        self.http_session = build_http_session(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+            keep_alive=keep_alive,
+            resilience=self.resilience,
+        )
+
+    def resilience_stats(self) -> Dict:
+        """
+        Returns the retry counters and the circuit breaker state of the NEF calls.
+
+        returns:
+            Dictionary with the number of calls, attempts, retries, failures,
+            timeouts and rejected (fail fast) attempts, plus the state of the
+            circuit breaker of every NEF origin under 'circuit_breakers'.
+        """
+        return self.resilience.snapshot()
+
+    def session_registry_stats(self) -> Dict:
+        """
+        Returns the size and the hit/miss counters of the QoD session registry.
+
+        returns:
+            Dictionary with the registry size and its hits, misses, evictions,
+            expirations and invalidations. Empty if the registry is disabled.
+        """
+        if self.session_registry is None:
+            return {}
+        return self.session_registry.snapshot()
+
+    def location_cache_stats(self) -> Dict:
+        """
+        Returns the hit/miss counters of the location cache and the number of
+        location retrievals coalesced into an in-flight NEF call.
+        """
+        stats = {"coalesced": self._location_flights.coalesced}
+        if self.location_cache is not None:
+            stats.update(self.location_cache.snapshot())
+        return stats
+
+    @staticmethod
+    def _location_key(
+        retrieve_location_request: schemas.RetrievalLocationRequest,
+    ) -> str | None:
+        device = retrieve_location_request.device
+        if device is None:
+            return None
+        return device.model_dump_json(exclude_none=True)
+
+    def _cached_location(
+        self, key: str, max_age: int | None
+    ) -> schemas.Location | None:
+        if self.location_cache is None:
+            return None
+        location = self.location_cache.get(
+            key, valid=lambda location: location_is_fresh(location, max_age)
+        )
+        return location.model_copy(deep=True) if location is not None else None
+
+    def _cache_location(self, key: str, location: schemas.Location) -> None:
+        if self.location_cache is not None:
+            self.location_cache.set(key, location)
+
+    def _register_qod_session(self, session: Dict) -> None:
+        # Stored as reported by get_qod_session once the NEF accepted it, and
+        # copied so that the caller's session cannot alter the registered one
+        if self.session_registry is not None:
+            registered = copy.deepcopy(session)
+            registered["qosStatus"] = schemas.QosStatus.AVAILABLE
+            self.session_registry.set(str(session["sessionId"]), registered)
+
+    def _registered_qod_session(self, session_id: str) -> Dict | None:
+        if self.session_registry is None:
+            return None
+        session = self.session_registry.get(str(session_id))
+        # Callers own the returned session, keep the registered one untouched
+        return copy.deepcopy(session) if session is not None else None
+
+    def _unregister_qod_session(self, session_id: str) -> None:
+        if self.session_registry is not None:
+            self.session_registry.invalidate(str(session_id))
+
+    @requires_capability("qod")
+    def handle_qod_notification(
+        self, notification: Dict
+    ) -> schemas.UserPlaneNotificationData:
+        """
+        Processes a NEF notification about a QoS session.
+
+        The session it refers to is dropped from the session registry, so the
+        next read fetches its updated state from the NEF.
+
+        args:
+            notification: UserPlaneNotificationData sent by the NEF to the
+                          notification destination of the session.
+
+        returns:
+            The validated notification.
+        """
+        valid_notification = schemas.UserPlaneNotificationData.model_validate(
+            notification
+        )
+        session_id = valid_notification.subscription_id
+        self._unregister_qod_session(session_id)
+        events = [report.event.value for report in valid_notification.eventReports]
+        log.info(
+            "QoD session notification received [id=%s, events=%s]", session_id, events
+        )
+        return valid_notification
+
+    def close(self) -> None:
+        """
+        Closes the pooled HTTP session and releases its connections.
+        """
+        if self.http_session is not None:
+            self.http_session.close()
+            self.http_session = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
 
     @requires_capability("qod")
     def add_core_specific_qod_parameters(
@@ -169,22 +447,54 @@ class BaseNetworkClient:
         # This method should be overwritten by subclasses if needed
         pass
 
+    @requires_capability("qod")
+    def core_specific_qod_template(self, qos_profile: str) -> Dict:
+        """
+        Returns the subscription parameters that only depend on the QoS profile.
+
+        They are computed once per adapter and QoS profile and shared by every
+        subscription, so the values must be validated schema objects that are
+        never mutated. This method should be overridden by subclasses if needed.
+
+        args:
+            qos_profile: Name of the requested QoS profile.
+
+        returns:
+            Dictionary mapping AsSessionWithQoSSubscription fields to their values.
+        """
+        return {}
+
+    def _qod_template(self, qos_profile: str) -> Dict:
+        key = (type(self), qos_profile)
+        template = _qod_templates.get(key)
+        if template is None:
+            template = {
+                "qosReference": qos_profile,
+                **self.core_specific_qod_template(qos_profile),
+            }
+            _qod_templates.set(key, template)
+        return template
+
     @requires_capability("qod")
     def _build_qod_subscription(
-        self, session_info: Dict
+        self, session_info: Dict | schemas.CreateSession
     ) -> schemas.AsSessionWithQoSSubscription:
         valid_session_info = schemas.CreateSession.model_validate(session_info)
-        device_ipv4 = None
-        if valid_session_info.device.ipv4Address:
-            device_ipv4 = valid_session_info.device.ipv4Address.root.publicAddress.root
-
         self.core_specific_qod_validation(valid_session_info)
+
+        device = valid_session_info.device
+        device_ipv4 = device_ipv6 = None
+        if device is not None and device.ipv4Address:
+            device_ipv4 = device.ipv4Address.root.publicAddress.root
+        if device is not None and device.ipv6Address:
+            device_ipv6 = device.ipv6Address.root
+
         subscription = schemas.AsSessionWithQoSSubscription(
             notificationDestination=str(valid_session_info.sink),
-            qosReference=valid_session_info.qosProfile.root,
             ueIpv4Addr=device_ipv4,
-            ueIpv6Addr=valid_session_info.device.ipv6Address,
+            ueIpv6Addr=device_ipv6,
             usageThreshold=schemas.UsageThreshold(duration=valid_session_info.duration),
+            **self._qod_template(valid_session_info.qosProfile.root),
         )
         self.add_core_specific_qod_parameters(valid_session_info, subscription)
         return subscription
@@ -285,20 +595,45 @@ class BaseNetworkClient:
         """
         Creates a Monitoring Event subscription based on CAMARA Location API input.
 
+        Locations cached for the device are served while they satisfy the
+        request 'maxAge', and concurrent requests for the same device share a
+        single NEF call.
+
         args:
             retrieve_location_request: Dictionary containing location retrieval details conforming to
                                         the CAMARA Location API parameters.
 
         returns:
-            dictionary containing the created subscription details, including its ID.
+            Location of the device.
         """
+        key = self._location_key(retrieve_location_request)
+        if key is None:
+            return self._retrieve_location(retrieve_location_request)
+        location = self._cached_location(key, retrieve_location_request.maxAge)
+        if location is not None:
+            return location
+
+        def retrieve() -> schemas.Location:
+            location = self._retrieve_location(retrieve_location_request)
+            self._cache_location(key, location)
+            return location
+
+        return self._location_flights.do(key, retrieve).model_copy(deep=True)
+
+    @requires_capability("location_retrieval")
+    def _retrieve_location(
+        self, retrieve_location_request: schemas.RetrievalLocationRequest
+    ) -> schemas.Location:
         subscription = self._build_monitoring_event_subscription(
             retrieve_location_request
         )
         response = common.monitoring_event_post(
-            self.base_url, self.scs_as_id, subscription
+            self.base_url, self.scs_as_id, subscription, session=self.http_session
         )
+        return self._build_camara_location(response)
 
+    @requires_capability("location_retrieval")
+    def _build_camara_location(self, response: Dict) -> schemas.Location:
         monitoring_event_report = schemas.MonitoringEventReport(**response)
         if monitoring_event_report.locationInfo is None:
             log.error(
@@ -317,7 +652,7 @@ class BaseNetworkClient:
         last_location_time = self._compute_camara_last_location_time(
             report_event_time, age_of_location_info
         )
-        log.debug(f"Last Location time is {last_location_time}")
+        log.debug("Last Location time is %s", last_location_time)
         camara_point_list: list[schemas.Point] = []
         for point in geo_area.polygon.point_list.geographical_coords:
             camara_point_list.append(
@@ -346,20 +681,32 @@ class BaseNetworkClient:
         returns:
             dictionary containing the created session details, including its ID.
         """
-        subscription = self._build_qod_subscription(session_info)
+        valid_session_info = schemas.CreateSession.model_validate(session_info)
+        subscription = self._build_qod_subscription(valid_session_info)
         response = common.as_session_with_qos_post(
-            self.base_url, self.scs_as_id, subscription
-        )
-        subscription_info: schemas.AsSessionWithQoSSubscription = (
-            schemas.AsSessionWithQoSSubscription(**response)
+            self.base_url, self.scs_as_id, subscription, session=self.http_session
         )
+        created = self._build_created_qod_session(valid_session_info, response)
+        self._register_qod_session(created)
+        return created
 
-        session_info = schemas.SessionInfo(
-            sessionId=schemas.SessionId(uuid.UUID(subscription_info.subscription_id)),
+    @requires_capability("qod")
+    def _build_created_qod_session(
+        self, session_info: Dict | schemas.CreateSession, response: Dict
+    ) -> Dict:
+        valid_session_info = schemas.CreateSession.model_validate(session_info)
+        # The NEF response is trusted: only its self link is needed. The session
+        # is dumped from the already validated input instead of re-validating a
+        # SessionInfo, keeping the SessionInfo field order.
+        created = valid_session_info.model_dump()
+        created.update(
+            sessionId=uuid.UUID(qod_subscription_id(response)),
             qosStatus=schemas.QosStatus.REQUESTED,
-            **session_info,
+            startedAt=None,
+            expiresAt=None,
+            statusInfo=None,
         )
-        return session_info.model_dump()
+        return {field: created[field] for field in _SESSION_INFO_FIELDS}
 
     @requires_capability("qod")
     def get_qod_session(self, session_id: str) -> Dict:
@@ -372,21 +719,35 @@ class BaseNetworkClient:
         returns:
             Dictionary containing the details of the requested QoS session.
         """
+        registered = self._registered_qod_session(session_id)
+        if registered is not None:
+            return registered
         response = common.as_session_with_qos_get(
-            self.base_url, self.scs_as_id, session_id=session_id
+            self.base_url,
+            self.scs_as_id,
+            session_id=session_id,
+            session=self.http_session,
         )
-        subscription_info = schemas.AsSessionWithQoSSubscription(**response)
-        flowDesc = subscription_info.flowInfo[0].flowDescriptions[0]
+        session = self._build_camara_qod_session(response)
+        self._register_qod_session(session)
+        return session
+
+    @requires_capability("qod")
+    def _build_camara_qod_session(self, response: Dict) -> Dict:
+        # The NEF response is trusted: read the needed fields without a model pass,
+        # the CAMARA session built from them is still validated
+        flowDesc = response["flowInfo"][0]["flowDescriptions"][0]
         serverIp = flowDesc.split("to ")[1].split("/")[0]
+        ue_ipv4 = response.get("ueIpv4Addr")
         session_info = schemas.SessionInfo(
-            sessionId=schemas.SessionId(uuid.UUID(subscription_info.subscription_id)),
-            duration=subscription_info.usageThreshold.duration.root,
-            sink=subscription_info.notificationDestination.root,
-            qosProfile=subscription_info.qosReference,
+            sessionId=schemas.SessionId(uuid.UUID(qod_subscription_id(response))),
+            duration=response["usageThreshold"]["duration"],
+            sink=response["notificationDestination"],
+            qosProfile=response.get("qosReference"),
             device=schemas.Device(
                 ipv4Address=schemas.DeviceIpv4Addr1(
-                    publicAddress=subscription_info.ueIpv4Addr,
-                    privateAddress=subscription_info.ueIpv4Addr,
+                    publicAddress=ue_ipv4,
+                    privateAddress=ue_ipv4,
                 ),
             ),
             applicationServer=schemas.ApplicationServer(
@@ -407,10 +768,114 @@ class BaseNetworkClient:
         returns:
             None
         """
-        common.as_session_with_qos_delete(
-            self.base_url, self.scs_as_id, session_id=session_id
+        try:
+            common.as_session_with_qos_delete(
+                self.base_url,
+                self.scs_as_id,
+                session_id=session_id,
+                session=self.http_session,
+            )
+        finally:
+            self._unregister_qod_session(session_id)
+        log.info("QoD session deleted successfully [id=%s]", session_id)
+
+    @requires_capability("qod")
+    def _prepare_qod_batch(self, list_of_session_info: List[Dict]) -> tuple:
+        """
+        Validates every session up front and builds its NEF subscription.
+
+        returns:
+            A list of (session_info, subscription) pairs, None for rejected inputs,
+            and a dictionary mapping the index of each rejected input to its error.
+        """
+        prepared = []
+        failed = {}
+        for index, session_info in enumerate(list_of_session_info):
+            try:
+                valid_session_info = schemas.CreateSession.model_validate(session_info)
+                subscription = self._build_qod_subscription(valid_session_info)
+                prepared.append((valid_session_info, subscription))
+            except Exception as e:
+                failed[index] = e
+                prepared.append(None)
+        return prepared, failed
+
+    @requires_capability("qod")
+    def create_qod_sessions(
+        self, list_of_session_info: List[Dict], max_in_flight: int | None = None
+    ) -> BatchResult:
+        """
+        Creates many QoS sessions, running the NEF requests concurrently.
+
+        All inputs are validated before any request is sent. A failing item does
+        not abort the batch: its error is reported in the matching result item.
+
+        args:
+            list_of_session_info: List of dictionaries conforming to the CAMARA QoD
+                                  session creation parameters.
+            max_in_flight: Maximum number of concurrent NEF requests. Defaults to
+                           the connection pool size of the client.
+
+        returns:
+            BatchResult with, in input order, the created session details or the
+            error of each item, plus throughput and latency statistics.
+        """
+
+        def post(prepared_item):
+            session_info, subscription = prepared_item
+            response = common.as_session_with_qos_post(
+                self.base_url, self.scs_as_id, subscription, session=self.http_session
+            )
+            created = self._build_created_qod_session(session_info, response)
+            self._register_qod_session(created)
+            return created
+
+        prepared, failed = self._prepare_qod_batch(list_of_session_info)
+        batch = run_batch(post, prepared, max_in_flight or self.pool_maxsize, failed)
+        log.info(
+            "QoD batch creation finished [ok=%d, failed=%d, ops/s=%.1f]",
+            batch.stats.succeeded,
+            batch.stats.failed,
+            batch.stats.throughput,
         )
-        log.info(f"QoD session deleted successfully [id={session_id}]")
+        return batch
+
+    @requires_capability("qod")
+    def delete_qod_sessions(
+        self, session_ids: List[str], max_in_flight: int | None = None
+    ) -> BatchResult:
+        """
+        Deletes many QoS sessions, running the NEF requests concurrently.
+
+        args:
+            session_ids: The unique identifiers of the QoS sessions to delete.
+            max_in_flight: Maximum number of concurrent NEF requests. Defaults to
+                           the connection pool size of the client.
+
+        returns:
+            BatchResult with the error of each failed deletion, plus throughput
+            and latency statistics.
+        """
+
+        def delete(session_id):
+            try:
+                common.as_session_with_qos_delete(
+                    self.base_url,
+                    self.scs_as_id,
+                    session_id=str(session_id),
+                    session=self.http_session,
+                )
+            finally:
+                self._unregister_qod_session(session_id)
+
+        batch = run_batch(delete, session_ids, max_in_flight or self.pool_maxsize)
+        log.info(
+            "QoD batch deletion finished [ok=%d, failed=%d, ops/s=%.1f]",
+            batch.stats.succeeded,
+            batch.stats.failed,
+            batch.stats.throughput,
+        )
+        return batch
 
     @requires_capability("traffic_influence")
     def create_traffic_influence_resource(self, traffic_influence_info: Dict) -> Dict:
@@ -427,9 +892,14 @@ class BaseNetworkClient:
 
         subscription = self._build_ti_subscription(traffic_influence_info)
         response = common.traffic_influence_post(
-            self.base_url, self.scs_as_id, subscription
+            self.base_url, self.scs_as_id, subscription, session=self.http_session
         )
+        return self._build_created_ti_resource(traffic_influence_info, response)
 
+    @requires_capability("traffic_influence")
+    def _build_created_ti_resource(
+        self, traffic_influence_info: Dict, response: Dict
+    ) -> Dict:
         # retrieve the NEF resource id
         if "self" in response.keys():
             subscription_id = response["self"]
@@ -454,7 +924,11 @@ class BaseNetworkClient:
         """
         subscription = self._build_ti_subscription(traffic_influence_info)
         common.traffic_influence_put(
-            self.base_url, self.scs_as_id, resource_id, subscription
+            self.base_url,
+            self.scs_as_id,
+            resource_id,
+            subscription,
+            session=self.http_session,
         )
 
         traffic_influence_info["trafficInfluenceID"] = resource_id
@@ -471,20 +945,81 @@ class BaseNetworkClient:
         returns:
             None
         """
-        common.traffic_influence_delete(self.base_url, self.scs_as_id, resource_id)
+        common.traffic_influence_delete(
+            self.base_url, self.scs_as_id, resource_id, session=self.http_session
+        )
         return
 
     @requires_capability("traffic_influence")
     def get_individual_traffic_influence_resource(self, resource_id: str) -> Dict:
         nef_response = common.traffic_influence_get(
-            self.base_url, self.scs_as_id, resource_id
+            self.base_url, self.scs_as_id, resource_id, session=self.http_session
         )
         camara_ti = self._build_camara_ti(nef_response)
         return camara_ti
 
     @requires_capability("traffic_influence")
     def get_all_traffic_influence_resource(self) -> list[Dict]:
-        r = common.traffic_influence_get(self.base_url, self.scs_as_id)
-        return [self._build_camara_ti(item) for item in r]
+        return list(self.iter_traffic_influence_resources())
+
+    @requires_capability("traffic_influence")
+    def core_specific_ti_paging_parameters(self, offset: int, page_size: int) -> Dict:
+        """
+        Returns the query parameters requesting a page of the Traffic Influence
+        subscriptions. This method should be overridden by subclasses whose NEF
+        uses other paging parameters.
+
+        args:
+            offset: Number of subscriptions to skip.
+            page_size: Maximum number of subscriptions to return.
+        """
+        return {"offset": offset, "limit": page_size}
+
+    def _ti_page_params(self, offset: int, page_size: int | None) -> Dict | None:
+        if page_size is None:
+            return None
+        if page_size < 1:
+            raise ValueError("page_size must be positive.")
+        return self.core_specific_ti_paging_parameters(offset, page_size)
+
+    @requires_capability("traffic_influence")
+    def iter_traffic_influence_resources(
+        self, page_size: int | None = None
+    ) -> Iterator[schemas.CreateTrafficInfluence]:
+        """
+        Lazily iterates over the Traffic Influence resources of the AF.
+
+        NEF listings are parsed while they are received and every subscription
+        is translated when reached, so memory use does not grow with their number.
+
+        args:
+            page_size: Number of subscriptions requested per NEF call, see
+                       core_specific_ti_paging_parameters. None lists them all
+                       in a single call. The listing of a NEF ignoring the paging
+                       parameters is only consumed once.
+
+        returns:
+            Iterator of the CAMARA Traffic Influence resources.
+        """
+        self._ti_page_params(0, page_size)  # validated before the first call
+        offset = 0
+        first_links = set()
+        while True:
+            count = 0
+            for item in common.traffic_influence_iter(
+                self.base_url,
+                self.scs_as_id,
+                params=self._ti_page_params(offset, page_size),
+                session=self.http_session,
+            ):
+                if count == 0:
+                    if item.get("self") in first_links:
+                        return  # paging ignored, the listing started over
+                    first_links.add(item.get("self"))
+                count += 1
+                yield self._build_camara_ti(item)
+            if page_size is None or count != page_size:
+                return
+            offset += count
 
     # Placeholder for additional CAMARA APIs
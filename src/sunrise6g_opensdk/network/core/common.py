@@ -1,33 +1,198 @@
 # -*- coding: utf-8 -*-
+import codecs
+import functools
+import inspect
+import json
+import time
+from typing import Iterator
 
 import requests
 from pydantic import BaseModel
 
 from sunrise6g_opensdk import logger
+from sunrise6g_opensdk.common import metrics
+from sunrise6g_opensdk.common.resilience import CircuitOpenError
 
 log = logger.get_logger(__name__)
 
-
-def _make_request(method: str, url: str, data=None):
-    try:
-        headers = None
-        if method == "POST" or method == "PUT":
-            headers = {
-                "Content-Type": "application/json",
-                "accept": "application/json",
-            }
-        elif method == "GET":
-            headers = {
-                "accept": "application/json",
-            }
-        response = requests.request(method, url, headers=headers, data=data)
-        response.raise_for_status()
-        if response.content:
-            return response.json()
-    except requests.exceptions.HTTPError as e:
-        raise CoreHttpError(e) from e
-    except requests.exceptions.ConnectionError as e:
-        raise CoreHttpError("connection error") from e
+# Bytes read at once from streamed NEF responses
+STREAM_CHUNK_SIZE = 64 * 1024
+
+# Adapter label of the NEF calls in the metrics
+NETWORK_ADAPTER = "network"
+
+
+def _build_headers(method: str) -> dict | None:
+    if method == "POST" or method == "PUT":
+        return {
+            "Content-Type": "application/json",
+            "accept": "application/json",
+        }
+    elif method == "GET":
+        return {
+            "accept": "application/json",
+        }
+    return None
+
+
+def nef_operation(method: str, url: str) -> str:
+    """
+    Returns the metrics label of a NEF call, its method and API,
+    e.g. "POST 3gpp-as-session-with-qos".
+    """
+    start = url.find("/3gpp-")
+    if start < 0:
+        return method
+    end = url.find("/", start + 1)
+    return f"{method} {url[start + 1 : end if end > 0 else None]}"
+
+
+def _serialize(method: str, url: str, model_payload: BaseModel, **kwargs) -> str:
+    if metrics.registry() is None:
+        return model_payload.model_dump_json(exclude_none=True, **kwargs)
+    start = time.perf_counter()
+    data = model_payload.model_dump_json(exclude_none=True, **kwargs)
+    metrics.observe_phase(
+        NETWORK_ADAPTER,
+        nef_operation(method, url),
+        "serialize",
+        time.perf_counter() - start,
+    )
+    return data
+
+
+def _make_request(
+    method: str, url: str, data=None, session: requests.Session | None = None
+):
+    requester = session if session is not None else requests
+    with metrics.measure(NETWORK_ADAPTER, nef_operation(method, url)) as measurement:
+        try:
+            headers = _build_headers(method)
+            response = requester.request(method, url, headers=headers, data=data)
+            measurement.status = response.status_code
+            measurement.mark("send")
+            response.raise_for_status()
+            if response.content:
+                payload = response.json()
+                measurement.mark("parse")
+                return payload
+        except requests.exceptions.HTTPError as e:
+            raise CoreHttpError(e) from e
+        except requests.exceptions.Timeout as e:
+            raise CoreHttpError("timeout") from e
+        except requests.exceptions.ConnectionError as e:
+            raise CoreHttpError("connection error") from e
+        except CircuitOpenError as e:
+            raise CoreHttpError(f"{e} for {url}") from e
+
+
+class JsonArrayParser:
+    """
+    Push parser of a JSON array received in chunks.
+
+    Every call to feed returns the items completed by the new chunk, so the
+    items of a large listing can be processed while it is being received,
+    without holding the whole document in memory.
+    """
+
+    _WHITESPACE = " \t\n\r"
+
+    def __init__(self):
+        self._decoder = json.JSONDecoder()
+        self._text = codecs.getincrementaldecoder("utf-8")()
+        self._buffer = ""
+        # start: before '[', first: after '[', item: after ',', next: after an item
+        self._state = "start"
+
+    def feed(self, chunk: bytes, final: bool = False) -> list:
+        """
+        Parses a chunk of the document and returns the items it completed.
+
+        args:
+            final: Whether the chunk is the last one of the document.
+
+        raises:
+            json.JSONDecodeError: If the document is not a JSON array.
+        """
+        buffer = self._buffer + self._text.decode(chunk, final)
+        items = []
+        pos = 0
+        while True:
+            while pos < len(buffer) and buffer[pos] in self._WHITESPACE:
+                pos += 1
+            if pos == len(buffer):
+                break
+            char = buffer[pos]
+            if self._state == "done":
+                raise json.JSONDecodeError("Extra data", buffer, pos)
+            if self._state == "start":
+                if char != "[":
+                    raise json.JSONDecodeError("Expecting '['", buffer, pos)
+                self._state = "first"
+                pos += 1
+            elif char == "]" and self._state in ("first", "next"):
+                self._state = "done"
+                pos += 1
+            elif self._state == "next":
+                if char != ",":
+                    raise json.JSONDecodeError("Expecting ',' delimiter", buffer, pos)
+                self._state = "item"
+                pos += 1
+            else:
+                try:
+                    item, end = self._decoder.raw_decode(buffer, pos)
+                except json.JSONDecodeError:
+                    if final:
+                        raise
+                    break  # incomplete item, wait for the next chunk
+                if end == len(buffer) and not final:
+                    break  # a number could go on in the next chunk
+                items.append(item)
+                self._state = "next"
+                pos = end
+        self._buffer = buffer[pos:]
+        # An empty document is an empty listing
+        if final and self._state not in ("start", "done"):
+            raise json.JSONDecodeError("Unterminated array", buffer, len(buffer))
+        return items
+
+
+def _iter_request(
+    method: str,
+    url: str,
+    params: dict | None = None,
+    session: requests.Session | None = None,
+) -> Iterator:
+    """
+    Sends a request whose response is a JSON array and yields its items as they
+    are received.
+    """
+    requester = session if session is not None else requests
+    with metrics.measure(NETWORK_ADAPTER, nef_operation(method, url)) as measurement:
+        try:
+            headers = _build_headers(method)
+            response = requester.request(
+                method, url, headers=headers, params=params, stream=True
+            )
+            measurement.status = response.status_code
+            measurement.mark("send")
+            with response:
+                response.raise_for_status()
+                parser = JsonArrayParser()
+                for chunk in response.iter_content(STREAM_CHUNK_SIZE):
+                    yield from parser.feed(chunk)
+                yield from parser.feed(b"", final=True)
+        except requests.exceptions.HTTPError as e:
+            raise CoreHttpError(e) from e
+        except requests.exceptions.Timeout as e:
+            raise CoreHttpError("timeout") from e
+        except (
+            requests.exceptions.ConnectionError,
+            requests.exceptions.ChunkedEncodingError,
+        ) as e:
+            raise CoreHttpError("connection error") from e
+        except CircuitOpenError as e:
+            raise CoreHttpError(f"{e} for {url}") from e
 
 
 class CapabilityNotSupported(Exception):
@@ -37,19 +202,32 @@ class CapabilityNotSupported(Exception):
 
 
 def requires_capability(feature: str):
+    def check_capability(self):
+        if feature not in self.capabilities:
+            # Client name is derived from the module
+            module_path = self.__module__.split(".")
+            try:
+                client_name = module_path[module_path.index("adapters") + 1]
+            except (ValueError, IndexError):
+                client_name = self.__class__.__name__
+
+            raise CapabilityNotSupported(
+                f"Functionality '{feature}' is nos supported by {client_name}"
+            )
+
     def decorator(func):
-        def wrapper(self, *args, **kwargs):
-            if feature not in self.capabilities:
-                # Client name is derived from the module
-                module_path = self.__module__.split(".")
-                try:
-                    client_name = module_path[module_path.index("adapters") + 1]
-                except (ValueError, IndexError):
-                    client_name = self.__class__.__name__
+        if inspect.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def async_wrapper(self, *args, **kwargs):
+                check_capability(self)
+                return await func(self, *args, **kwargs)
+
+            return async_wrapper
 
-                raise CapabilityNotSupported(
-                    f"Functionality '{feature}' is nos supported by {client_name}"
-                )
+        @functools.wraps(func)
+        def wrapper(self, *args, **kwargs):
+            check_capability(self)
             return func(self, *args, **kwargs)
 
         return wrapper
@@ -63,11 +241,14 @@ class CoreHttpError(Exception):
 
 # Monitoring Event Methods
 def monitoring_event_post(
-    base_url: str, scs_as_id: str, model_payload: BaseModel
+    base_url: str,
+    scs_as_id: str,
+    model_payload: BaseModel,
+    session: requests.Session | None = None,
 ) -> dict:
-    data = model_payload.model_dump_json(exclude_none=True, by_alias=True)
     url = monitoring_event_build_url(base_url, scs_as_id)
-    return _make_request("POST", url, data=data)
+    data = _serialize("POST", url, model_payload, by_alias=True)
+    return _make_request("POST", url, data=data, session=session)
 
 
 def monitoring_event_build_url(base_url: str, scs_as_id: str, session_id: str = None):
@@ -80,21 +261,34 @@ def monitoring_event_build_url(base_url: str, scs_as_id: str, session_id: str =
 
 # QoD methods
 def as_session_with_qos_post(
-    base_url: str, scs_as_id: str, model_payload: BaseModel
+    base_url: str,
+    scs_as_id: str,
+    model_payload: BaseModel,
+    session: requests.Session | None = None,
 ) -> dict:
-    data = model_payload.model_dump_json(exclude_none=True, by_alias=True)
     url = as_session_with_qos_build_url(base_url, scs_as_id)
-    return _make_request("POST", url, data=data)
+    data = _serialize("POST", url, model_payload, by_alias=True)
+    return _make_request("POST", url, data=data, session=session)
 
 
-def as_session_with_qos_get(base_url: str, scs_as_id: str, session_id: str) -> dict:
+def as_session_with_qos_get(
+    base_url: str,
+    scs_as_id: str,
+    session_id: str,
+    session: requests.Session | None = None,
+) -> dict:
     url = as_session_with_qos_build_url(base_url, scs_as_id, session_id)
-    return _make_request("GET", url)
+    return _make_request("GET", url, session=session)
 
 
-def as_session_with_qos_delete(base_url: str, scs_as_id: str, session_id: str):
+def as_session_with_qos_delete(
+    base_url: str,
+    scs_as_id: str,
+    session_id: str,
+    session: requests.Session | None = None,
+):
     url = as_session_with_qos_build_url(base_url, scs_as_id, session_id)
-    return _make_request("DELETE", url)
+    return _make_request("DELETE", url, session=session)
 
 
 def as_session_with_qos_build_url(
@@ -109,36 +303,66 @@ def as_session_with_qos_build_url(
 
 # Traffic Influence Methods
 def traffic_influence_post(
-    base_url: str, scs_as_id: str, model_payload: BaseModel
+    base_url: str,
+    scs_as_id: str,
+    model_payload: BaseModel,
+    session: requests.Session | None = None,
 ) -> dict:
-    data = model_payload.model_dump_json(exclude_none=True)
     url = traffic_influence_build_url(base_url, scs_as_id)
-    return _make_request("POST", url, data=data)
+    data = _serialize("POST", url, model_payload)
+    return _make_request("POST", url, data=data, session=session)
 
 
-def traffic_influence_delete(base_url: str, scs_as_id: str, session_id: str):
+def traffic_influence_delete(
+    base_url: str,
+    scs_as_id: str,
+    session_id: str,
+    session: requests.Session | None = None,
+):
     url = traffic_influence_build_url(base_url, scs_as_id, session_id)
-    return _make_request("DELETE", url)
+    return _make_request("DELETE", url, session=session)
 
 
 def traffic_influence_put(
-    base_url: str, scs_as_id: str, session_id: str, model_payload: BaseModel
+    base_url: str,
+    scs_as_id: str,
+    session_id: str,
+    model_payload: BaseModel,
+    session: requests.Session | None = None,
 ) -> dict:
-    data = model_payload.model_dump_json(exclude_none=True)
     url = traffic_influence_build_url(base_url, scs_as_id, session_id)
-    return _make_request("PUT", url, data=data)
+    data = _serialize("PUT", url, model_payload)
+    return _make_request("PUT", url, data=data, session=session)
 
 
-def traffic_influence_get(base_url: str, scs_as_id: str, sessionId: str = None) -> dict:
+def traffic_influence_get(
+    base_url: str,
+    scs_as_id: str,
+    sessionId: str = None,
+    session: requests.Session | None = None,
+) -> dict:
     url = traffic_influence_build_url(base_url, scs_as_id, sessionId)
-    return _make_request("GET", url)
+    return _make_request("GET", url, session=session)
 
 
 def traffic_influence_get_all(
-    base_url: str, scs_as_id: str, sessionId: str = None
+    base_url: str,
+    scs_as_id: str,
+    sessionId: str = None,
+    session: requests.Session | None = None,
 ) -> list[dict]:
     url = traffic_influence_build_url(base_url, scs_as_id)
-    return _make_request("GET", url)
+    return _make_request("GET", url, session=session)
+
+
+def traffic_influence_iter(
+    base_url: str,
+    scs_as_id: str,
+    params: dict | None = None,
+    session: requests.Session | None = None,
+) -> Iterator[dict]:
+    url = traffic_influence_build_url(base_url, scs_as_id)
+    return _iter_request("GET", url, params=params, session=session)
 
 
 def traffic_influence_build_url(base_url: str, scs_as_id: str, session_id: str = None):
@@ -0,0 +1,294 @@
+# -*- coding: utf-8 -*-
+"""
+Tracks the expiration of QoD sessions, deleting or renewing them just before
+the NEF expires them.
+"""
+import heapq
+import math
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Callable, Dict, List
+
+from sunrise6g_opensdk import logger
+from sunrise6g_opensdk.network.core import schemas
+
+log = logger.get_logger(__name__)
+
+DEFAULT_LEAD_TIME = 5.0
+DEFAULT_TICK = 1.0
+
+_CREATE_SESSION_FIELDS = tuple(schemas.CreateSession.model_fields)
+
+# Called with the expired session and its replacement, None unless renewed
+ExpiryCallback = Callable[[Dict, Dict | None], None]
+
+
+@dataclass(slots=True)
+class _TrackedSession:
+    due: float
+    renew: bool
+    on_expiry: ExpiryCallback | None
+    # Only kept when needed to renew the session or to notify its expiry
+    session: Dict | None
+
+
+class QodSessionLifetimeManager:
+    """
+    Deletes or renews the QoD sessions of a network client before they expire.
+
+    Sessions are kept in a timer heap keyed by the tick in which they are due,
+    'lead_time' seconds before their expiration. The sessions due in the same
+    tick are handled together: renewals are created, then expired sessions
+    deleted, through the concurrent batch operations of the client.
+
+    The manager is driven by a background thread between start() and stop(),
+    or by calling run_due() directly.
+
+    args:
+        client: Network client owning the sessions.
+        lead_time: Seconds before the expiration of a session to handle it.
+        tick: Granularity in seconds of the timer, sessions due in the same
+              tick are batched.
+        max_in_flight: Maximum number of concurrent NEF requests of a batch.
+                       Defaults to the connection pool size of the client.
+        clock: Monotonic time source, in seconds.
+    """
+
+    def __init__(
+        self,
+        client,
+        lead_time: float = DEFAULT_LEAD_TIME,
+        tick: float = DEFAULT_TICK,
+        max_in_flight: int | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if lead_time < 0:
+            raise ValueError("lead_time must not be negative.")
+        if tick <= 0:
+            raise ValueError("tick must be positive.")
+        self.client = client
+        self.lead_time = lead_time
+        self.tick = tick
+        self.max_in_flight = max_in_flight
+        self._clock = clock
+        self._condition = threading.Condition()
+        # (due, session_id); entries of untracked or rescheduled sessions are
+        # skipped when popped
+        self._heap: List[tuple] = []
+        self._sessions: Dict[str, _TrackedSession] = {}
+        self._thread: threading.Thread | None = None
+        self._stopping = False
+        self.deleted = 0
+        self.renewed = 0
+        self.failed = 0
+        self.batches = 0
+
+    @property
+    def active_sessions(self) -> int:
+        """Number of sessions currently tracked."""
+        return len(self._sessions)
+
+    def stats(self) -> Dict:
+        with self._condition:
+            return {
+                "active": len(self._sessions),
+                "deleted": self.deleted,
+                "renewed": self.renewed,
+                "failed": self.failed,
+                "batches": self.batches,
+            }
+
+    def track(
+        self,
+        session: Dict,
+        renew: bool = False,
+        on_expiry: ExpiryCallback | None = None,
+    ) -> None:
+        """
+        Schedules a session, as returned by the client, for its expiration.
+
+        The expiration is read from 'expiresAt', or else computed from the
+        session 'duration' counted from now. Tracking an already tracked
+        session reschedules it.
+
+        args:
+            session: QoD session details, including 'sessionId'.
+            renew: Whether to replace the session by a new one with the same
+                   parameters, instead of only deleting it.
+            on_expiry: Called once the session is deleted, with the session
+                       and its replacement (None unless renewed).
+        """
+        session_id = str(session["sessionId"])
+        due = self._due(self._expires_in(session))
+        tracked = _TrackedSession(
+            due=due,
+            renew=renew,
+            on_expiry=on_expiry,
+            session=session if renew or on_expiry else None,
+        )
+        with self._condition:
+            self._sessions[session_id] = tracked
+            earliest = not self._heap or due < self._heap[0][0]
+            heapq.heappush(self._heap, (due, session_id))
+            self._compact()
+            if earliest:
+                self._condition.notify()
+
+    def untrack(self, session_id: str) -> bool:
+        """
+        Stops tracking a session, e.g. after deleting it.
+
+        returns:
+            Whether the session was tracked.
+        """
+        with self._condition:
+            return self._sessions.pop(str(session_id), None) is not None
+
+    def run_due(self) -> int:
+        """
+        Deletes or renews the sessions due by now.
+
+        returns:
+            The number of sessions handled.
+        """
+        now = self._clock()
+        due = []
+        with self._condition:
+            while self._heap and self._heap[0][0] <= now:
+                scheduled, session_id = heapq.heappop(self._heap)
+                tracked = self._sessions.get(session_id)
+                if tracked is not None and tracked.due == scheduled:
+                    del self._sessions[session_id]
+                    due.append((session_id, tracked))
+        if due:
+            self._expire(due)
+        return len(due)
+
+    def start(self) -> "QodSessionLifetimeManager":
+        with self._condition:
+            if self._thread is None:
+                self._stopping = False
+                self._thread = threading.Thread(
+                    target=self._run, name="qod-session-lifetime", daemon=True
+                )
+                self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """
+        Stops the background thread. Tracked sessions are left untouched.
+        """
+        with self._condition:
+            thread, self._thread = self._thread, None
+            self._stopping = True
+            self._condition.notify()
+        if thread is not None:
+            thread.join()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+    def _expires_in(self, session: Dict) -> float:
+        expires_at = session.get("expiresAt")
+        if expires_at is not None:
+            if isinstance(expires_at, str):
+                # fromisoformat only accepts the "Z" suffix since Python 3.11
+                expires_at = datetime.fromisoformat(expires_at.replace("Z", "+00:00"))
+            if expires_at.tzinfo is None:
+                # Naive date-times are taken as UTC, as CAMARA ones are
+                expires_at = expires_at.replace(tzinfo=timezone.utc)
+            return (expires_at - datetime.now(timezone.utc)).total_seconds()
+        duration = session.get("duration")
+        if duration is None:
+            raise ValueError(
+                f"QoD session {session['sessionId']} has neither duration nor expiresAt."
+            )
+        return float(getattr(duration, "root", duration))
+
+    def _due(self, expires_in: float) -> float:
+        # Rounded down to the tick, so every session of a batch is handled
+        # before its expiration
+        due = self._clock() + expires_in - self.lead_time
+        return math.floor(due / self.tick) * self.tick
+
+    def _compact(self) -> None:
+        # Drops the entries left by untracked or rescheduled sessions once they
+        # outnumber the live ones
+        if len(self._heap) > 2 * len(self._sessions) + 64:
+            self._heap = [
+                (due, session_id)
+                for due, session_id in self._heap
+                if session_id in self._sessions
+                and self._sessions[session_id].due == due
+            ]
+            heapq.heapify(self._heap)
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                if self._stopping:
+                    return
+                if self._heap:
+                    timeout = max(self._heap[0][0] - self._clock(), 0)
+                else:
+                    timeout = None
+                if timeout is None or timeout > 0:
+                    self._condition.wait(timeout)
+                    continue
+            try:
+                self.run_due()
+            except Exception as e:
+                log.error("QoD session lifetime batch failed: %s", e)
+
+    def _expire(self, due: List[tuple]) -> None:
+        replacements = {}
+        to_renew = [(i, tracked) for i, tracked in due if tracked.renew]
+        if to_renew:
+            batch = self.client.create_qod_sessions(
+                [
+                    {
+                        field: tracked.session[field]
+                        for field in _CREATE_SESSION_FIELDS
+                        if tracked.session.get(field) is not None
+                    }
+                    for _, tracked in to_renew
+                ],
+                max_in_flight=self.max_in_flight,
+            )
+            for (session_id, tracked), item in zip(to_renew, batch.items):
+                if item.ok:
+                    replacements[session_id] = item.result
+                    self.track(item.result, renew=True, on_expiry=tracked.on_expiry)
+                else:
+                    log.warning(
+                        "QoD session renewal failed [id=%s]: %s", session_id, item.error
+                    )
+
+        session_ids = [session_id for session_id, _ in due]
+        batch = self.client.delete_qod_sessions(
+            session_ids, max_in_flight=self.max_in_flight
+        )
+        for index, error in batch.errors.items():
+            log.warning(
+                "QoD session deletion failed [id=%s]: %s", session_ids[index], error
+            )
+        with self._condition:
+            self.batches += 1
+            self.renewed += len(replacements)
+            self.deleted += batch.stats.succeeded
+            self.failed += batch.stats.failed + len(to_renew) - len(replacements)
+
+        for session_id, tracked in due:
+            if tracked.on_expiry is None:
+                continue
+            try:
+                tracked.on_expiry(tracked.session, replacements.get(session_id))
+            except Exception as e:
+                log.error(
+                    "QoD session expiry callback failed [id=%s]: %s", session_id, e
+                )
@@ -0,0 +1,469 @@
+# -*- coding: utf-8 -*-
+"""
+Network client spreading the CAMARA calls over several NEFs.
+"""
+import bisect
+import hashlib
+import ipaddress
+import threading
+import time
+from itertools import chain
+from typing import Callable, Dict, Iterator, List
+
+import requests
+from urllib3.exceptions import NewConnectionError
+
+from sunrise6g_opensdk import logger
+from sunrise6g_opensdk.common.batch import BatchResult, run_batch
+from sunrise6g_opensdk.common.cache import TTLCache
+from sunrise6g_opensdk.common.resilience import (
+    DEFAULT_RESET_TIMEOUT,
+    CircuitBreaker,
+    CircuitOpenError,
+)
+from sunrise6g_opensdk.common.sdk import Sdk
+from sunrise6g_opensdk.network.core import schemas
+from sunrise6g_opensdk.network.core.base_network_client import BaseNetworkClient
+from sunrise6g_opensdk.network.core.common import CapabilityNotSupported, CoreHttpError
+
+log = logger.get_logger(__name__)
+
+DEFAULT_VIRTUAL_NODES = 64
+# Owners forgotten are looked up again in every NEF
+DEFAULT_OWNER_TTL = 24 * 3600  # seconds
+DEFAULT_OWNER_CACHE_SIZE = 64 * 1024
+
+
+def _as_device(device: schemas.Device | Dict) -> schemas.Device:
+    if isinstance(device, schemas.Device):
+        return device
+    return schemas.Device.model_validate(device)
+
+
+def device_key(device: schemas.Device | Dict | None) -> str | None:
+    """
+    Returns the identifier of a device placing it on the hash ring: its phone
+    number, network access identifier, public IPv4 address or IPv6 address.
+    """
+    if device is None:
+        return None
+    device = _as_device(device)
+    if device.phoneNumber is not None:
+        return device.phoneNumber.root
+    if device.networkAccessIdentifier is not None:
+        return device.networkAccessIdentifier.root
+    if device.ipv4Address is not None:
+        return str(device.ipv4Address.root.publicAddress.root)
+    if device.ipv6Address is not None:
+        return str(device.ipv6Address.root)
+    return None
+
+
+def device_address(device: schemas.Device | Dict | None) -> str | None:
+    """
+    Returns the IP address of a device matched against the NEF subnets: its
+    public IPv4 address or IPv6 address, whatever its other identifiers.
+    """
+    if device is None:
+        return None
+    device = _as_device(device)
+    if device.ipv4Address is not None:
+        return str(device.ipv4Address.root.publicAddress.root)
+    if device.ipv6Address is not None:
+        return str(device.ipv6Address.root)
+    return None
+
+
+def _was_not_sent(error: CoreHttpError) -> bool:
+    # The NEF was never reached: the connection was refused or the circuit open
+    cause = error.__cause__
+    if isinstance(cause, (CircuitOpenError, requests.exceptions.ConnectTimeout)):
+        return True
+    if isinstance(cause, requests.exceptions.ConnectionError) and cause.args:
+        reason = getattr(cause.args[0], "reason", cause.args[0])
+        return isinstance(reason, NewConnectionError)
+    return False
+
+
+def _is_client_error(error: CoreHttpError) -> bool:
+    # The request itself was rejected: another NEF would reject it as well
+    cause = error.__cause__
+    if isinstance(cause, requests.exceptions.HTTPError) and cause.response is not None:
+        return 400 <= cause.response.status_code < 500
+    return False
+
+
+def _is_not_found(error: CoreHttpError) -> bool:
+    cause = error.__cause__
+    return (
+        isinstance(cause, requests.exceptions.HTTPError)
+        and cause.response is not None
+        and cause.response.status_code == 404
+    )
+
+
+class RoutingNetworkClient:
+    """
+    Exposes the CAMARA methods of the network clients over several NEFs.
+
+    Requests about a device go to the NEF serving the subnet of its IP address,
+    or else to the NEF picked by consistent hashing of its identifier, so each
+    NEF keeps the same share of devices when others are added or removed.
+    Sessions and resources are then handled by the NEF that created them.
+
+    A NEF failing with a CoreHttpError other than a rejection of the request
+    (4xx) is considered unhealthy for 'cooldown' seconds, as is a NEF whose
+    circuit breaker is open. Its requests fail over to the next healthy NEF on
+    the hash ring, spreading them over the remaining NEFs. Creations only fail
+    over when the request never reached the NEF, which may otherwise have
+    created the session or resource already.
+
+    The NEF owning each session and resource is remembered for 'owner_ttl'
+    seconds, up to 'owner_cache_size' of them. Forgotten owners are looked up
+    again in every NEF.
+
+    args:
+        clients: Network clients, by NEF name.
+        subnets: UE IP subnets served by each NEF, by NEF name.
+        virtual_nodes: Points of each NEF on the hash ring.
+        cooldown: Seconds a failing NEF is skipped for.
+        clock: Monotonic time source, in seconds.
+        owner_ttl: Seconds the owner of a session or resource is remembered.
+        owner_cache_size: Maximum number of owners remembered.
+    """
+
+    def __init__(
+        self,
+        clients: Dict[str, BaseNetworkClient],
+        subnets: Dict[str, List[str]] | None = None,
+        virtual_nodes: int = DEFAULT_VIRTUAL_NODES,
+        cooldown: float = DEFAULT_RESET_TIMEOUT,
+        clock: Callable[[], float] = time.monotonic,
+        owner_ttl: float = DEFAULT_OWNER_TTL,
+        owner_cache_size: int = DEFAULT_OWNER_CACHE_SIZE,
+    ):
+        if not clients:
+            raise ValueError("At least one network client is required.")
+        if virtual_nodes < 1:
+            raise ValueError("virtual_nodes must be positive.")
+        self.clients = dict(clients)
+        self.cooldown = cooldown
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._unhealthy_until: Dict[str, float] = {}
+        self.failovers = 0
+        # Names of the NEFs owning each session and resource ID
+        self._owners = TTLCache(owner_ttl, maxsize=owner_cache_size, clock=clock)
+
+        self._subnets = []
+        for name, networks in (subnets or {}).items():
+            if name not in self.clients:
+                raise ValueError(f"Unknown network client '{name}' in subnets.")
+            for network in networks:
+                self._subnets.append((ipaddress.ip_network(network), name))
+        # Longest prefix first
+        self._subnets.sort(key=lambda subnet: subnet[0].prefixlen, reverse=True)
+
+        self._ring = sorted(
+            (self._hash(f"{name}#{node}"), name)
+            for name in self.clients
+            for node in range(virtual_nodes)
+        )
+        self._ring_hashes = [point for point, _ in self._ring]
+
+    @classmethod
+    def from_adapter_specs(
+        cls, adapter_specs: Dict[str, Dict], **kwargs
+    ) -> "RoutingNetworkClient":
+        """
+        Creates the network clients from their specifications, by NEF name.
+
+        args:
+            adapter_specs: Network adapter specifications as given to
+                           Sdk.create_adapters_from under 'network', by NEF name.
+            kwargs: Other arguments of RoutingNetworkClient.
+        """
+        clients = {
+            name: Sdk.create_adapters_from({"network": spec})["network"]
+            for name, spec in adapter_specs.items()
+        }
+        return cls(clients, **kwargs)
+
+    @property
+    def capabilities(self) -> set:
+        return set().union(*(client.capabilities for client in self.clients.values()))
+
+    @staticmethod
+    def _hash(key: str) -> int:
+        return int.from_bytes(hashlib.md5(key.encode()).digest()[:8], "big")
+
+    def route(self, key: str | None, address: str | None = None) -> List[str]:
+        """
+        Returns the NEF names in the order they are tried for a device: the NEF
+        serving the subnet of its IP address, then the NEFs following its key
+        on the hash ring.
+
+        args:
+            key: Device key, as returned by device_key.
+            address: Device IP address, as returned by device_address. The key
+                     is used when it is an IP address itself.
+        """
+        names = []
+        address = address if address is not None else key
+        if address is not None:
+            try:
+                address = ipaddress.ip_address(address)
+            except ValueError:
+                address = None
+            if address is not None:
+                for network, name in self._subnets:
+                    if address.version == network.version and address in network:
+                        names.append(name)
+                        break
+        start = bisect.bisect(self._ring_hashes, self._hash(key or ""))
+        for i in range(len(self._ring)):
+            name = self._ring[(start + i) % len(self._ring)][1]
+            if name not in names:
+                names.append(name)
+                if len(names) == len(self.clients):
+                    break
+        return names
+
+    def is_healthy(self, name: str) -> bool:
+        with self._lock:
+            until = self._unhealthy_until.get(name)
+        if until is not None and until > self._clock():
+            return False
+        client = self.clients[name]
+        breaker = (
+            client.resilience.breaker_for(client.base_url)
+            if client.resilience is not None
+            else None
+        )
+        return breaker is None or breaker.state != CircuitBreaker.OPEN
+
+    def health(self) -> Dict[str, bool]:
+        """Returns whether each NEF is currently considered healthy."""
+        return {name: self.is_healthy(name) for name in self.clients}
+
+    def _mark_unhealthy(self, name: str, error: Exception) -> None:
+        log.warning("NEF '%s' failed, failing over [error=%s]", name, error)
+        with self._lock:
+            self._unhealthy_until[name] = self._clock() + self.cooldown
+            self.failovers += 1
+
+    def _capable(self, feature: str, names: List[str] | None = None) -> List[str]:
+        names = [
+            name
+            for name in (self.clients if names is None else names)
+            if feature in self.clients[name].capabilities
+        ]
+        if not names:
+            raise CapabilityNotSupported(
+                f"Functionality '{feature}' is not supported by any network client"
+            )
+        return names
+
+    def _candidates(
+        self, device: schemas.Device | Dict | None, feature: str
+    ) -> List[str]:
+        names = self._capable(
+            feature, self.route(device_key(device), device_address(device))
+        )
+        healthy = [name for name in names if self.is_healthy(name)]
+        # With every NEF unhealthy, they are all tried anyway
+        return healthy or names
+
+    def _create(
+        self, device: schemas.Device | Dict | None, feature: str, method: str, *args
+    ):
+        """
+        Calls the creation 'method' on the NEF routed for 'device', failing
+        over when a NEF could not be reached.
+
+        Other errors are raised after marking the NEF unhealthy: the NEF may
+        have created the session or resource, so creating it on another NEF
+        could duplicate it.
+
+        returns:
+            The name of the NEF that answered and its result.
+        """
+        error = None
+        for name in self._candidates(device, feature):
+            try:
+                return name, getattr(self.clients[name], method)(*args)
+            except CoreHttpError as e:
+                if _is_client_error(e):
+                    raise
+                self._mark_unhealthy(name, e)
+                if not _was_not_sent(e):
+                    raise
+                error = e
+        raise error
+
+    def _call_owner(self, resource_id: str, feature: str, method: str, *args):
+        """
+        Calls 'method' on the NEF owning 'resource_id'. Unknown resources are
+        looked up in every NEF supporting 'feature', healthy ones first.
+
+        A resource is only reported not found when every NEF answered so: the
+        error of a NEF that failed is raised instead, as it may own it.
+        """
+        owner = self._owners.get(str(resource_id))
+        if owner is not None:
+            try:
+                return owner, getattr(self.clients[owner], method)(resource_id, *args)
+            except CoreHttpError as e:
+                if _is_not_found(e):
+                    self._owners.invalidate(str(resource_id))
+                raise
+        names = sorted(self._capable(feature), key=lambda n: not self.is_healthy(n))
+        not_found = error = None
+        for name in names:
+            try:
+                result = getattr(self.clients[name], method)(resource_id, *args)
+            except CoreHttpError as e:
+                if _is_not_found(e):
+                    not_found = e
+                    continue
+                if not _is_client_error(e):
+                    self._mark_unhealthy(name, e)
+                error = error or e
+                continue
+            self._owners.set(str(resource_id), name)
+            return name, result
+        raise error or not_found
+
+    def stats(self) -> Dict:
+        return {
+            "failovers": self.failovers,
+            "health": self.health(),
+            "owned": len(self._owners),
+        }
+
+    def close(self) -> None:
+        for client in self.clients.values():
+            client.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    # QoD
+    def create_qod_session(self, session_info: Dict) -> Dict:
+        valid_session_info = schemas.CreateSession.model_validate(session_info)
+        name, created = self._create(
+            valid_session_info.device,
+            "qod",
+            "create_qod_session",
+            session_info,
+        )
+        self._owners.set(str(created["sessionId"]), name)
+        return created
+
+    def get_qod_session(self, session_id: str) -> Dict:
+        return self._call_owner(session_id, "qod", "get_qod_session")[1]
+
+    def delete_qod_session(self, session_id: str) -> None:
+        try:
+            self._call_owner(session_id, "qod", "delete_qod_session")
+        finally:
+            self._owners.invalidate(str(session_id))
+
+    def create_qod_sessions(
+        self, list_of_session_info: List[Dict], max_in_flight: int | None = None
+    ) -> BatchResult:
+        return run_batch(
+            self.create_qod_session,
+            list_of_session_info,
+            max_in_flight or self._pool_maxsize(),
+        )
+
+    def delete_qod_sessions(
+        self, session_ids: List[str], max_in_flight: int | None = None
+    ) -> BatchResult:
+        return run_batch(
+            self.delete_qod_session, session_ids, max_in_flight or self._pool_maxsize()
+        )
+
+    def handle_qod_notification(
+        self, notification: Dict
+    ) -> schemas.UserPlaneNotificationData:
+        valid_notification = schemas.UserPlaneNotificationData.model_validate(
+            notification
+        )
+        owner = self._owners.get(valid_notification.subscription_id)
+        # Unknown owners: every NEF is notified, healthy or not
+        names = [owner] if owner is not None else self._capable("qod")
+        for name in names:
+            self.clients[name].handle_qod_notification(notification)
+        return valid_notification
+
+    def _pool_maxsize(self) -> int:
+        return sum(client.pool_maxsize for client in self.clients.values())
+
+    # Traffic Influence
+    def create_traffic_influence_resource(self, traffic_influence_info: Dict) -> Dict:
+        name, created = self._create(
+            traffic_influence_info.get("device"),
+            "traffic_influence",
+            "create_traffic_influence_resource",
+            traffic_influence_info,
+        )
+        if created.get("trafficInfluenceID") is not None:
+            self._owners.set(str(created["trafficInfluenceID"]), name)
+        return created
+
+    def put_traffic_influence_resource(
+        self, resource_id: str, traffic_influence_info: Dict
+    ) -> Dict:
+        return self._call_owner(
+            resource_id,
+            "traffic_influence",
+            "put_traffic_influence_resource",
+            traffic_influence_info,
+        )[1]
+
+    def delete_traffic_influence_resource(self, resource_id: str) -> None:
+        try:
+            self._call_owner(
+                resource_id, "traffic_influence", "delete_traffic_influence_resource"
+            )
+        finally:
+            self._owners.invalidate(str(resource_id))
+
+    def get_individual_traffic_influence_resource(self, resource_id: str) -> Dict:
+        return self._call_owner(
+            resource_id,
+            "traffic_influence",
+            "get_individual_traffic_influence_resource",
+        )[1]
+
+    def iter_traffic_influence_resources(
+        self, page_size: int | None = None
+    ) -> Iterator[schemas.CreateTrafficInfluence]:
+        """
+        Lazily iterates over the Traffic Influence resources of every NEF,
+        unhealthy ones included. A NEF failing to list its resources raises
+        its error rather than yielding a partial listing.
+        """
+        return chain.from_iterable(
+            self.clients[name].iter_traffic_influence_resources(page_size)
+            for name in self._capable("traffic_influence")
+        )
+
+    def get_all_traffic_influence_resource(self) -> list[Dict]:
+        return list(self.iter_traffic_influence_resources())
+
+    # Location
+    def create_monitoring_event_subscription(
+        self, retrieve_location_request: schemas.RetrievalLocationRequest
+    ) -> schemas.Location:
+        return self._create(
+            retrieve_location_request.device,
+            "location_retrieval",
+            "create_monitoring_event_subscription",
+            retrieve_location_request,
+        )[1]
@@ -7,18 +7,12 @@ import ipaddress
 from datetime import datetime
 from enum import Enum
 from ipaddress import IPv4Address, IPv6Address
-from typing import Annotated, Literal
+from typing import Annotated, Generic, Literal
 from uuid import UUID
 
-from pydantic import (
-    AnyHttpUrl,
-    AnyUrl,
-    BaseModel,
-    ConfigDict,
-    Field,
-    NonNegativeInt,
-    RootModel,
-)
+import pydantic
+from pydantic import AnyHttpUrl, AnyUrl, ConfigDict, Field, NonNegativeInt
+from pydantic.root_model import RootModelRootType
 from pydantic_extra_types.mac_address import MacAddress
 
 from sunrise6g_opensdk.logger import setup_logger
@@ -27,6 +21,16 @@ from sunrise6g_opensdk.network.adapters.errors import NetworkPlatformError
 log = setup_logger(__name__)
 
 
+# Validators and serializers of the models below are built on their first use
+# instead of at import time, so processes only pay for the models they use.
+class BaseModel(pydantic.BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+
+class RootModel(pydantic.RootModel[RootModelRootType], Generic[RootModelRootType]):
+    model_config = ConfigDict(defer_build=True)
+
+
 class FlowDirection(Enum):
     """
     DOWNLINK: The corresponding filter applies for traffic to the UE.
@@ -188,6 +192,49 @@ class AsSessionWithQoSSubscription(BaseModel):
         return subscription_id
 
 
+class UserPlaneEvent(str, Enum):
+    SESSION_TERMINATION = "SESSION_TERMINATION"
+    LOSS_OF_BEARER = "LOSS_OF_BEARER"
+    RECOVERY_OF_BEARER = "RECOVERY_OF_BEARER"
+    RELEASE_OF_BEARER = "RELEASE_OF_BEARER"
+    USAGE_REPORT = "USAGE_REPORT"
+    FAILED_RESOURCES_ALLOCATION = "FAILED_RESOURCES_ALLOCATION"
+    SUCCESSFUL_RESOURCES_ALLOCATION = "SUCCESSFUL_RESOURCES_ALLOCATION"
+    QOS_GUARANTEED = "QOS_GUARANTEED"
+    QOS_NOT_GUARANTEED = "QOS_NOT_GUARANTEED"
+    QOS_MONITORING = "QOS_MONITORING"
+    ACCESS_TYPE_CHANGE = "ACCESS_TYPE_CHANGE"
+    PLMN_CHG = "PLMN_CHG"
+
+
+class UserPlaneEventReport(BaseModel):
+    event: UserPlaneEvent
+    accumulatedUsage: dict | None = None
+    flowIds: list[int] | None = Field(None, min_length=1)
+    appliedQosRef: str | None = None
+
+
+class UserPlaneNotificationData(BaseModel):
+    """
+    Notification sent by the NEF about an AS session with QoS subscription.
+    """
+
+    transaction: Link = Field(
+        ..., description="Link of the subscription the notification refers to."
+    )
+    eventReports: list[UserPlaneEventReport] = Field(..., min_length=1)
+
+    @property
+    def subscription_id(self) -> str:
+        """
+        Returns the subscription ID, the last segment of the transaction link.
+        """
+        subscription_id = self.transaction.root.rstrip("/").split("/")[-1]
+        if not subscription_id:
+            raise NetworkPlatformError("QoS session ID not found in notification")
+        return subscription_id
+
+
 class SourceTrafficFilters(BaseModel):
     sourcePort: int
 
@@ -204,6 +251,7 @@ class TrafficRoute(BaseModel):
 class TrafficInfluSub(BaseModel):  # Replace with a meaningful name
     afServiceId: str | None = None
     afAppId: str
+    afTransId: str | None = None
     dnn: str | None = None
     snssai: Snssai | None = None
     trafficFilters: list[FlowInfo] | None = Field(
@@ -238,6 +286,31 @@ class TrafficInfluSub(BaseModel):  # Replace with a meaningful name
         self.snssai = Snssai(sst=sst, sd=sd)
 
 
+class DnaiChangeType(str, Enum):
+    EARLY = "EARLY"
+    EARLY_LATE = "EARLY_LATE"
+    LATE = "LATE"
+
+
+class TrafficInfluenceNotification(BaseModel):
+    """
+    UP path change notification sent by the NEF about a traffic influence subscription.
+    """
+
+    afTransId: str | None = Field(
+        None, description="AF transaction ID of the related subscription."
+    )
+    dnaiChgType: DnaiChangeType
+    sourceDnai: str | None = None
+    targetDnai: str | None = None
+    sourceTrafRoute: dict | None = None
+    targetTrafRoute: dict | None = None
+    sourceUeIpv4Addr: IPv4Address | None = None
+    targetUeIpv4Addr: IPv4Address | None = None
+    sourceUeIpv6Prefix: str | None = None
+    targetUeIpv6Prefix: str | None = None
+
+
 # Monitoring Event API
 
 
@@ -0,0 +1,325 @@
+# -*- coding: utf-8 -*-
+"""
+Lightweight local NEF stand-in.
+
+Implements the subset of the TS 29.122 northbound APIs targeted by
+network/core/common.py, keeping every subscription in memory:
+
+    /3gpp-as-session-with-qos/v1/{scsAsId}/subscriptions[/{subscriptionId}]
+    /3gpp-traffic-influence/v1/{scsAsId}/subscriptions[/{subscriptionId}]
+    /3gpp-monitoring-event/v1/{scsAsId}/subscriptions[/{subscriptionId}]
+
+Collections can be paged with the 'offset' and 'limit' query parameters.
+Latency and error injection make it usable both for functional tests and for
+load benchmarks of the network adapters without a real 5G core:
+
+    python -m sunrise6g_opensdk.network.nef_emulator --port 8080 --latency 0.005
+"""
+import argparse
+import json
+import random
+import re
+import sys
+import threading
+import time
+import uuid
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict
+from urllib.parse import parse_qs, urlsplit
+
+SUPPORTED_APIS = (
+    "3gpp-as-session-with-qos",
+    "3gpp-traffic-influence",
+    "3gpp-monitoring-event",
+)
+
+_PATH_PATTERN = re.compile(
+    r"^/(?P<api>[\w-]+)/v1/(?P<scs_as_id>[^/]+)/subscriptions"
+    r"(?:/(?P<subscription_id>[^/?]+))?/?(?:\?.*)?$"
+)
+
+# Fixed polygon reported for every location request
+_LOCATION_POLYGON = [
+    {"lat": 41.3879, "lon": 2.1699},
+    {"lat": 41.3889, "lon": 2.1709},
+    {"lat": 41.3869, "lon": 2.1719},
+]
+
+
+class _NefServer(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 1024
+
+    def handle_error(self, request, client_address):
+        # Clients giving up on slow (latency injected) requests are expected
+        if not isinstance(sys.exc_info()[1], ConnectionError):
+            super().handle_error(request, client_address)
+
+
+class _NefRequestHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Headers and body are written separately, avoid delayed-ACK stalls
+    disable_nagle_algorithm = True
+    server: _NefServer
+
+    def log_message(self, format, *args):
+        pass
+
+    def _reply(self, status: int, payload=None):
+        body = json.dumps(payload).encode() if payload is not None else b""
+        self.send_response(status)
+        if body:
+            self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _problem(self, status: int, title: str):
+        self._reply(status, {"status": status, "title": title})
+
+    def _read_body(self):
+        length = self.headers.get("Content-Length") or "0"
+        if not (length.isascii() and length.isdigit()):
+            # The end of the body is unknown, the connection cannot be reused
+            self.close_connection = True
+            raise ValueError(f"Invalid Content-Length: {length}")
+        length = int(length)
+        body = json.loads(self.rfile.read(length)) if length else None
+        if body is not None and not isinstance(body, dict):
+            raise ValueError("The body is not a JSON object")
+        return body
+
+    def _handle(self, method: str):
+        emulator: NefEmulator = self.server.emulator
+        try:
+            body = self._read_body() if method in ("POST", "PUT") else None
+        except ValueError as e:
+            # json.JSONDecodeError included
+            return self._problem(400, f"Malformed body: {e}")
+        match = _PATH_PATTERN.match(self.path)
+        if match is None or match["api"] not in SUPPORTED_APIS:
+            return self._problem(404, "Resource not found")
+
+        injected_error = emulator._next_injected_error()
+        emulator._delay()
+        if injected_error is not None:
+            return self._problem(injected_error, "Injected error")
+
+        path = urlsplit(self.path)
+        status, payload = emulator._dispatch(
+            method,
+            match["api"],
+            match["scs_as_id"],
+            match["subscription_id"],
+            body,
+            f"http://{self.headers.get('Host')}{path.path}",
+            parse_qs(path.query),
+        )
+        self._reply(status, payload)
+
+    def do_POST(self):
+        self._handle("POST")
+
+    def do_GET(self):
+        self._handle("GET")
+
+    def do_PUT(self):
+        self._handle("PUT")
+
+    def do_DELETE(self):
+        self._handle("DELETE")
+
+
+class NefEmulator:
+    """
+    In-memory NEF emulator served over HTTP on a background thread.
+
+    args:
+        host: Interface to bind.
+        port: Port to bind, 0 picks a free one.
+        latency: Fixed delay in seconds added to every request.
+        jitter: Upper bound in seconds of a random delay added on top of 'latency'.
+        error_rate: Probability in [0, 1] of answering a request with 'error_status'.
+        error_status: HTTP status code used for injected errors.
+        seed: Seed of the random generator driving jitter and error injection.
+    """
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        error_rate: float = 0.0,
+        error_status: int = 503,
+        seed: int | None = None,
+    ):
+        if not 0.0 <= error_rate <= 1.0:
+            raise ValueError("error_rate must be between 0 and 1.")
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.requests_served = 0
+        self.errors_injected = 0
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._subscriptions: Dict[tuple, Dict[str, dict]] = {}
+        self._server = _NefServer((host, port), _NefRequestHandler)
+        self._server.emulator = self
+        self._thread: threading.Thread | None = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "NefEmulator":
+        self._thread = threading.Thread(
+            target=self._server.serve_forever,
+            kwargs={"poll_interval": 0.05},
+            name="nef-emulator",
+            daemon=True,
+        )
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+    def subscriptions(self, api: str, scs_as_id: str) -> Dict[str, dict]:
+        """Returns a copy of the subscriptions currently stored for an API and AF."""
+        with self._lock:
+            return dict(self._subscriptions.get((api, scs_as_id), {}))
+
+    def _next_injected_error(self) -> int | None:
+        with self._lock:
+            self.requests_served += 1
+            if self.error_rate and self._random.random() < self.error_rate:
+                self.errors_injected += 1
+                return self.error_status
+        return None
+
+    def _delay(self) -> None:
+        delay = self.latency
+        if self.jitter:
+            with self._lock:
+                delay += self._random.uniform(0, self.jitter)
+        if delay > 0:
+            time.sleep(delay)
+
+    def _dispatch(
+        self,
+        method: str,
+        api: str,
+        scs_as_id: str,
+        subscription_id: str | None,
+        body: dict | None,
+        url: str,
+        query: Dict[str, list] | None = None,
+    ) -> tuple[int, object]:
+        with self._lock:
+            store = self._subscriptions.setdefault((api, scs_as_id), {})
+            if subscription_id is None:
+                if method == "GET":
+                    try:
+                        return 200, _page(list(store.values()), query or {})
+                    except ValueError as e:
+                        return 400, {"status": 400, "title": str(e)}
+                if method != "POST":
+                    return 405, {"status": 405, "title": "Method not allowed"}
+                if body is None:
+                    return 400, {"status": 400, "title": "Missing body"}
+                subscription_id = str(uuid.uuid4())
+                resource = dict(body, self=f"{url.rstrip('/')}/{subscription_id}")
+                if api == "3gpp-monitoring-event":
+                    # One-time location requests are answered immediately
+                    return 200, _location_report(body)
+                store[subscription_id] = resource
+                return 201, resource
+
+            if subscription_id not in store:
+                return 404, {"status": 404, "title": "Subscription not found"}
+            if method == "GET":
+                return 200, store[subscription_id]
+            if method == "PUT":
+                store[subscription_id] = dict(body or {}, self=url)
+                return 200, store[subscription_id]
+            if method == "DELETE":
+                del store[subscription_id]
+                return 204, None
+            return 405, {"status": 405, "title": "Method not allowed"}
+
+
+def _page(items: list, query: Dict[str, list]) -> list:
+    try:
+        offset = int(query.get("offset", ["0"])[0])
+        limit = int(query["limit"][0]) if "limit" in query else None
+    except ValueError:
+        raise ValueError("offset and limit must be integers") from None
+    if offset < 0 or (limit is not None and limit < 0):
+        raise ValueError("offset and limit must not be negative")
+    if limit is None:
+        return items[offset:]
+    return items[offset : offset + limit]
+
+
+def _location_report(subscription: dict) -> dict:
+    report = {
+        "monitoringType": subscription.get("monitoringType", "LOCATION_REPORTING"),
+        "eventTime": datetime.now(timezone.utc).isoformat(),
+        "locationInfo": {
+            "ageOfLocationInfo": {"duration": 0},
+            "geographicArea": {
+                "polygon": {"point_list": {"geographical_coords": _LOCATION_POLYGON}}
+            },
+        },
+    }
+    for identifier in ("externalId", "msisdn"):
+        if subscription.get(identifier):
+            report[identifier] = subscription[identifier]
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run a local NEF emulator.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds")
+    parser.add_argument("--jitter", type=float, default=0.0, help="seconds")
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--error-status", type=int, default=503)
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args()
+
+    emulator = NefEmulator(
+        host=args.host,
+        port=args.port,
+        latency=args.latency,
+        jitter=args.jitter,
+        error_rate=args.error_rate,
+        error_status=args.error_status,
+        seed=args.seed,
+    )
+    print(f"NEF emulator listening on {emulator.base_url}")
+    try:
+        emulator._server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        emulator._server.server_close()
+
+
+if __name__ == "__main__":
+    main()
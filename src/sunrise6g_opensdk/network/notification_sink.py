@@ -0,0 +1,340 @@
+# -*- coding: utf-8 -*-
+"""
+Embedded receiver of the notifications sent by the NEF.
+
+Serves one endpoint per notification type, to be used as the notification
+destination (CAMARA 'sink') of the subscriptions:
+
+    POST {base_url}/qod                 UserPlaneNotificationData
+    POST {base_url}/traffic-influence   TrafficInfluenceNotification
+    POST {base_url}/monitoring-event    MonitoringNotification
+
+The HTTP handler only queues the raw body and answers right away, or with 503
+when too many notifications are pending. Parsing, validation and fan-out to
+the subscriber queues happen in batches on a separate task:
+
+    async with NotificationSink(port=8001) as sink:
+        queue = sink.subscribe(session_id)
+        for notification in await queue.get():
+            network_client.handle_qod_notification(notification.data)
+"""
+import asyncio
+import json
+import time
+from dataclasses import dataclass
+from typing import Dict, List
+
+from pydantic import BaseModel
+
+from sunrise6g_opensdk import logger
+from sunrise6g_opensdk.network.core import schemas
+
+log = logger.get_logger(__name__)
+
+QOD = "qod"
+TRAFFIC_INFLUENCE = "traffic-influence"
+MONITORING_EVENT = "monitoring-event"
+
+_SCHEMAS = {
+    QOD: schemas.UserPlaneNotificationData,
+    TRAFFIC_INFLUENCE: schemas.TrafficInfluenceNotification,
+    MONITORING_EVENT: schemas.MonitoringNotification,
+}
+
+DEFAULT_MAX_PENDING = 10000
+DEFAULT_BATCH_SIZE = 256
+DEFAULT_BATCH_INTERVAL = 0.005
+DEFAULT_SUBSCRIBER_QUEUE_SIZE = 1024
+
+_MAX_HEADER_SIZE = 16 * 1024
+_MAX_BODY_SIZE = 1024 * 1024
+
+_REASONS = {
+    204: "No Content",
+    400: "Bad Request",
+    404: "Not Found",
+    405: "Method Not Allowed",
+    411: "Length Required",
+    413: "Payload Too Large",
+    503: "Service Unavailable",
+}
+
+
+@dataclass(frozen=True)
+class Notification:
+    """A validated NEF notification."""
+
+    kind: str  # QOD, TRAFFIC_INFLUENCE or MONITORING_EVENT
+    subscription_id: str | None
+    data: BaseModel
+    received_at: float  # time.time() of its reception
+
+
+def _subscription_id(kind: str, data: BaseModel) -> str | None:
+    if kind == QOD:
+        return data.subscription_id
+    if kind == MONITORING_EVENT:
+        return str(data.subscription).rstrip("/").split("/")[-1]
+    return data.afTransId
+
+
+class NotificationSink:
+    """
+    Asyncio HTTP server receiving NEF notifications and dispatching them to
+    subscriber queues keyed by subscription id.
+
+    Subscriber queues receive lists of Notification, one list per dispatched
+    batch. A subscriber that does not keep up loses the batches that do not
+    fit in its queue, without slowing down the other subscribers.
+
+    args:
+        host: Interface to bind.
+        port: Port to bind, 0 picks a free one.
+        max_pending: Notifications received but not dispatched yet above which
+                     the NEF is answered with 503.
+        batch_size: Maximum number of notifications dispatched at once.
+        batch_interval: Seconds to wait for more notifications before
+                        dispatching an incomplete batch.
+        subscriber_queue_size: Default maximum number of batches queued per subscriber.
+    """
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        max_pending: int = DEFAULT_MAX_PENDING,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        batch_interval: float = DEFAULT_BATCH_INTERVAL,
+        subscriber_queue_size: int = DEFAULT_SUBSCRIBER_QUEUE_SIZE,
+    ):
+        self.host = host
+        self.port = port
+        self.max_pending = max_pending
+        self.batch_size = batch_size
+        self.batch_interval = batch_interval
+        self.subscriber_queue_size = subscriber_queue_size
+        self._subscribers: Dict[str | None, List[asyncio.Queue]] = {}
+        self._pending: asyncio.Queue | None = None
+        self._server: asyncio.Server | None = None
+        self._dispatcher: asyncio.Task | None = None
+        self.received = 0
+        self.rejected = 0
+        self.invalid = 0
+        self.delivered = 0
+        self.dropped = 0
+
+    @property
+    def base_url(self) -> str:
+        return f"http://{self.host}:{self.port}"
+
+    def url(self, kind: str) -> str:
+        """
+        Returns the notification destination of the given notification type.
+        """
+        if kind not in _SCHEMAS:
+            raise ValueError(f"Unknown notification type '{kind}'")
+        return f"{self.base_url}/{kind}"
+
+    async def start(self) -> "NotificationSink":
+        self._pending = asyncio.Queue(self.max_pending)
+        self._server = await asyncio.start_server(
+            self._handle_connection, self.host, self.port, limit=_MAX_HEADER_SIZE
+        )
+        self.port = self._server.sockets[0].getsockname()[1]
+        self._dispatcher = asyncio.create_task(self._dispatch())
+        log.info("Notification sink listening on %s", self.base_url)
+        return self
+
+    async def stop(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+        if self._dispatcher is not None:
+            self._dispatcher.cancel()
+            try:
+                await self._dispatcher
+            except asyncio.CancelledError:
+                pass
+            self._dispatcher = None
+            # Deliver what was accepted before stopping
+            self._drain()
+
+    async def __aenter__(self):
+        return await self.start()
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.stop()
+
+    def subscribe(
+        self, subscription_id: str | None = None, maxsize: int | None = None
+    ) -> asyncio.Queue:
+        """
+        Returns a queue receiving the notifications of a subscription.
+
+        args:
+            subscription_id: NEF subscription id (QoD session id, monitoring
+                             subscription id or traffic influence AF transaction id).
+                             None receives every notification.
+            maxsize: Maximum number of batches kept in the queue.
+        """
+        queue = asyncio.Queue(maxsize or self.subscriber_queue_size)
+        self._subscribers.setdefault(subscription_id, []).append(queue)
+        return queue
+
+    def unsubscribe(self, queue: asyncio.Queue) -> None:
+        for subscription_id, queues in list(self._subscribers.items()):
+            if queue in queues:
+                queues.remove(queue)
+                if not queues:
+                    del self._subscribers[subscription_id]
+
+    def stats(self) -> Dict:
+        """
+        Returns the reception and delivery counters of the sink.
+        """
+        return {
+            "received": self.received,
+            "rejected": self.rejected,
+            "invalid": self.invalid,
+            "delivered": self.delivered,
+            "dropped": self.dropped,
+            "pending": self._pending.qsize() if self._pending is not None else 0,
+        }
+
+    async def _handle_connection(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        try:
+            while await self._handle_request(reader, writer):
+                pass
+        except (
+            asyncio.IncompleteReadError,
+            asyncio.LimitOverrunError,
+            ConnectionError,
+        ):
+            pass
+        finally:
+            writer.close()
+
+    async def _handle_request(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> bool:
+        """
+        Answers one request of the connection.
+
+        returns:
+            Whether the connection can be reused.
+        """
+        head = await reader.readuntil(b"\r\n\r\n")
+        request_line, *header_lines = head.decode("latin-1").split("\r\n")
+        try:
+            method, path, version = request_line.split(" ")
+        except ValueError:
+            await self._reply(writer, 400, keep_alive=False)
+            return False
+        headers = {}
+        for line in header_lines:
+            name, _, value = line.partition(":")
+            headers[name.strip().lower()] = value.strip()
+        keep_alive = (
+            version == "HTTP/1.1" and headers.get("connection", "").lower() != "close"
+        )
+
+        if "transfer-encoding" in headers:
+            await self._reply(writer, 411, keep_alive=False)
+            return False
+        length = headers.get("content-length") or "0"
+        if not (length.isascii() and length.isdigit()):
+            await self._reply(writer, 400, keep_alive=False)
+            return False
+        length = int(length)
+        if length > _MAX_BODY_SIZE:
+            await self._reply(writer, 413, keep_alive=False)
+            return False
+        body = await reader.readexactly(length) if length else b""
+
+        kind = path.split("?")[0].strip("/")
+        if kind not in _SCHEMAS:
+            status = 404
+        elif method != "POST":
+            status = 405
+        else:
+            status = self._accept(kind, body)
+        await self._reply(writer, status, keep_alive)
+        return keep_alive
+
+    def _accept(self, kind: str, body: bytes) -> int:
+        self.received += 1
+        try:
+            self._pending.put_nowait((kind, body, time.time()))
+        except asyncio.QueueFull:
+            self.rejected += 1
+            return 503
+        return 204
+
+    async def _reply(
+        self, writer: asyncio.StreamWriter, status: int, keep_alive: bool
+    ) -> None:
+        headers = [f"HTTP/1.1 {status} {_REASONS[status]}", "Content-Length: 0"]
+        if status == 503:
+            headers.append("Retry-After: 1")
+        if not keep_alive:
+            headers.append("Connection: close")
+        writer.write(("\r\n".join(headers) + "\r\n\r\n").encode("latin-1"))
+        await writer.drain()
+
+    async def _dispatch(self) -> None:
+        while True:
+            batch = [await self._pending.get()]
+            try:
+                self._take_pending(batch)
+                if len(batch) < self.batch_size and self.batch_interval > 0:
+                    await asyncio.sleep(self.batch_interval)
+                    self._take_pending(batch)
+            finally:
+                # Also on stop, the batch already left the pending queue
+                self._deliver(batch)
+
+    def _take_pending(self, batch: list) -> None:
+        while len(batch) < self.batch_size and not self._pending.empty():
+            batch.append(self._pending.get_nowait())
+
+    def _drain(self) -> None:
+        while not self._pending.empty():
+            batch = []
+            self._take_pending(batch)
+            self._deliver(batch)
+
+    def _deliver(self, batch: list) -> None:
+        by_subscription: Dict[str | None, List[Notification]] = {}
+        for kind, body, received_at in batch:
+            try:
+                data = _SCHEMAS[kind].model_validate(json.loads(body))
+                subscription_id = _subscription_id(kind, data)
+            except Exception as e:
+                self.invalid += 1
+                log.warning("Discarding invalid %s notification: %s", kind, e)
+                continue
+            notification = Notification(kind, subscription_id, data, received_at)
+            by_subscription.setdefault(subscription_id, []).append(notification)
+
+        notifications = [n for group in by_subscription.values() for n in group]
+        if notifications:
+            for queue in self._subscribers.get(None, ()):
+                self._put(queue, notifications)
+        for subscription_id, group in by_subscription.items():
+            if subscription_id is None:
+                continue
+            for queue in self._subscribers.get(subscription_id, ()):
+                self._put(queue, group)
+
+    def _put(self, queue: asyncio.Queue, notifications: List[Notification]) -> None:
+        try:
+            queue.put_nowait(notifications)
+            self.delivered += len(notifications)
+        except asyncio.QueueFull:
+            self.dropped += len(notifications)
+            log.warning(
+                "Subscriber queue full, dropping %d notifications", len(notifications)
+            )
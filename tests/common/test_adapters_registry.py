@@ -0,0 +1,120 @@
+# -*- coding: utf-8 -*-
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+from sunrise6g_opensdk.common.adapters_factory import (
+    NETWORK_ENTRY_POINT_GROUP,
+    AdapterRegistry,
+    AdaptersFactory,
+)
+from sunrise6g_opensdk.common.sdk import Sdk as sdkclient
+from sunrise6g_opensdk.network.adapters.oai.client import (
+    NetworkManager as OaiCoreClient,
+)
+
+# Runs in a fresh interpreter, other tests import every adapter in this one
+_LOADED_MODULES_SNIPPET = """
+import json
+import sys
+
+def loaded():
+    return sorted(
+        name
+        for name in sys.modules
+        if name.split(".")[0] in ("kubernetes", "pymongo", "yaml")
+        or name.startswith(("sunrise6g_opensdk.edgecloud.adapters.",
+                            "sunrise6g_opensdk.network.adapters."))
+    )
+
+from sunrise6g_opensdk.common.sdk import Sdk
+after_import = loaded()
+adapters = Sdk.create_adapters_from(
+    {"network": {"client_name": "CLIENT", "base_url": "http://nef", "scs_as_id": "scs"}}
+)
+print(json.dumps({
+    "after_import": after_import,
+    "after_use": loaded(),
+    "adapter": type(adapters["network"]).__module__,
+}))
+"""
+
+_THIRD_PARTY_ADAPTER = """
+from sunrise6g_opensdk.network.adapters.oai.client import NetworkManager
+
+
+class ThirdPartyNetworkManager(NetworkManager):
+    pass
+"""
+
+
+def _run(snippet: str, client_name: str, path: str = "") -> dict:
+    env = dict(os.environ)
+    if path:
+        env["PYTHONPATH"] = os.pathsep.join(filter(None, [path, env.get("PYTHONPATH")]))
+    completed = subprocess.run(
+        [sys.executable, "-c", snippet.replace("CLIENT", client_name)],
+        capture_output=True,
+        text=True,
+        check=True,
+        env=env,
+    )
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+
+def test_adapters_are_imported_on_first_use():
+    loaded = _run(_LOADED_MODULES_SNIPPET, "open5gs")
+    assert loaded["after_import"] == []
+    assert loaded["adapter"] == "sunrise6g_opensdk.network.adapters.open5gs.client"
+    # Neither the other adapters nor their dependencies are imported
+    assert not [
+        name
+        for name in loaded["after_use"]
+        if not name.startswith("sunrise6g_opensdk.network.adapters")
+        or name.split(".")[3] in ("oai", "open5gcore")
+    ]
+
+
+def test_third_party_adapters_register_through_entry_points(tmp_path):
+    (tmp_path / "third_party_adapter.py").write_text(_THIRD_PARTY_ADAPTER)
+    dist_info = tmp_path / "third_party_adapter-0.1.dist-info"
+    dist_info.mkdir()
+    (dist_info / "METADATA").write_text(
+        "Metadata-Version: 2.1\nName: third-party-adapter\nVersion: 0.1\n"
+    )
+    (dist_info / "entry_points.txt").write_text(
+        f"[{NETWORK_ENTRY_POINT_GROUP}]\n"
+        "thirdparty = third_party_adapter:ThirdPartyNetworkManager\n"
+    )
+    loaded = _run(_LOADED_MODULES_SNIPPET, "thirdparty", path=str(tmp_path))
+    assert loaded["adapter"] == "third_party_adapter"
+
+
+def test_adapters_registered_at_runtime():
+    class CustomNetworkManager(OaiCoreClient):
+        pass
+
+    AdaptersFactory.register_adapter("network", "custom", CustomNetworkManager)
+    adapters = sdkclient.create_adapters_from(
+        {
+            "network": {
+                "client_name": "custom",
+                "base_url": "http://nef",
+                "scs_as_id": "scs",
+            }
+        }
+    )
+    assert type(adapters["network"]) is CustomNetworkManager
+
+
+def test_unknown_adapters_and_domains():
+    registry = AdapterRegistry("network", {"oai": "not.imported:Client"})
+    with pytest.raises(ValueError, match=r"Invalid network client 'foo'.*\['oai'\]"):
+        registry.get("foo")
+    with pytest.raises(ModuleNotFoundError):
+        registry.get("oai")
+    with pytest.raises(ValueError, match="Unsupported domain 'oran'"):
+        AdaptersFactory.register_adapter("oran", "foo", OaiCoreClient)
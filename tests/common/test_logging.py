@@ -0,0 +1,114 @@
+# -*- coding: utf-8 -*-
+import logging
+import threading
+from enum import Enum
+
+import pytest
+
+from sunrise6g_opensdk import logger
+from tests.network.test_qod_session_registry import _FakeClock
+
+formatted_on = []
+
+
+class Phase(Enum):
+    SEND = "send"
+
+    def __str__(self):
+        formatted_on.append(threading.current_thread())
+        return self.value
+
+
+@pytest.fixture
+def logger_name(request):
+    name = f"test_logging.{request.node.name}"
+    yield name
+    logger._stop_listeners()
+    test_logger = logging.getLogger(name)
+    for handler in test_logger.handlers:
+        handler.close()
+    test_logger.handlers.clear()
+    test_logger.propagate = True
+
+
+def _messages(log_file) -> list:
+    return [line.rsplit(" - ", 1)[-1] for line in log_file.read_text().splitlines()]
+
+
+def test_queued_records_are_formatted_off_the_calling_thread(logger_name, tmp_path):
+    log_file = tmp_path / "sdk.log"
+    log = logger.setup_logger(logger_name, file_name=str(log_file), queued=True)
+    (handler,) = log.handlers
+    assert isinstance(handler, logger.DeferredQueueHandler)
+    # Not formatted by the capture handler of pytest either
+    log.propagate = False
+
+    formatted_on.clear()
+    devices = ["10.45.0.2"]
+    log.info("Request phase %s", Phase.SEND)
+    log.info("Devices %s", devices)
+    # Mutable arguments are formatted when logged
+    devices.append("10.45.0.3")
+    logger.flush_loggers()
+
+    assert _messages(log_file) == ["Request phase send", "Devices ['10.45.0.2']"]
+    assert formatted_on
+    assert threading.current_thread() not in formatted_on
+
+
+def test_setting_up_a_logger_again_keeps_its_handlers(logger_name, tmp_path):
+    log_file = str(tmp_path / "sdk.log")
+    log = logger.setup_logger(logger_name, file_name=log_file)
+    handlers = list(log.handlers)
+    assert logger.setup_logger(logger_name, file_name=log_file).handlers == handlers
+
+    log = logger.setup_logger(logger_name, file_name=log_file, queued=True)
+    assert len(log.handlers) == 1
+    assert log.handlers[0] not in handlers
+
+
+def test_rate_limit_is_per_logger():
+    clock = _FakeClock()
+    rate_limit = logger.RateLimitFilter(rate=2, burst=3, clock=clock)
+
+    def passed(name, level=logging.INFO, count=10):
+        record = logging.LogRecord(name, level, __file__, 0, "message", None, None)
+        return sum(
+            rate_limit.filter(logging.makeLogRecord(record.__dict__))
+            for _ in range(count)
+        )
+
+    assert passed("a") == 3
+    assert passed("b") == 3
+    assert passed("a", logging.WARNING) == 10
+    clock.now = 1
+    assert passed("a") == 2
+    assert rate_limit.dropped == 7 + 7 + 8
+
+
+def test_sampling_keeps_warnings(logger_name, tmp_path):
+    log_file = tmp_path / "sdk.log"
+    log = logger.setup_logger(logger_name, file_name=str(log_file), sample_rate=0.25)
+    for i in range(400):
+        log.info("Session %d created", i)
+    log.warning("Session failed")
+
+    messages = _messages(log_file)
+    assert messages[-1] == "Session failed"
+    assert 50 <= len(messages) - 1 <= 150
+
+
+def test_filters_decide_once_per_record(logger_name, tmp_path):
+    # The console and the file handler share the rate limit
+    log_file = tmp_path / "sdk.log"
+    log = logger.setup_logger(logger_name, file_name=str(log_file), rate_limit=0.001)
+    for i in range(5):
+        log.info("Session %d created", i)
+    assert _messages(log_file) == ["Session 0 created"]
+
+
+def test_invalid_rates_are_rejected():
+    with pytest.raises(ValueError):
+        logger.RateLimitFilter(rate=0)
+    with pytest.raises(ValueError):
+        logger.SamplingFilter(rate=1.5)
@@ -0,0 +1,157 @@
+# -*- coding: utf-8 -*-
+import asyncio
+
+import pytest
+from kubernetes.client.rest import ApiException
+
+from sunrise6g_opensdk.common import metrics
+from sunrise6g_opensdk.edgecloud.adapters.i2edge.common import I2EdgeError, i2edge_get
+from sunrise6g_opensdk.network.adapters.oai.async_client import (
+    AsyncNetworkManager as AsyncOaiClient,
+)
+from sunrise6g_opensdk.network.adapters.open5gs.async_client import (
+    AsyncNetworkManager as AsyncOpen5GSClient,
+)
+from sunrise6g_opensdk.network.core.common import CoreHttpError
+from sunrise6g_opensdk.network.nef_emulator import NefEmulator
+from tests.network.test_bulk_qod_sessions import camara_session
+from tests.network.test_qod_session_registry import _network_client
+from tests.network.test_ti_streaming import _populate
+
+QOS = "POST 3gpp-as-session-with-qos"
+TI_LIST = "GET 3gpp-traffic-influence"
+
+
+@pytest.fixture
+def registry():
+    registry = metrics.enable()
+    yield registry
+    metrics.disable()
+
+
+def test_disabled_metrics_record_nothing():
+    assert metrics.registry() is None
+    with metrics.measure("network", QOS) as measurement:
+        measurement.status = 200
+        measurement.mark("send")
+    assert metrics.measure("network", QOS) is measurement
+
+    @metrics.instrument("kubernetes")
+    def deploy(name):
+        return name
+
+    assert deploy("app") == "app"
+
+
+def test_nef_calls_are_measured(registry):
+    with NefEmulator() as emulator:
+        with _network_client(emulator.base_url) as network_client:
+            session = network_client.create_qod_session(camara_session("10.45.0.2"))
+            network_client.delete_qod_session(str(session["sessionId"]))
+            with pytest.raises(CoreHttpError):
+                network_client.delete_qod_session(str(session["sessionId"]))
+
+    snapshot = registry.snapshot()
+    assert snapshot["calls"] == {
+        ("network", QOS, "ok"): 1,
+        ("network", "DELETE 3gpp-as-session-with-qos", "ok"): 1,
+        ("network", "DELETE 3gpp-as-session-with-qos", "404"): 1,
+    }
+    assert snapshot["errors"] == {
+        ("network", "DELETE 3gpp-as-session-with-qos", "404"): 1
+    }
+    assert set(snapshot["in_flight"].values()) == {0}
+
+    exported = registry.export()
+    for phase in ("serialize", "send", "parse"):
+        assert (
+            "sunrise6g_opensdk_request_phase_duration_seconds_count"
+            f'{{adapter="network",operation="{QOS}",phase="{phase}"}} 1'
+        ) in exported
+
+
+def test_async_nef_calls_are_measured(registry):
+    async def scenario(base_url):
+        async with AsyncOpen5GSClient(base_url=base_url, scs_as_id="scs") as client:
+            await client.create_qod_session(camara_session("10.45.0.2"))
+
+    with NefEmulator() as emulator:
+        asyncio.run(scenario(emulator.base_url))
+    assert registry.snapshot()["calls"] == {("network", QOS, "ok"): 1}
+
+
+def test_streamed_nef_calls_are_measured(registry):
+    async def scenario(base_url):
+        async with AsyncOaiClient(base_url=base_url, scs_as_id="scs") as client:
+            return [ti async for ti in client.iter_traffic_influence_resources(2)]
+
+    with NefEmulator() as emulator:
+        _populate(emulator, 3)
+        registry.clear()
+        with _network_client(emulator.base_url, client_name="oai") as network_client:
+            assert len(list(network_client.iter_traffic_influence_resources(2))) == 3
+            # Streams left before their end are not failed calls
+            resources = network_client.iter_traffic_influence_resources(2)
+            next(resources)
+            resources.close()
+        assert len(asyncio.run(scenario(emulator.base_url))) == 3
+
+    snapshot = registry.snapshot()
+    # Two pages per listing, and the first page of the stream left early
+    assert snapshot["calls"] == {("network", TI_LIST, "ok"): 5}
+    assert snapshot["errors"] == {}
+    assert set(snapshot["in_flight"].values()) == {0}
+
+
+def test_clear_resets_every_metric():
+    registry = metrics.PrometheusMetrics()
+    registry.observe("network", QOS, "500", 0.05)
+    registry.observe_phase("network", QOS, "send", 0.01)
+    registry.add_in_flight("network", QOS, 1)
+    registry.clear()
+    assert registry.snapshot() == {"calls": {}, "errors": {}, "in_flight": {}}
+    assert "network" not in registry.export()
+
+
+def test_edge_cloud_calls_are_labelled_by_status(registry):
+    with NefEmulator() as emulator:
+        with pytest.raises(I2EdgeError):
+            i2edge_get(f"{emulator.base_url}/zones/list", params=None)
+
+    @metrics.instrument("kubernetes")
+    def get_PoPs():
+        raise ApiException(status=503)
+
+    with pytest.raises(ApiException):
+        get_PoPs()
+    assert registry.snapshot()["errors"] == {
+        ("i2edge", "get", "404"): 1,
+        ("kubernetes", "get_PoPs", "503"): 1,
+    }
+
+
+def test_prometheus_text_format():
+    registry = metrics.PrometheusMetrics(buckets=(0.1, 1.0))
+    registry.observe("network", QOS, "ok", 0.05)
+    registry.observe("network", QOS, "ok", 0.5)
+    registry.observe("network", QOS, "ok", 5)
+    registry.observe("aeros", 'say "hi"', "Timeout", 0.01)
+    registry.add_in_flight("network", QOS, 2)
+    exported = registry.export()
+
+    name = "sunrise6g_opensdk_request_duration_seconds"
+    labels = f'adapter="network",operation="{QOS}",status="ok"'
+    assert f"# TYPE {name} histogram" in exported
+    assert f'{name}_bucket{{{labels},le="0.1"}} 1' in exported
+    assert f'{name}_bucket{{{labels},le="1.0"}} 2' in exported
+    assert f'{name}_bucket{{{labels},le="+Inf"}} 3' in exported
+    assert f"{name}_sum{{{labels}}} 5.55" in exported
+    assert f"{name}_count{{{labels}}} 3" in exported
+    assert (
+        "sunrise6g_opensdk_request_errors_total"
+        '{adapter="aeros",operation="say \\"hi\\"",status="Timeout"} 1'
+    ) in exported
+    assert (
+        "sunrise6g_opensdk_requests_in_flight"
+        f'{{adapter="network",operation="{QOS}"}} 2'
+    ) in exported
@@ -0,0 +1,118 @@
+# -*- coding: utf-8 -*-
+import time
+
+import pytest
+
+from sunrise6g_opensdk.edgecloud.adapters.i2edge.client import EdgeApplicationManager
+from sunrise6g_opensdk.edgecloud.adapters.i2edge.common import I2EdgeError
+from sunrise6g_opensdk.edgecloud.core.flavour_selection import (
+    BIN_PACKING,
+    LEAST_WASTE,
+    FlavourCatalog,
+    required_resources_of,
+)
+from tests.edgecloud.test_config import CONFIG
+from tests.edgecloud.test_i2edge_http_session import i2edge_server
+
+REQUIRED_RESOURCES = {
+    "applicationResources": {"cpuPool": {"numCPU": 2, "memory": 2048}}
+}
+
+ZONE_DETAILS = [
+    {
+        "zoneId": "zone-1",
+        "flavoursSupported": [
+            {"flavourId": "small", "numCPU": 1, "memorySize": "1024MB"},
+            {"flavourId": "big-memory", "numCPU": 2, "memorySize": "16GB"},
+        ],
+    },
+    {
+        "zoneId": "zone-2",
+        "flavoursSupported": [
+            {"flavourId": "balanced", "numCPU": 4, "memorySize": 4096},
+        ],
+    },
+]
+
+
+def _selected(catalog, policy, **kwargs):
+    return [
+        (choice.zone_id, choice.flavour_id)
+        for choice in catalog.select(
+            REQUIRED_RESOURCES, policy=policy, limit=None, **kwargs
+        )
+    ]
+
+
+def test_required_resources_of_app_manifests():
+    manifest = CONFIG["i2edge"]["APP_ONBOARD_MANIFEST"]
+    assert required_resources_of(manifest["requiredResources"]) == (2, 2048, 0)
+    assert required_resources_of({}) == (0, 0, 0)
+
+
+def test_policies_rank_every_zone():
+    catalog = FlavourCatalog(ZONE_DETAILS)
+    assert len(catalog) == 3
+    # The app fills all the CPUs of 'big-memory' but leaves most of its memory
+    assert _selected(catalog, BIN_PACKING) == [
+        ("zone-1", "big-memory"),
+        ("zone-2", "balanced"),
+    ]
+    assert _selected(catalog, LEAST_WASTE) == [
+        ("zone-2", "balanced"),
+        ("zone-1", "big-memory"),
+    ]
+    assert _selected(catalog, LEAST_WASTE, zone_ids=["zone-1"]) == [
+        ("zone-1", "big-memory")
+    ]
+
+
+def test_no_flavour_fits():
+    catalog = FlavourCatalog(ZONE_DETAILS)
+    required = {"applicationResources": {"cpuPool": {"numCPU": 8}}}
+    assert catalog.select(required) == []
+    assert FlavourCatalog([]).select(REQUIRED_RESOURCES) == []
+    with pytest.raises(ValueError):
+        catalog.select(REQUIRED_RESOURCES, policy="first_fit")
+
+
+def test_thousands_of_flavours_are_scored_in_milliseconds():
+    zones = [
+        {
+            "zoneId": f"zone-{zone}",
+            "flavoursSupported": [
+                {
+                    "flavourId": f"flavour-{zone}-{i}",
+                    "numCPU": 1 + i % 16,
+                    "memorySize": f"{1 + i % 64}GB",
+                    "storageSize": 10 * (1 + i % 10),
+                }
+                for i in range(100)
+            ],
+        }
+        for zone in range(50)
+    ]
+    catalog = FlavourCatalog(zones)
+    catalog.select(REQUIRED_RESOURCES)
+
+    start = time.perf_counter()
+    (best,) = catalog.select(REQUIRED_RESOURCES, policy=LEAST_WASTE)
+    elapsed = time.perf_counter() - start
+    assert (best.zone_id, best.flavour_id) == ("zone-0", "flavour-0-1")
+    assert elapsed < 0.05
+
+
+def test_i2edge_selects_the_flavour_without_flavour_id():
+    with i2edge_server() as (server, base_url):
+        with EdgeApplicationManager(base_url=base_url, flavour_id=None) as client:
+            client.get_edge_cloud_zones_details = lambda zone_id: ZONE_DETAILS[0]
+            client.onboard_app(
+                {"appId": "app", "requiredResources": REQUIRED_RESOURCES}
+            )
+            client.deploy_app("app", [{"EdgeCloudZone": {"edgeCloudZoneId": "zone-1"}}])
+            client.onboard_app({"appId": "other-app"})
+            with pytest.raises(I2EdgeError, match="requiredResources"):
+                client.deploy_app(
+                    "other-app", [{"EdgeCloudZone": {"edgeCloudZoneId": "zone-1"}}]
+                )
+    assert server.instances[0]["flavour_id"] == "big-memory"
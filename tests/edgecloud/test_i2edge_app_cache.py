@@ -0,0 +1,113 @@
+# -*- coding: utf-8 -*-
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from sunrise6g_opensdk.edgecloud.adapters.i2edge.client import EdgeApplicationManager
+from sunrise6g_opensdk.edgecloud.adapters.i2edge.common import I2EdgeError
+from tests.edgecloud.test_i2edge_http_session import APPS, i2edge_server
+
+APP_ZONES = [{"EdgeCloudZone": {"edgeCloudZoneId": "zone-1"}}]
+
+
+def _app_reads(server, app_id: str) -> int:
+    return sum(
+        1
+        for method, path in server.requests
+        if method == "GET" and path.startswith(f"{APPS}/{app_id}")
+    )
+
+
+def test_deploy_bursts_read_the_app_once():
+    with i2edge_server() as (server, base_url):
+        with EdgeApplicationManager(base_url=base_url, flavour_id="id") as client:
+            client.onboard_app({"appId": "app"})
+            for _ in range(5):
+                client.deploy_app("app", APP_ZONES)
+            assert _app_reads(server, "app") == 1
+            assert client.app_cache_stats()["hits"] == 4
+
+
+def test_onboarding_and_deletion_invalidate_the_app():
+    with i2edge_server() as (server, base_url):
+        with EdgeApplicationManager(base_url=base_url, flavour_id="id") as client:
+            client.onboard_app({"appId": "app"})
+            profile = client.get_onboarded_app("app")["profile_data"]
+            # Callers get their own copy
+            profile["appProviderId"] = "changed"
+            profile = client.get_onboarded_app("app")["profile_data"]
+            assert profile["appProviderId"] == "default_provider"
+
+            client.onboard_app({"appId": "app"})
+            client.get_onboarded_app("app")
+            assert _app_reads(server, "app") == 2
+
+            client.delete_onboarded_app("app")
+            with pytest.raises(I2EdgeError, match="App not found"):
+                client.get_onboarded_app("app")
+            assert _app_reads(server, "app") == 3
+
+
+def test_unknown_apps_are_cached_when_enabled():
+    with i2edge_server() as (server, base_url):
+        with EdgeApplicationManager(base_url=base_url, flavour_id="id") as client:
+            for _ in range(2):
+                with pytest.raises(I2EdgeError, match="App not found"):
+                    client.get_onboarded_app("app")
+            assert _app_reads(server, "app") == 2
+
+        with EdgeApplicationManager(
+            base_url=base_url, flavour_id="id", unknown_app_ttl=60
+        ) as client:
+            for _ in range(2):
+                with pytest.raises(I2EdgeError, match="App not found"):
+                    client.get_onboarded_app("app")
+            assert _app_reads(server, "app") == 3
+
+            client.onboard_app({"appId": "app"})
+            assert client.get_onboarded_app("app")["profile_data"]["app_id"] == "app"
+
+
+def test_failed_reads_are_not_cached():
+    with i2edge_server() as (server, base_url):
+        with EdgeApplicationManager(
+            base_url=base_url, flavour_id="id", max_retries=0, unknown_app_ttl=60
+        ) as client:
+            client.onboard_app({"appId": "app"})
+            server.failures = 1
+            with pytest.raises(I2EdgeError, match="unavailable"):
+                client.get_onboarded_app("app")
+            assert client.get_onboarded_app("app")["profile_data"]["app_id"] == "app"
+
+
+def test_concurrent_reads_are_coalesced():
+    with i2edge_server() as (server, base_url):
+        with EdgeApplicationManager(base_url=base_url, flavour_id="id") as client:
+            client.onboard_app({"appId": "app"})
+            server.delay = 0.2
+            with ThreadPoolExecutor(max_workers=5) as executor:
+                apps = list(
+                    executor.map(lambda _: client.get_onboarded_app("app"), range(5))
+                )
+            assert len({id(app) for app in apps}) == 5
+            assert _app_reads(server, "app") == 1
+            assert client.app_cache_stats()["coalesced"] == 4
+
+
+def test_app_cache_can_be_disabled():
+    with i2edge_server() as (server, base_url):
+        with EdgeApplicationManager(
+            base_url=base_url, flavour_id="id", app_cache_ttl=None
+        ) as client:
+            client.onboard_app({"appId": "app"})
+            for _ in range(3):
+                client.get_onboarded_app("app")
+            assert _app_reads(server, "app") == 3
+            assert client.app_cache_stats() == {"coalesced": 0}
+        with pytest.raises(ValueError):
+            EdgeApplicationManager(
+                base_url=base_url,
+                flavour_id="id",
+                app_cache_ttl=None,
+                unknown_app_ttl=5,
+            )
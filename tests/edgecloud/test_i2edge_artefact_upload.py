@@ -0,0 +1,96 @@
+# -*- coding: utf-8 -*-
+import os
+
+import pytest
+import requests
+
+from sunrise6g_opensdk.common.multipart import MultipartFileStream
+from sunrise6g_opensdk.edgecloud.adapters.i2edge.client import EdgeApplicationManager
+from sunrise6g_opensdk.edgecloud.adapters.i2edge.common import I2EdgeError
+from tests.edgecloud.test_i2edge_http_session import ARTEFACTS, i2edge_server
+
+CHUNK_SIZE = 64 * 1024
+
+
+@pytest.fixture(name="chart")
+def chart_archive(tmp_path):
+    path = tmp_path / "chart.tgz"
+    path.write_bytes(os.urandom(3 * 1024 * 1024 + 17))
+    return path
+
+
+def test_body_is_read_chunk_by_chunk(chart):
+    progress = []
+    with MultipartFileStream(
+        {"name": "chart"},
+        "chart",
+        str(chart),
+        chunk_size=CHUNK_SIZE,
+        on_progress=lambda sent, total: progress.append((sent, total)),
+    ) as body:
+        chunks = list(body)
+        assert max(len(chunk) for chunk in chunks) == CHUNK_SIZE
+        assert len(b"".join(chunks)) == len(body)
+        assert progress[-1] == (len(body), len(body))
+
+        body.rewind()
+        assert b"".join(body) == b"".join(chunks)
+    assert body.content_type.endswith(body.boundary)
+
+
+def test_chart_is_streamed_to_i2edge(chart):
+    progress = []
+    with i2edge_server() as (server, base_url):
+        with EdgeApplicationManager(base_url=base_url, flavour_id="id") as client:
+            client._upload_artefact(
+                "app",
+                "app-chart",
+                str(chart),
+                chunk_size=CHUNK_SIZE,
+                on_progress=lambda sent, total: progress.append((sent, total)),
+            )
+    artefact = server.artefacts["app"]
+    assert artefact["chart"] == chart.read_bytes()
+    assert artefact["name"] == "app-chart"
+    assert artefact["repo_type"] == "UPLOAD"
+    sent, total = progress[-1]
+    assert sent == total > chart.stat().st_size
+    assert len(progress) > chart.stat().st_size // CHUNK_SIZE
+
+
+def test_failed_uploads_are_sent_again(chart, monkeypatch):
+    closed = []
+    close = requests.Response.close
+
+    def record_close(response):
+        closed.append(response.status_code)
+        close(response)
+
+    monkeypatch.setattr(requests.Response, "close", record_close)
+    with i2edge_server() as (server, base_url):
+        server.failures = 2
+        with EdgeApplicationManager(
+            base_url=base_url, flavour_id="id", max_retries=2
+        ) as client:
+            client._upload_artefact("app", "app-chart", str(chart))
+        assert server.requests == [("POST", ARTEFACTS)] * 3
+        # The failed responses are released before the upload is retried
+        assert closed.count(503) == 2
+        assert server.artefacts["app"]["chart"] == chart.read_bytes()
+
+        server.failures = 1
+        with EdgeApplicationManager(
+            base_url=base_url, flavour_id="id", max_retries=0
+        ) as client:
+            with pytest.raises(I2EdgeError, match="unavailable"):
+                client._upload_artefact("other-app", "other-chart", str(chart))
+        assert "other-app" not in server.artefacts
+
+
+def test_batch_onboarding_uploads_charts(chart):
+    artefacts = {"app": {"artefact_name": "app-chart", "chart_path": str(chart)}}
+    with i2edge_server() as (server, base_url):
+        with EdgeApplicationManager(base_url=base_url, flavour_id="id") as client:
+            outcome = client.onboard_apps([{"appId": "app"}], artefacts=artefacts)
+    assert outcome["onboarded"] == ["app"]
+    assert server.artefacts["app"]["chart"] == chart.read_bytes()
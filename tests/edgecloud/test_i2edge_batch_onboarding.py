@@ -0,0 +1,88 @@
+# -*- coding: utf-8 -*-
+import threading
+import time
+
+from sunrise6g_opensdk.edgecloud.adapters.i2edge.client import EdgeApplicationManager
+from tests.edgecloud.test_i2edge_http_session import APPS, ARTEFACTS, i2edge_server
+
+
+def _manifest(app_id: str) -> dict:
+    return {
+        "appId": app_id,
+        "name": f"{app_id}-chart",
+        "appRepo": {"type": "PUBLICREPO", "imagePath": "https://charts.example.com"},
+    }
+
+
+def test_apps_are_onboarded_concurrently():
+    manifests = [_manifest(f"app-{i}") for i in range(20)]
+    progress = []
+    lock = threading.Lock()
+
+    def on_progress(update):
+        with lock:
+            progress.append(update)
+
+    with i2edge_server() as (server, base_url):
+        server.delay = 0.05
+        with EdgeApplicationManager(base_url=base_url, flavour_id="id") as client:
+            start = time.monotonic()
+            outcome = client.onboard_apps(
+                manifests, max_in_flight=10, on_progress=on_progress
+            )
+            elapsed = time.monotonic() - start
+
+    assert outcome["onboarded"] == [manifest["appId"] for manifest in manifests]
+    assert outcome["errors"] == [] and outcome["rolledBack"] == []
+    assert outcome["throughput"] > 0
+    # 40 sequential requests would take at least 2 seconds
+    assert elapsed < 1
+    assert set(server.artefacts) == set(server.apps) == set(outcome["onboarded"])
+    assert server.artefacts["app-0"]["name"] == "app-0-chart"
+    assert server.artefacts["app-0"]["repo_url"] == "https://charts.example.com"
+    assert sorted(update.done for update in progress) == list(range(1, 21))
+    assert max(progress, key=lambda update: update.done).succeeded == 20
+
+
+def test_artefacts_of_failed_apps_are_rolled_back():
+    manifests = [
+        _manifest("app-0"),
+        _manifest("rejected"),
+        {"name": "no-id"},
+        {"name": "no-id-either"},
+    ]
+    artefacts = {
+        "app-0": {
+            "artefact_name": "chart",
+            "repo_name": "repo",
+            "repo_type": "PRIVATEREPO",
+            "repo_url": "https://private.example.com",
+            "token": "secret",
+        }
+    }
+    with i2edge_server() as (server, base_url):
+        server.rejected_apps.add("rejected")
+        with EdgeApplicationManager(base_url=base_url, flavour_id="id") as client:
+            outcome = client.onboard_apps(manifests, artefacts=artefacts)
+
+    errors = {error["index"]: error for error in outcome["errors"]}
+    assert outcome["onboarded"] == ["app-0"]
+    assert sorted(errors) == [1, 2, 3]
+    assert errors[1]["appId"] == "rejected" and "invalid app" in errors[1]["error"]
+    assert errors[2]["appId"] is None and "appId" in errors[2]["error"]
+    assert errors[3]["appId"] is None and "appId" in errors[3]["error"]
+    assert outcome["rolledBack"] == ["rejected"]
+    assert list(server.artefacts) == ["app-0"]
+    assert server.artefacts["app-0"]["repo_type"] == "PRIVATEREPO"
+    assert ("DELETE", f"{ARTEFACTS}/rejected") in server.requests
+
+
+def test_apps_whose_artefact_fails_are_not_onboarded():
+    with i2edge_server() as (server, base_url):
+        server.failures = 1
+        with EdgeApplicationManager(base_url=base_url, flavour_id="id") as client:
+            outcome = client.onboard_apps([_manifest("app-0")])
+
+    assert [error["appId"] for error in outcome["errors"]] == ["app-0"]
+    assert outcome["rolledBack"] == []
+    assert ("POST", APPS) not in server.requests
@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+from sunrise6g_opensdk.edgecloud.adapters.i2edge.client import EdgeApplicationManager
+from sunrise6g_opensdk.edgecloud.adapters.i2edge.instances import DeployedAppIndex
+from tests.edgecloud.test_i2edge_app_cache import APP_ZONES
+from tests.edgecloud.test_i2edge_http_session import i2edge_server
+from tests.network.test_qod_session_registry import _FakeClock
+
+
+def _listings(server) -> int:
+    return server.requests.count(("GET", "/app/"))
+
+
+def test_lookups_use_the_index_until_refreshed():
+    clock = _FakeClock()
+    instances = [
+        {
+            "name": f"instance-{i}",
+            "release_name": f"app-{i % 10}",
+            "zone_id": f"zone-{i // 10}",
+            "bodytosend": {"namespace": f"namespace-{i}"},
+        }
+        for i in range(1000)
+    ]
+    fetches = []
+
+    def fetch():
+        fetches.append(clock.now)
+        return instances
+
+    index = DeployedAppIndex(fetch, refresh_interval=30, clock=clock)
+    assert index.by_release("app-3", "zone-42")["name"] == "instance-423"
+    assert index.by_namespace("namespace-7")["name"] == "instance-7"
+    assert index.by_name("instance-999")["release_name"] == "app-9"
+    assert index.by_name("instance-1000") is None
+    # Callers get their own copy
+    index.by_name("instance-1")["bodytosend"]["namespace"] = "changed"
+    assert index.by_namespace("namespace-1")["name"] == "instance-1"
+    assert fetches == [0]
+
+    clock.now = 30
+    index.by_name("instance-1")
+    index.invalidate()
+    index.by_name("instance-1")
+    assert fetches == [0, 30, 30]
+    assert index.snapshot() == {"size": 1000, "refreshes": 3, "hits": 7, "misses": 1}
+
+
+def test_deploy_and_undeploy_invalidate_the_index():
+    with i2edge_server() as (server, base_url):
+        with EdgeApplicationManager(base_url=base_url, flavour_id="id") as client:
+            client.onboard_app({"appId": "app"})
+            assert client.get_deployed_app("app", "zone-1") == []
+
+            deployed = client.deploy_app("app", APP_ZONES)
+            for _ in range(5):
+                assert client.get_deployed_app("app", "zone-1") == deployed
+            namespace = deployed["bodytosend"]["namespace"]
+            assert client.get_deployed_app_by_namespace(namespace) == deployed
+            assert client.get_deployed_app_by_name(deployed["name"]) == deployed
+            assert _listings(server) == 2
+
+            client.undeploy_app(deployed["name"])
+            assert client.get_deployed_app_by_name(deployed["name"]) is None
+            assert _listings(server) == 3
+
+
+def test_index_can_be_fetched_on_every_lookup():
+    with i2edge_server() as (server, base_url):
+        with EdgeApplicationManager(
+            base_url=base_url, flavour_id="id", deployed_apps_refresh=0
+        ) as client:
+            client.onboard_app({"appId": "app"})
+            client.deploy_app("app", APP_ZONES)
+            for _ in range(3):
+                client.get_deployed_app("app", "zone-1")
+            assert _listings(server) == 3
@@ -0,0 +1,226 @@
+# -*- coding: utf-8 -*-
+import json
+import threading
+import time
+from contextlib import contextmanager
+from email import policy
+from email.parser import BytesParser
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qsl
+
+import pytest
+
+from sunrise6g_opensdk.common.sdk import Sdk as sdkclient
+from sunrise6g_opensdk.edgecloud.adapters.i2edge.client import EdgeApplicationManager
+from sunrise6g_opensdk.edgecloud.adapters.i2edge.common import I2EdgeError
+
+ZONES = [{"zoneId": "zone-1"}]
+APPS = "/application/onboarding"
+ARTEFACTS = "/artefact"
+
+
+def _form(content_type: str, body: bytes) -> dict:
+    if not content_type.startswith("multipart/form-data"):
+        return dict(parse_qsl(body.decode()))
+    message = BytesParser(policy=policy.default).parsebytes(
+        f"Content-Type: {content_type}\r\n\r\n".encode() + body
+    )
+    return {
+        part.get_param("name", header="content-disposition"): (
+            part.get_payload(decode=True)
+            if part.get_filename()
+            else part.get_payload(decode=True).decode()
+        )
+        for part in message.iter_parts()
+    }
+
+
+class _I2EdgeHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def _reply(self, status: int, payload) -> None:
+        self.server.requests.append((self.command, self.path))
+        self.server.client_ports.add(self.client_address[1])
+        body = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _failed(self) -> bool:
+        if self.server.failures > 0:
+            self.server.failures -= 1
+            self._reply(503, {"message": "unavailable", "detail": {}})
+            return True
+        return False
+
+    def do_GET(self):
+        time.sleep(self.server.delay)
+        if self._failed():
+            return
+        path = self.path.split("?", 1)[0]
+        if path.startswith(f"{APPS}/"):
+            app = self.server.apps.get(path[len(APPS) + 1 :])
+            if app is None:
+                self._reply(404, {"message": "App not found", "detail": {}})
+            else:
+                self._reply(200, app)
+        elif path == "/app/":
+            self._reply(200, self.server.instances)
+        else:
+            self._reply(200, ZONES)
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers["Content-Length"]))
+        time.sleep(self.server.delay)
+        if self._failed():
+            return
+        if self.path == ARTEFACTS:
+            artefact = _form(self.headers["Content-Type"], body)
+            self.server.artefacts[artefact["artefact_id"]] = artefact
+            self._reply(201, {})
+            return
+        payload = json.loads(body)
+        if self.path == APPS:
+            app_id = payload["profile_data"]["app_id"]
+            if app_id in self.server.rejected_apps:
+                self._reply(400, {"message": "invalid app", "detail": {}})
+                return
+            self.server.apps[app_id] = payload
+            self._reply(201, {})
+        elif payload["app_deploy_data"]["zoneInfo"]["zoneId"] in self.server.full_zones:
+            self._reply(507, {"message": "zone full", "detail": {}})
+        else:
+            self._reply(201, self._deploy(payload["app_deploy_data"]))
+
+    def _deploy(self, app_deploy_data: dict) -> dict:
+        app = self.server.apps[app_deploy_data["appId"]]["profile_data"]
+        with self.server.lock:
+            self.server.deployed += 1
+            number = self.server.deployed
+        instance = {
+            "name": f"instance-{number}",
+            "deploy_name": f"instance-{number}",
+            "release_name": app["appMetaData"]["appName"],
+            "zone_id": app_deploy_data["zoneInfo"]["zoneId"],
+            "flavour_id": app_deploy_data["zoneInfo"]["flavourId"],
+            "bodytosend": {"namespace": f"namespace-{number}"},
+        }
+        self.server.instances.append(instance)
+        return instance
+
+    def do_DELETE(self):
+        if self._failed():
+            return
+        collection, _, resource_id = self.path.rpartition("/")
+        if collection == "/app":
+            self.server.instances[:] = [
+                instance
+                for instance in self.server.instances
+                if instance["name"] != resource_id
+            ]
+        elif collection == ARTEFACTS:
+            self.server.artefacts.pop(resource_id, None)
+        else:
+            self.server.apps.pop(resource_id, None)
+        self._reply(200, {})
+
+    def log_message(self, format, *args):
+        pass
+
+
+@contextmanager
+def i2edge_server():
+    """Runs a minimal i2Edge API, yielding the server and its base URL."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _I2EdgeHandler)
+    server.requests = []
+    server.client_ports = set()
+    server.apps = {}
+    server.artefacts = {}
+    server.rejected_apps = set()
+    server.instances = []
+    server.deployed = 0
+    server.full_zones = set()
+    server.lock = threading.Lock()
+    server.delay = 0
+    server.failures = 0
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield server, f"http://127.0.0.1:{server.server_port}"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+@pytest.fixture(name="i2edge")
+def local_i2edge_server():
+    with i2edge_server() as server:
+        yield server
+
+
+def test_calls_share_pooled_connections(i2edge):
+    server, base_url = i2edge
+    with EdgeApplicationManager(base_url=base_url, flavour_id="id") as client:
+        for _ in range(5):
+            assert client.get_edge_cloud_zones() == ZONES
+    assert len(server.requests) == 5
+    assert len(server.client_ports) == 1
+    assert client.http_session is None
+
+
+def test_slow_i2edge_times_out(i2edge):
+    server, base_url = i2edge
+    server.delay = 1
+    with EdgeApplicationManager(
+        base_url=base_url, flavour_id="id", read_timeout=0.2, max_retries=0
+    ) as client:
+        start = time.monotonic()
+        with pytest.raises(I2EdgeError, match="did not answer"):
+            client.get_edge_cloud_zones()
+        assert time.monotonic() - start < 0.9
+
+
+def test_unreachable_i2edge_raises_i2edge_error():
+    with EdgeApplicationManager(
+        base_url="http://127.0.0.1:1", flavour_id="id", max_retries=0
+    ) as client:
+        with pytest.raises(I2EdgeError, match="did not answer"):
+            client.get_all_onboarded_apps()
+
+
+def test_only_idempotent_calls_are_retried(i2edge):
+    server, base_url = i2edge
+    server.failures = 2
+    with EdgeApplicationManager(
+        base_url=base_url, flavour_id="id", max_retries=2
+    ) as client:
+        assert client.get_edge_cloud_zones() == ZONES
+        assert len(server.requests) == 3
+
+        server.failures = 1
+        with pytest.raises(I2EdgeError, match="unavailable"):
+            client.onboard_app({"appId": "app"})
+        assert server.requests[3:] == [("POST", "/application/onboarding")]
+    assert client.resilience.snapshot()["retries"] == 2
+
+
+def test_timeouts_from_adapter_specs():
+    adapters = sdkclient.create_adapters_from(
+        {
+            "edgecloud": {
+                "client_name": "i2edge",
+                "base_url": "http://test-nbi-i2edge.sunrise6g",
+                "flavour_id": "id",
+                "connect_timeout": 2,
+                "read_timeout": 10,
+                "pool_maxsize": 4,
+            }
+        }
+    )
+    client = adapters["edgecloud"]
+    assert client.http_session.connect_timeout == 2
+    assert client.http_session.read_timeout == 10
+    assert client.http_session.get_adapter(client.base_url)._pool_maxsize == 4
+    client.close()
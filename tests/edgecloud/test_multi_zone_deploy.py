@@ -0,0 +1,196 @@
+# -*- coding: utf-8 -*-
+import threading
+import time
+
+import pytest
+
+from sunrise6g_opensdk.edgecloud.adapters.i2edge import client as i2edge_client
+from sunrise6g_opensdk.edgecloud.adapters.i2edge.client import EdgeApplicationManager
+from sunrise6g_opensdk.edgecloud.adapters.kubernetes.client import (
+    EdgeApplicationManager as KubernetesManager,
+)
+from sunrise6g_opensdk.edgecloud.core.edgecloud_interface import (
+    EdgeCloudManagementInterface,
+)
+from sunrise6g_opensdk.edgecloud.core.multi_zone import deploy_to_zones, zone_id_of
+from tests.edgecloud.test_i2edge_http_session import i2edge_server
+
+
+def _app_zones(count: int) -> list:
+    return [{"EdgeCloudZone": {"edgeCloudZoneId": f"zone-{i}"}} for i in range(count)]
+
+
+class _Platform:
+    def __init__(self, failing=()):
+        self.failing = set(failing)
+        self.lock = threading.Lock()
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.instances = set()
+
+    def deploy(self, zone_id: str) -> dict:
+        with self.lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        time.sleep(0.02)
+        with self.lock:
+            self.in_flight -= 1
+            if zone_id in self.failing:
+                raise RuntimeError(f"{zone_id} is full")
+            self.instances.add(f"{zone_id}-instance")
+        return {"id": f"{zone_id}-instance"}
+
+    def undeploy(self, instance_id: str) -> None:
+        with self.lock:
+            self.instances.remove(instance_id)
+
+
+class _Adapter(EdgeCloudManagementInterface):
+    """Adapter relying on the default deploy_app_to_zones."""
+
+    def __init__(self, platform: _Platform):
+        self.platform = platform
+
+    def deploy_app(self, app_id, app_zones):
+        (app_zone,) = app_zones
+        return {"appInstanceId": self.platform.deploy(zone_id_of(app_zone))["id"]}
+
+    def undeploy_app(self, app_instance_id):
+        self.platform.undeploy(app_instance_id)
+
+    onboard_app = get_all_onboarded_apps = get_onboarded_app = None
+    delete_onboarded_app = get_all_deployed_apps = None
+    get_edge_cloud_zones = get_edge_cloud_zones_details = None
+
+
+def test_zones_are_deployed_concurrently():
+    platform = _Platform(failing={"zone-3"})
+    zone_ids = [f"zone-{i}" for i in range(20)]
+    deployment = deploy_to_zones(
+        platform.deploy, zone_ids, instance_id=lambda r: r["id"], max_in_flight=5
+    )
+    assert platform.max_in_flight == 5
+    assert len(deployment.instance_ids) == 19
+    assert deployment.instance_ids["zone-0"] == "zone-0-instance"
+    assert str(deployment.errors["zone-3"]) == "zone-3 is full"
+    # All zones were required
+    assert not deployment.quorum_met
+    assert len(platform.instances) == 19
+
+
+def test_successful_zones_are_rolled_back_below_the_quorum():
+    platform = _Platform(failing={"zone-1", "zone-2"})
+    zone_ids = [f"zone-{i}" for i in range(4)]
+    deployment = deploy_to_zones(
+        platform.deploy,
+        zone_ids,
+        instance_id=lambda r: r["id"],
+        quorum=3,
+        undeploy=platform.undeploy,
+    )
+    assert platform.instances == set()
+    assert deployment.as_dict() == {
+        "appInstanceIds": {},
+        "errors": {"zone-1": "zone-1 is full", "zone-2": "zone-2 is full"},
+        "rolledBack": ["zone-0", "zone-3"],
+        "quorumMet": False,
+    }
+
+    platform.failing = {"zone-1"}
+    deployment = deploy_to_zones(
+        platform.deploy,
+        zone_ids,
+        instance_id=lambda r: r["id"],
+        quorum=3,
+        undeploy=platform.undeploy,
+    )
+    assert deployment.quorum_met
+    assert len(platform.instances) == 3
+
+
+def test_invalid_zones_are_rejected():
+    with pytest.raises(ValueError):
+        deploy_to_zones(print, [], instance_id=str)
+    with pytest.raises(ValueError):
+        deploy_to_zones(print, ["zone-0"], instance_id=str, quorum=2)
+
+
+def test_adapters_deploy_app_once_per_zone_by_default():
+    platform = _Platform(failing={"zone-1"})
+    deployed = _Adapter(platform).deploy_app_to_zones(
+        "app", _app_zones(3), quorum=2, rollback=True
+    )
+    assert deployed["appInstanceIds"] == {
+        "zone-0": "zone-0-instance",
+        "zone-2": "zone-2-instance",
+    }
+    assert deployed["errors"] == {"zone-1": "zone-1 is full"}
+    assert deployed["quorumMet"]
+
+
+def test_kubernetes_names_an_instance_per_zone():
+    bodies = []
+
+    def deploy_app(body):
+        bodies.append(body)
+        if body["edgeCloudZoneId"] == "zone-1":
+            return {"Error": "quota exceeded"}
+        return {"appInstanceId": body["name"]}
+
+    client = KubernetesManager(base_url="")
+    client.deploy_app = deploy_app
+    deployed = client.deploy_app_to_zones("app", _app_zones(2), quorum=1)
+    assert deployed["appInstanceIds"] == {"zone-0": "app-zone-0"}
+    assert deployed["errors"] == {"zone-1": "quota exceeded"}
+    assert sorted(body["name"] for body in bodies) == ["app-zone-0", "app-zone-1"]
+
+
+def test_i2edge_deploy_app_warns_about_ignored_zones(monkeypatch):
+    warnings = []
+    monkeypatch.setattr(
+        i2edge_client.log, "warning", lambda *args: warnings.append(args)
+    )
+    with i2edge_server() as (server, base_url):
+        with EdgeApplicationManager(base_url=base_url, flavour_id="id") as client:
+            client.onboard_app({"appId": "app"})
+            deployed = client.deploy_app("app", _app_zones(2))
+    assert deployed["zone_id"] == "zone-0"
+    assert len(server.instances) == 1
+    assert "deploy_app_to_zones" in warnings[0][0]
+
+
+def test_i2edge_deploys_every_zone():
+    with i2edge_server() as (server, base_url):
+        with EdgeApplicationManager(base_url=base_url, flavour_id="id") as client:
+            client.onboard_app({"appId": "app"})
+            deployed = client.deploy_app_to_zones("app", _app_zones(20), quorum=18)
+            instance_ids = deployed["appInstanceIds"]
+            assert len(instance_ids) == 20
+            assert {
+                client.get_deployed_app("app", zone_id)["deploy_name"]
+                for zone_id in instance_ids
+            } == set(instance_ids.values())
+            assert deployed["quorumMet"]
+
+            # A single zone is summarised the same way
+            deployed = client.deploy_app_to_zones("app", _app_zones(1))
+            assert list(deployed["appInstanceIds"]) == ["zone-0"]
+
+            # deploy_app keeps returning the i2Edge deployment
+            deployed = client.deploy_app("app", _app_zones(1))
+            assert deployed["zone_id"] == "zone-0"
+
+
+def test_i2edge_rolls_back_when_the_quorum_fails():
+    with i2edge_server() as (server, base_url):
+        server.full_zones = {"zone-1", "zone-2"}
+        with EdgeApplicationManager(base_url=base_url, flavour_id="id") as client:
+            client.onboard_app({"appId": "app"})
+            deployed = client.deploy_app_to_zones(
+                "app", _app_zones(4), quorum=3, rollback=True
+            )
+            assert deployed["appInstanceIds"] == {}
+            assert set(deployed["errors"]) == {"zone-1", "zone-2"}
+            assert "zone full" in deployed["errors"]["zone-1"]
+            assert sorted(deployed["rolledBack"]) == ["zone-0", "zone-3"]
+            assert server.instances == []
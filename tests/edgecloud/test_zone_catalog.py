@@ -0,0 +1,128 @@
+# -*- coding: utf-8 -*-
+import time
+
+import pytest
+
+from sunrise6g_opensdk.common.cache import RefreshAheadCache
+from sunrise6g_opensdk.edgecloud.adapters.i2edge.client import EdgeApplicationManager
+from sunrise6g_opensdk.edgecloud.core.zone_catalog import ZoneCatalog
+from tests.edgecloud.test_i2edge_http_session import ZONES, i2edge_server
+from tests.network.test_qod_session_registry import _FakeClock
+
+
+class _Loader:
+    def __init__(self):
+        self.loads = 0
+        self.fail = False
+
+    def __call__(self, key):
+        if self.fail:
+            raise RuntimeError("platform down")
+        self.loads += 1
+        return f"{key}-{self.loads}"
+
+
+def test_values_are_reloaded_ahead_of_expiry():
+    clock = _FakeClock()
+    background = []
+    load = _Loader()
+    cache = RefreshAheadCache(
+        load,
+        ttl=100,
+        refresh_ahead=20,
+        max_stale=50,
+        clock=clock,
+        spawn=background.append,
+    )
+    assert cache.get("zones") == "zones-1"
+    clock.now = 79
+    assert cache.get("zones") == "zones-1"
+    assert not background
+
+    # Served from memory while reloaded once in the background
+    clock.now = 80
+    assert cache.get("zones") == "zones-1"
+    assert cache.get("zones") == "zones-1"
+    assert len(background) == 1
+    background.pop()()
+    assert cache.get("zones") == "zones-2"
+    assert cache.age("zones") == 0
+
+    # Stale values are served while reloaded, until 'max_stale' is over
+    clock.now = 180
+    assert cache.get("zones") == "zones-2"
+    background.pop()()
+    clock.now = 329
+    assert cache.get("zones") == "zones-3"
+    clock.now = 330
+    assert cache.get("zones") == "zones-4"
+    assert load.loads == 4
+    assert cache.snapshot() == {
+        "size": 1,
+        "ttl": 100,
+        "hits": 4,
+        "stale_hits": 2,
+        "misses": 2,
+        "reloads": 4,
+        "reload_failures": 0,
+    }
+
+
+def test_failed_background_reloads_keep_the_value():
+    clock = _FakeClock()
+    load = _Loader()
+    cache = RefreshAheadCache(load, ttl=100, clock=clock, spawn=lambda reload: reload())
+    cache.get("zones")
+    load.fail = True
+    clock.now = 90
+    assert cache.get("zones") == "zones-1"
+    assert cache.get("zones") == "zones-1"
+    assert cache.snapshot()["reload_failures"] == 2
+
+    # Expired: the error reaches the caller
+    clock.now = 100
+    with pytest.raises(RuntimeError):
+        cache.get("zones")
+    assert cache.age("zones") == 100
+
+
+def test_invalid_settings_are_rejected():
+    with pytest.raises(ValueError):
+        RefreshAheadCache(str, ttl=0)
+    with pytest.raises(ValueError):
+        RefreshAheadCache(str, ttl=10, refresh_ahead=20)
+    with pytest.raises(ValueError):
+        RefreshAheadCache(str, ttl=10, max_stale=-1)
+
+
+def _zone_listings(server) -> int:
+    return server.requests.count(("GET", "/zones/list"))
+
+
+def test_catalog_serves_the_zones_of_an_adapter():
+    with i2edge_server() as (server, base_url):
+        with EdgeApplicationManager(base_url=base_url, flavour_id="id") as client:
+            catalog = ZoneCatalog(client, ttl=0.5, refresh_ahead=0.25)
+            assert catalog.zones_age() is None
+            for _ in range(10):
+                assert catalog.get_edge_cloud_zones() == ZONES
+            assert _zone_listings(server) == 1
+
+            # Reloaded in the background, reads do not wait for i2Edge
+            time.sleep(0.3)
+            server.delay = 0.5
+            start = time.monotonic()
+            assert catalog.get_edge_cloud_zones() == ZONES
+            assert time.monotonic() - start < 0.25
+            deadline = time.monotonic() + 5
+            while catalog.zones_age() >= 0.3 and time.monotonic() < deadline:
+                time.sleep(0.05)
+            assert _zone_listings(server) == 2
+
+            catalog.invalidate()
+            server.delay = 0
+            catalog.get_edge_cloud_zones()
+            assert _zone_listings(server) == 3
+            # Other calls go to the adapter
+            assert catalog.get_all_deployed_apps() == []
+            assert catalog.stats()["reloads"] == 3
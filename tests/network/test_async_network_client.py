@@ -0,0 +1,146 @@
+# -*- coding: utf-8 -*-
+import asyncio
+import inspect
+import json
+import subprocess
+import sys
+import threading
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from sunrise6g_opensdk.network.adapters.oai.async_client import (
+    AsyncNetworkManager as AsyncOaiClient,
+)
+from sunrise6g_opensdk.network.adapters.open5gcore.async_client import (
+    AsyncNetworkManager as AsyncOpen5GCoreClient,
+)
+from sunrise6g_opensdk.network.adapters.open5gs.async_client import (
+    AsyncNetworkManager as AsyncOpen5GSClient,
+)
+from sunrise6g_opensdk.network.core.common import CapabilityNotSupported, CoreHttpError
+
+CAMARA_SESSION = {
+    "duration": 3600,
+    "device": {
+        "ipv4Address": {
+            "publicAddress": "10.45.0.10",
+            "privateAddress": "10.45.0.10",
+        }
+    },
+    "applicationServer": {"ipv4Address": "10.45.0.1"},
+    "devicePorts": {"ports": [5000]},
+    "applicationServerPorts": {"ports": [6000]},
+    "qosProfile": "qos-e",
+    "sink": "https://endpoint.example.com/sink",
+}
+
+ASYNC_CLIENTS = [AsyncOpen5GSClient, AsyncOaiClient, AsyncOpen5GCoreClient]
+
+
+class _QosHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def _reply(self, status, payload=None):
+        body = json.dumps(payload).encode() if payload is not None else b""
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_POST(self):
+        subscription = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        subscription["self"] = f"{self.path}/{uuid.uuid4()}"
+        self.server.subscriptions[subscription["self"]] = subscription
+        self._reply(201, subscription)
+
+    def do_GET(self):
+        subscription = self.server.subscriptions.get(self.path)
+        if subscription is None:
+            self._reply(404, {"title": "Not Found"})
+        else:
+            self._reply(200, subscription)
+
+    def do_DELETE(self):
+        self.server.subscriptions.pop(self.path, None)
+        self._reply(204)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class _NefServer(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 128
+
+
+@pytest.fixture(name="nef_url")
+def local_nef_server():
+    server = _NefServer(("127.0.0.1", 0), _QosHandler)
+    server.subscriptions = {}
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}"
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.mark.parametrize("client_class", ASYNC_CLIENTS)
+def test_camara_operations_are_coroutines(client_class):
+    network_client = client_class(base_url="http://test-nef.url", scs_as_id="scs")
+    assert inspect.iscoroutinefunction(network_client.create_qod_session)
+    assert inspect.iscoroutinefunction(network_client.get_qod_session)
+    assert inspect.iscoroutinefunction(network_client.delete_qod_session)
+    assert network_client.http_session is None
+    asyncio.run(network_client.aclose())
+
+
+@pytest.mark.parametrize("client_class", ASYNC_CLIENTS)
+def test_async_qod_session_lifecycle(client_class, nef_url):
+    async def scenario():
+        async with client_class(base_url=nef_url, scs_as_id="scs") as network_client:
+            sessions = await asyncio.gather(
+                *(
+                    network_client.create_qod_session(dict(CAMARA_SESSION))
+                    for _ in range(20)
+                )
+            )
+            session_ids = {str(session["sessionId"]) for session in sessions}
+            assert len(session_ids) == 20
+
+            session_id = session_ids.pop()
+            session = await network_client.get_qod_session(session_id)
+            assert str(session["sessionId"]) == session_id
+
+            await network_client.delete_qod_session(session_id)
+            with pytest.raises(CoreHttpError):
+                await network_client.get_qod_session(session_id)
+
+    asyncio.run(scenario())
+
+
+def test_async_capability_check():
+    async def scenario():
+        async with AsyncOpen5GCoreClient(
+            base_url="http://test-nef.url", scs_as_id="scs"
+        ) as network_client:
+            with pytest.raises(CapabilityNotSupported):
+                await network_client.delete_traffic_influence_resource("id")
+
+    asyncio.run(scenario())
+
+
+def test_sync_adapters_do_not_load_the_async_client():
+    script = """
+import sys
+
+import sunrise6g_opensdk.network.adapters.oai.client
+import sunrise6g_opensdk.network.adapters.open5gcore.client
+import sunrise6g_opensdk.network.adapters.open5gs.client
+
+loaded = {"httpx", "sunrise6g_opensdk.network.core.async_base_network_client"}
+assert not loaded & set(sys.modules), loaded & set(sys.modules)
+"""
+    subprocess.run([sys.executable, "-c", script], check=True)
@@ -0,0 +1,112 @@
+# -*- coding: utf-8 -*-
+import pytest
+
+from sunrise6g_opensdk.network.adapters.errors import NetworkPlatformError
+from sunrise6g_opensdk.network.core import schemas
+from sunrise6g_opensdk.network.core.base_network_client import (
+    MAX_FLOW_PORT_COMBINATIONS,
+    build_flows,
+    flatten_port_spec,
+    merge_port_spec,
+)
+from tests.network.test_bulk_qod_sessions import camara_session
+
+
+def _ports_spec(ports=None, ranges=None) -> schemas.PortsSpec:
+    return schemas.PortsSpec.model_validate(
+        {
+            "ports": ports,
+            "ranges": [{"from": start, "to": end} for start, end in ranges or []]
+            or None,
+        }
+    )
+
+
+def _session_info(device_ports=None, server_ports=None) -> schemas.CreateSession:
+    session_info = camara_session("10.45.0.10")
+    if device_ports is not None:
+        session_info["devicePorts"] = device_ports.model_dump(by_alias=True)
+    if server_ports is not None:
+        session_info["applicationServerPorts"] = server_ports.model_dump(by_alias=True)
+    return schemas.CreateSession.model_validate(session_info)
+
+
+def _rules(flows: list[schemas.FlowInfo]) -> list[str]:
+    assert len(flows) == 1
+    return flows[0].flowDescriptions[0].split(", ")
+
+
+def test_empty_spec_matches_every_port():
+    assert merge_port_spec(None) == [(0, 65535)]
+    assert flatten_port_spec(schemas.PortsSpec()) == ["0-65535"]
+
+
+def test_ports_and_ranges_are_merged():
+    ports_spec = _ports_spec(
+        ports=[5000, 80, 5001, 80, 8080, 5003],
+        ranges=[(5002, 5002), (7000, 7100), (7050, 7200), (7201, 7300)],
+    )
+    assert merge_port_spec(ports_spec) == [
+        (80, 80),
+        (5000, 5003),
+        (7000, 7300),
+        (8080, 8080),
+    ]
+    assert flatten_port_spec(ports_spec) == ["80", "5000-5003", "7000-7300", "8080"]
+
+
+def test_invalid_range_is_rejected():
+    with pytest.raises(NetworkPlatformError, match="6000-5000"):
+        merge_port_spec(_ports_spec(ranges=[(6000, 5000)]))
+
+
+def test_flow_descriptions():
+    flows = build_flows(
+        1, _session_info(device_ports=_ports_spec(ports=[5000, 5001, 5000]))
+    )
+    assert flows[0].flowId == 1
+    assert _rules(flows) == [
+        "permit in ip from 10.45.0.10 5000-5001 to 10.45.0.1 0-65535",
+        "permit out ip from 10.45.0.1 0-65535 to 10.45.0.10 5000-5001",
+    ]
+
+
+def test_combinations_are_deduplicated():
+    flows = build_flows(
+        1,
+        _session_info(
+            device_ports=_ports_spec(ports=[1000, 3000, 1000, 3000]),
+            server_ports=_ports_spec(ports=[80, 443], ranges=[(443, 443)]),
+        ),
+    )
+    rules = _rules(flows)
+    assert len(rules) == len(set(rules)) == 2 * 2 * 2
+
+
+def test_large_contiguous_specs_collapse():
+    flows = build_flows(
+        1,
+        _session_info(
+            device_ports=_ports_spec(ports=list(range(10000, 20000))),
+            server_ports=_ports_spec(
+                ports=list(range(0, 65536, 2)), ranges=[(1, 65535)]
+            ),
+        ),
+    )
+    assert _rules(flows) == [
+        "permit in ip from 10.45.0.10 10000-19999 to 10.45.0.1 0-65535",
+        "permit out ip from 10.45.0.1 0-65535 to 10.45.0.10 10000-19999",
+    ]
+
+
+def test_combinations_are_capped():
+    scattered = _ports_spec(ports=list(range(0, 2 * MAX_FLOW_PORT_COMBINATIONS, 2)))
+    build_flows(1, _session_info(device_ports=scattered))
+
+    with pytest.raises(NetworkPlatformError, match="above the limit"):
+        build_flows(
+            1,
+            _session_info(
+                device_ports=scattered, server_ports=_ports_spec(ports=[80, 443])
+            ),
+        )
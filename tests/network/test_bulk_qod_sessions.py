@@ -0,0 +1,112 @@
+# -*- coding: utf-8 -*-
+import json
+import threading
+import time
+import uuid
+
+import requests
+
+from sunrise6g_opensdk.common.batch import percentile
+from sunrise6g_opensdk.common.sdk import Sdk as sdkclient
+from sunrise6g_opensdk.network.core.common import CoreHttpError
+
+
+def camara_session(device_ip: str) -> dict:
+    return {
+        "duration": 3600,
+        "device": {
+            "ipv4Address": {"publicAddress": device_ip, "privateAddress": device_ip}
+        },
+        "applicationServer": {"ipv4Address": "10.45.0.1"},
+        "qosProfile": "qos-e",
+        "sink": "https://endpoint.example.com/sink",
+    }
+
+
+class _FakeNefSession(requests.Session):
+    """Answers NEF requests in memory, tracking the peak of concurrent calls."""
+
+    def __init__(self, delay: float = 0.02, failing_ips=()):
+        super().__init__()
+        self.delay = delay
+        self.failing_ips = set(failing_ips)
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.lock = threading.Lock()
+
+    def request(self, method, url, headers=None, data=None, **kwargs):
+        with self.lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        time.sleep(self.delay)
+        with self.lock:
+            self.in_flight -= 1
+
+        response = requests.Response()
+        response.url = url
+        response.status_code = 204
+        response._content = b""
+        if method == "POST":
+            subscription = json.loads(data)
+            if subscription.get("ueIpv4Addr") in self.failing_ips:
+                response.status_code = 500
+            else:
+                subscription["self"] = f"{url}/{uuid.uuid4()}"
+                response.status_code = 201
+                response._content = json.dumps(subscription).encode()
+        return response
+
+
+def _network_client(fake_session):
+    adapter_specs = {
+        "network": {
+            "client_name": "open5gs",
+            "base_url": "http://test-nef.url",
+            "scs_as_id": "scs",
+        }
+    }
+    network_client = sdkclient.create_adapters_from(adapter_specs)["network"]
+    network_client.http_session = fake_session
+    return network_client
+
+
+def test_create_qod_sessions_reports_per_item_outcome():
+    fake_session = _FakeNefSession(failing_ips={"10.45.0.3"})
+    network_client = _network_client(fake_session)
+    sessions = [camara_session(f"10.45.0.{i}") for i in range(1, 31)]
+    sessions[4]["qosProfile"] = "qos-unknown"  # rejected by Open5GS validation
+    sessions[7]["duration"] = 0  # rejected by the CAMARA schema
+
+    batch = network_client.create_qod_sessions(sessions, max_in_flight=8)
+
+    assert [item.index for item in batch.items] == list(range(30))
+    assert set(batch.errors) == {2, 4, 7}
+    assert isinstance(batch.errors[2], CoreHttpError)
+    assert batch.items[4].latency is None and batch.items[7].latency is None
+    assert len(batch.results) == 27
+    assert all("sessionId" in result for result in batch.results)
+    assert batch.stats.total == 30
+    assert batch.stats.succeeded == 27
+    assert batch.stats.failed == 3
+    assert batch.stats.throughput > 0
+    assert batch.stats.latency_p50 <= batch.stats.latency_p99
+    assert 1 < fake_session.max_in_flight <= 8
+
+
+def test_delete_qod_sessions_runs_concurrently():
+    fake_session = _FakeNefSession(delay=0.05)
+    network_client = _network_client(fake_session)
+    session_ids = [str(uuid.uuid4()) for _ in range(20)]
+
+    batch = network_client.delete_qod_sessions(session_ids, max_in_flight=10)
+
+    assert batch.stats.succeeded == 20
+    assert fake_session.max_in_flight == 10
+    assert batch.stats.elapsed < 20 * 0.05
+
+
+def test_percentile_nearest_rank():
+    values = [float(v) for v in range(1, 101)]
+    assert percentile(values, 50) == 50.0
+    assert percentile(values, 99) == 99.0
+    assert percentile([], 50) is None
@@ -0,0 +1,104 @@
+# -*- coding: utf-8 -*-
+import json
+import threading
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from sunrise6g_opensdk.common.sdk import Sdk as sdkclient
+
+CAMARA_SESSION = {
+    "duration": 3600,
+    "device": {
+        "ipv4Address": {
+            "publicAddress": "10.45.0.10",
+            "privateAddress": "10.45.0.10",
+        }
+    },
+    "applicationServer": {"ipv4Address": "10.45.0.1"},
+    "devicePorts": {"ports": [5000]},
+    "applicationServerPorts": {"ports": [6000]},
+    "qosProfile": "qos-e",
+    "sink": "https://endpoint.example.com/sink",
+}
+
+
+class _QosHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):
+        self.server.client_ports.add(self.client_address[1])
+        subscription = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        subscription["self"] = f"{self.path}/{uuid.uuid4()}"
+        body = json.dumps(subscription).encode()
+        self.send_response(201)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture(name="nef_url")
+def local_nef_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _QosHandler)
+    server.client_ports = set()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server, f"http://127.0.0.1:{server.server_port}"
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.mark.parametrize("client_name", ["open5gs", "oai", "open5gcore"])
+def test_pool_settings_from_adapter_specs(client_name):
+    adapter_specs = {
+        "network": {
+            "client_name": client_name,
+            "base_url": "http://test-nef.url",
+            "scs_as_id": "scs",
+            "pool_connections": 2,
+            "pool_maxsize": 32,
+            "pool_block": True,
+        }
+    }
+    network_client = sdkclient.create_adapters_from(adapter_specs)["network"]
+    http_adapter = network_client.http_session.get_adapter("http://test-nef.url")
+    assert http_adapter._pool_connections == 2
+    assert http_adapter._pool_maxsize == 32
+    assert http_adapter._pool_block is True
+    network_client.close()
+    assert network_client.http_session is None
+
+
+def test_keep_alive_disabled_sends_connection_close():
+    adapter_specs = {
+        "network": {
+            "client_name": "open5gs",
+            "base_url": "http://test-nef.url",
+            "scs_as_id": "scs",
+            "keep_alive": False,
+        }
+    }
+    with sdkclient.create_adapters_from(adapter_specs)["network"] as network_client:
+        assert network_client.http_session.headers["Connection"] == "close"
+    assert network_client.http_session is None
+
+
+def test_qod_sessions_reuse_pooled_connection(nef_url):
+    server, base_url = nef_url
+    adapter_specs = {
+        "network": {
+            "client_name": "open5gs",
+            "base_url": base_url,
+            "scs_as_id": "scs",
+        }
+    }
+    with sdkclient.create_adapters_from(adapter_specs)["network"] as network_client:
+        for _ in range(5):
+            response = network_client.create_qod_session(dict(CAMARA_SESSION))
+            assert "sessionId" in response
+    assert len(server.client_ports) == 1
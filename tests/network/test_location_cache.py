@@ -0,0 +1,146 @@
+# -*- coding: utf-8 -*-
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from sunrise6g_opensdk.common.sdk import Sdk as sdkclient
+from sunrise6g_opensdk.network.adapters.open5gs.async_client import (
+    AsyncNetworkManager as AsyncOpen5GSClient,
+)
+from sunrise6g_opensdk.network.core import schemas
+from sunrise6g_opensdk.network.core.base_network_client import location_is_fresh
+from sunrise6g_opensdk.network.core.common import CoreHttpError
+from sunrise6g_opensdk.network.nef_emulator import NefEmulator
+
+
+def _network_client(base_url: str, **kwargs):
+    adapter_specs = {
+        "network": {
+            "client_name": "open5gs",
+            "base_url": base_url,
+            "scs_as_id": "scs",
+            **kwargs,
+        }
+    }
+    return sdkclient.create_adapters_from(adapter_specs)["network"]
+
+
+def _request(phone_number: str = "+306912345678", max_age: int | None = 60):
+    return schemas.RetrievalLocationRequest(
+        device=schemas.Device(phoneNumber=phone_number), maxAge=max_age
+    )
+
+
+def _location(age: float) -> schemas.Location:
+    return schemas.Location.model_validate(
+        {
+            "lastLocationTime": datetime.now(timezone.utc) - timedelta(seconds=age),
+            "area": {
+                "areaType": "CIRCLE",
+                "center": {"latitude": 41.38, "longitude": 2.17},
+                "radius": 100,
+            },
+        }
+    )
+
+
+def test_location_freshness():
+    assert location_is_fresh(_location(age=5), max_age=10)
+    assert not location_is_fresh(_location(age=15), max_age=10)
+    assert not location_is_fresh(_location(age=1), max_age=0)
+    assert location_is_fresh(_location(age=3600), max_age=None)
+
+
+def test_cached_locations_are_served_within_max_age():
+    with NefEmulator() as emulator:
+        with _network_client(emulator.base_url, location_cache_ttl=60) as client:
+            first = client.create_monitoring_event_subscription(_request())
+            second = client.create_monitoring_event_subscription(_request())
+            client.create_monitoring_event_subscription(_request(max_age=None))
+            assert emulator.requests_served == 1
+            assert second == first
+            assert second is not first
+
+            # A fresh calculation is required, the cache is refreshed
+            client.create_monitoring_event_subscription(_request(max_age=0))
+            # Other devices are not served from the cache
+            client.create_monitoring_event_subscription(_request("+306900000000"))
+            assert emulator.requests_served == 3
+
+            stats = client.location_cache_stats()
+    assert stats["hits"] == 2
+    assert stats["misses"] == 3
+    assert stats["size"] == 2
+
+
+def test_cache_is_disabled_by_default():
+    with NefEmulator() as emulator:
+        with _network_client(emulator.base_url) as client:
+            for _ in range(3):
+                client.create_monitoring_event_subscription(_request())
+            assert emulator.requests_served == 3
+            assert client.location_cache_stats() == {"coalesced": 0}
+
+
+def test_concurrent_requests_share_one_nef_call():
+    with NefEmulator(latency=0.2) as emulator:
+        with _network_client(emulator.base_url) as client:
+            with ThreadPoolExecutor(max_workers=10) as executor:
+                locations = list(
+                    executor.map(
+                        lambda _: client.create_monitoring_event_subscription(
+                            _request()
+                        ),
+                        range(10),
+                    )
+                )
+            assert emulator.requests_served == 1
+            assert client.location_cache_stats()["coalesced"] == 9
+    assert all(location == locations[0] for location in locations)
+    assert len({id(location) for location in locations}) == 10
+
+
+def test_failures_are_shared_but_not_cached():
+    with NefEmulator(latency=0.1, error_rate=1.0) as emulator:
+        with _network_client(
+            emulator.base_url, location_cache_ttl=60, max_retries=0
+        ) as client:
+            with ThreadPoolExecutor(max_workers=4) as executor:
+                futures = [
+                    executor.submit(
+                        client.create_monitoring_event_subscription, _request()
+                    )
+                    for _ in range(4)
+                ]
+                for future in futures:
+                    with pytest.raises(CoreHttpError, match="503"):
+                        future.result()
+            assert emulator.requests_served == 1
+
+            emulator.error_rate = 0.0
+            client.create_monitoring_event_subscription(_request())
+            assert emulator.requests_served == 2
+
+
+def test_async_requests_share_one_nef_call():
+    async def scenario(base_url):
+        async with AsyncOpen5GSClient(
+            base_url=base_url, scs_as_id="scs", location_cache_ttl=60
+        ) as client:
+            locations = await asyncio.gather(
+                *(
+                    client.create_monitoring_event_subscription(_request())
+                    for _ in range(5)
+                )
+            )
+            await client.create_monitoring_event_subscription(_request())
+            return locations, client.location_cache_stats()
+
+    with NefEmulator(latency=0.1) as emulator:
+        locations, stats = asyncio.run(scenario(emulator.base_url))
+        assert emulator.requests_served == 1
+    assert stats["coalesced"] == 4
+    assert stats["hits"] == 1
+    assert all(location == locations[0] for location in locations)
@@ -0,0 +1,132 @@
+# -*- coding: utf-8 -*-
+import time
+
+import pytest
+import requests
+
+from benchmarks.network_adapters import (
+    benchmark_adapter,
+    compare,
+    qod_session_info,
+    ti_info,
+)
+from sunrise6g_opensdk.common.sdk import Sdk as sdkclient
+from sunrise6g_opensdk.network.core.common import CoreHttpError
+from sunrise6g_opensdk.network.core.schemas import (
+    Device,
+    Location,
+    RetrievalLocationRequest,
+)
+from sunrise6g_opensdk.network.nef_emulator import NefEmulator
+
+ADAPTERS = ["open5gs", "oai", "open5gcore"]
+
+
+def _network_client(client_name: str, base_url: str):
+    adapter_specs = {
+        "network": {
+            "client_name": client_name,
+            "base_url": base_url,
+            "scs_as_id": "scs",
+        }
+    }
+    return sdkclient.create_adapters_from(adapter_specs)["network"]
+
+
+@pytest.fixture(name="emulator")
+def nef_emulator():
+    with NefEmulator() as emulator:
+        yield emulator
+
+
+@pytest.mark.parametrize("client_name", ADAPTERS)
+def test_qod_session_lifecycle(client_name, emulator):
+    with _network_client(client_name, emulator.base_url) as network_client:
+        session = network_client.create_qod_session(qod_session_info(1))
+        session_id = str(session["sessionId"])
+        assert session_id in emulator.subscriptions("3gpp-as-session-with-qos", "scs")
+
+        assert str(network_client.get_qod_session(session_id)["sessionId"]) == (
+            session_id
+        )
+
+        network_client.delete_qod_session(session_id)
+        assert emulator.subscriptions("3gpp-as-session-with-qos", "scs") == {}
+        with pytest.raises(CoreHttpError):
+            network_client.get_qod_session(session_id)
+
+
+def test_traffic_influence_lifecycle(emulator):
+    with _network_client("oai", emulator.base_url) as network_client:
+        resource = network_client.create_traffic_influence_resource(ti_info(1))
+        resource_id = resource["trafficInfluenceID"].rsplit("/", 1)[-1]
+
+        ti = network_client.get_individual_traffic_influence_resource(resource_id)
+        assert ti.appInstanceId == "172.21.18.3"
+        assert len(network_client.get_all_traffic_influence_resource()) == 1
+
+        network_client.delete_traffic_influence_resource(resource_id)
+        assert network_client.get_all_traffic_influence_resource() == []
+
+
+def test_location_retrieval(emulator):
+    with _network_client("open5gs", emulator.base_url) as network_client:
+        location = network_client.create_monitoring_event_subscription(
+            RetrievalLocationRequest(device=Device(phoneNumber="+306912345678"))
+        )
+    assert isinstance(location, Location)
+    assert len(location.area.boundary.root) == 3
+
+
+def test_error_injection():
+    with NefEmulator(error_rate=1.0, error_status=503) as emulator:
+        with _network_client("open5gs", emulator.base_url) as network_client:
+            with pytest.raises(CoreHttpError, match="503"):
+                network_client.create_qod_session(qod_session_info(1))
+    assert emulator.errors_injected == emulator.requests_served == 1
+
+
+def test_latency_injection():
+    with NefEmulator(latency=0.05) as emulator:
+        with _network_client("open5gs", emulator.base_url) as network_client:
+            start = time.perf_counter()
+            network_client.create_qod_session(qod_session_info(1))
+            assert time.perf_counter() - start >= 0.05
+
+
+def test_malformed_requests_are_rejected(emulator):
+    url = f"{emulator.base_url}/3gpp-as-session-with-qos/v1/scs/subscriptions"
+    for body in (b"{not json", b"[1, 2]"):
+        response = requests.post(url, data=body)
+        assert response.status_code == 400
+        assert response.json()["status"] == 400
+    for params in ({"offset": "abc"}, {"limit": "1.5"}, {"offset": "-1"}):
+        response = requests.get(url, params=params)
+        assert response.status_code == 400
+        assert response.json()["status"] == 400
+    # The emulator keeps serving
+    assert requests.get(url, params={"offset": "0", "limit": "10"}).json() == []
+
+
+def test_invalid_error_rate():
+    with pytest.raises(ValueError):
+        NefEmulator(error_rate=2)
+
+
+@pytest.mark.parametrize("client_name", ADAPTERS)
+def test_benchmark_report(client_name, emulator):
+    report = benchmark_adapter(client_name, emulator.base_url, 10, 4, warmup=2)
+
+    assert {"qod_create", "qod_get", "qod_delete"} <= set(report)
+    for stats in report.values():
+        assert stats["calls"] == 10
+        assert stats["errors"] == 0
+        assert stats["ops_per_sec"] > 0
+        assert stats["p50_ms"] <= stats["p99_ms"]
+        assert stats["cpu_per_call_us"] > 0
+
+    results = {"adapters": {client_name: report}}
+    assert compare(results, results, tolerance=0.1) == []
+    slower = {"adapters": {client_name: {"qod_get": dict(report["qod_get"])}}}
+    slower["adapters"][client_name]["qod_get"]["ops_per_sec"] *= 2
+    assert compare(results, slower, tolerance=0.1) != []
@@ -0,0 +1,164 @@
+# -*- coding: utf-8 -*-
+import asyncio
+import time
+import uuid
+
+import pytest
+
+from sunrise6g_opensdk.common.resilience import (
+    CircuitBreaker,
+    CircuitOpenError,
+    RetryPolicy,
+)
+from sunrise6g_opensdk.common.sdk import Sdk as sdkclient
+from sunrise6g_opensdk.network.adapters.open5gs.async_client import (
+    AsyncNetworkManager as AsyncOpen5GSClient,
+)
+from sunrise6g_opensdk.network.core.common import CoreHttpError
+from sunrise6g_opensdk.network.nef_emulator import NefEmulator
+from tests.network.test_bulk_qod_sessions import camara_session
+
+
+class _FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def _network_client(base_url: str, **kwargs):
+    adapter_specs = {
+        "network": {
+            "client_name": "open5gs",
+            "base_url": base_url,
+            "scs_as_id": "scs",
+            **kwargs,
+        }
+    }
+    return sdkclient.create_adapters_from(adapter_specs)["network"]
+
+
+def test_circuit_breaker_transitions():
+    clock = _FakeClock()
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=10, clock=clock)
+
+    breaker.before_call()
+    breaker.record_failure()
+    breaker.before_call()
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+
+    clock.now = 10
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    breaker.before_call()  # probe
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()  # only one probe at a time
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+
+    clock.now = 20
+    breaker.before_call()
+    breaker.record_success()
+    assert breaker.snapshot() == {
+        "state": CircuitBreaker.CLOSED,
+        "consecutive_failures": 0,
+        "times_opened": 2,
+        "rejected": 2,
+    }
+
+
+def test_backoff_is_capped_full_jitter():
+    policy = RetryPolicy(backoff_base=0.1, backoff_max=0.5)
+    for retry in range(10):
+        assert 0 <= policy.backoff(retry) <= min(0.5, 0.1 * 2**retry)
+
+
+def test_idempotent_calls_are_retried():
+    with NefEmulator(error_rate=1.0) as emulator:
+        with _network_client(emulator.base_url, max_retries=2) as network_client:
+            with pytest.raises(CoreHttpError, match="503"):
+                network_client.get_qod_session(str(uuid.uuid4()))
+            assert emulator.requests_served == 3
+
+            with pytest.raises(CoreHttpError, match="503"):
+                network_client.create_qod_session(camara_session("10.45.0.2"))
+            assert emulator.requests_served == 4  # POST is not retried
+
+            stats = network_client.resilience_stats()
+    assert stats["calls"] == 2
+    assert stats["attempts"] == 4
+    assert stats["retries"] == 2
+    assert stats["failures"] == 4
+
+
+def test_retry_recovers_from_transient_errors():
+    with NefEmulator(seed=1) as emulator:
+        with _network_client(
+            emulator.base_url, max_retries=10, failure_threshold=None
+        ) as network_client:
+            sessions = [
+                network_client.create_qod_session(camara_session(f"10.45.0.{i}"))
+                for i in range(1, 11)
+            ]
+            emulator.error_rate = 0.5
+            for session in sessions:
+                network_client.delete_qod_session(str(session["sessionId"]))
+            assert network_client.resilience_stats()["retries"] > 0
+        assert emulator.subscriptions("3gpp-as-session-with-qos", "scs") == {}
+
+
+def test_deadline_bounds_call_and_retries():
+    with NefEmulator(latency=0.5) as emulator:
+        with _network_client(
+            emulator.base_url, timeout=0.2, failure_threshold=None
+        ) as network_client:
+            start = time.perf_counter()
+            with pytest.raises(CoreHttpError, match="timeout"):
+                network_client.get_qod_session(str(uuid.uuid4()))
+            assert time.perf_counter() - start < 0.45
+            assert network_client.resilience_stats()["timeouts"] >= 1
+
+
+def test_circuit_breaker_fails_fast_and_recovers():
+    with NefEmulator() as emulator:
+        with _network_client(
+            emulator.base_url, max_retries=0, failure_threshold=3, reset_timeout=0.1
+        ) as network_client:
+            session = network_client.create_qod_session(camara_session("10.45.0.2"))
+            emulator.error_rate = 1.0
+            for _ in range(3):
+                with pytest.raises(CoreHttpError, match="503"):
+                    network_client.delete_qod_session(str(uuid.uuid4()))
+            with pytest.raises(CoreHttpError, match="circuit breaker is open"):
+                network_client.delete_qod_session(str(uuid.uuid4()))
+            assert emulator.requests_served == 4
+
+            breakers = network_client.resilience_stats()["circuit_breakers"]
+            assert breakers[emulator.base_url]["state"] == CircuitBreaker.OPEN
+
+            emulator.error_rate = 0.0
+            time.sleep(0.1)
+            network_client.delete_qod_session(str(session["sessionId"]))
+            breakers = network_client.resilience_stats()["circuit_breakers"]
+            assert breakers[emulator.base_url]["state"] == CircuitBreaker.CLOSED
+
+
+def test_async_client_shares_resilience_handling():
+    async def scenario(base_url):
+        async with AsyncOpen5GSClient(
+            base_url=base_url, scs_as_id="scs", max_retries=1, failure_threshold=2
+        ) as network_client:
+            with pytest.raises(CoreHttpError, match="503"):
+                await network_client.get_qod_session(str(uuid.uuid4()))
+            with pytest.raises(CoreHttpError, match="circuit breaker"):
+                await network_client.get_qod_session(str(uuid.uuid4()))
+            return network_client.resilience_stats()
+
+    with NefEmulator(error_rate=1.0) as emulator:
+        stats = asyncio.run(scenario(emulator.base_url))
+        assert emulator.requests_served == 2
+    assert stats["retries"] == 1
+    assert stats["rejected"] == 1
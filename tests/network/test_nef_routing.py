@@ -0,0 +1,219 @@
+# -*- coding: utf-8 -*-
+import pytest
+
+from benchmarks.network_adapters import ti_info
+from sunrise6g_opensdk.network.core import schemas
+from sunrise6g_opensdk.network.core.common import CapabilityNotSupported, CoreHttpError
+from sunrise6g_opensdk.network.core.routing import RoutingNetworkClient
+from sunrise6g_opensdk.network.nef_emulator import NefEmulator
+from tests.network.test_bulk_qod_sessions import camara_session
+from tests.network.test_qod_session_registry import QOS_API, _FakeClock
+
+TI_API = "3gpp-traffic-influence"
+
+
+def _specs(emulators: dict, **kwargs) -> dict:
+    return {
+        name: {
+            "client_name": "oai",
+            "base_url": emulator.base_url,
+            "scs_as_id": "scs",
+            **kwargs,
+        }
+        for name, emulator in emulators.items()
+    }
+
+
+def _sessions(emulator: NefEmulator) -> set:
+    return set(emulator.subscriptions(QOS_API, "scs"))
+
+
+def test_devices_are_spread_by_consistent_hashing():
+    with NefEmulator() as a, NefEmulator() as b:
+        with RoutingNetworkClient.from_adapter_specs(
+            _specs({"a": a, "b": b})
+        ) as router:
+            created = [
+                router.create_qod_session(camara_session(f"10.45.0.{i}"))
+                for i in range(1, 41)
+            ]
+            assert len(_sessions(a)) + len(_sessions(b)) == 40
+            assert 10 <= len(_sessions(a)) <= 30
+
+            # Sessions are read and deleted on the NEF that created them
+            served = a.requests_served + b.requests_served
+            for session in created:
+                session_id = str(session["sessionId"])
+                assert router.get_qod_session(session_id)["sessionId"] == (
+                    session["sessionId"]
+                )
+                router.delete_qod_session(session_id)
+            assert a.requests_served + b.requests_served == served + 80
+            assert _sessions(a) == _sessions(b) == set()
+
+
+def test_hash_ring_is_stable_when_nefs_are_added():
+    specs = {
+        name: {"client_name": "oai", "base_url": f"http://{name}", "scs_as_id": "scs"}
+        for name in ("a", "b", "c")
+    }
+    two = RoutingNetworkClient.from_adapter_specs({"a": specs["a"], "b": specs["b"]})
+    three = RoutingNetworkClient.from_adapter_specs(specs)
+    keys = [f"+3069{i:08d}" for i in range(3000)]
+    moved = [key for key in keys if two.route(key)[0] != three.route(key)[0]]
+    # Only the keys taken over by the new NEF move
+    assert all(three.route(key)[0] == "c" for key in moved)
+    assert 600 <= len(moved) <= 1400
+    assert sorted(three.route(keys[0])) == ["a", "b", "c"]
+
+
+def test_devices_are_routed_by_subnet():
+    with NefEmulator() as a, NefEmulator() as b:
+        with RoutingNetworkClient.from_adapter_specs(
+            _specs({"a": a, "b": b}),
+            subnets={"a": ["10.0.0.0/8"], "b": ["10.46.0.0/16"]},
+        ) as router:
+            for i in range(1, 11):
+                router.create_qod_session(camara_session(f"10.46.0.{i}"))
+                router.create_qod_session(camara_session(f"10.45.0.{i}"))
+            # Longest prefix wins
+            assert len(_sessions(a)) == len(_sessions(b)) == 10
+
+
+def test_devices_with_a_phone_number_are_routed_by_subnet():
+    with NefEmulator() as a, NefEmulator() as b:
+        with RoutingNetworkClient.from_adapter_specs(
+            _specs({"a": a, "b": b}), subnets={"a": ["10.0.0.0/8"]}
+        ) as router:
+            for i in range(1, 11):
+                session = camara_session(f"10.1.2.{i}")
+                session["device"]["phoneNumber"] = f"+30691234{i:04d}"
+                router.create_qod_session(session)
+            assert len(_sessions(a)) == 10
+            assert _sessions(b) == set()
+
+
+def test_failing_nefs_are_skipped():
+    clock = _FakeClock()
+    with NefEmulator() as a, NefEmulator(error_rate=1.0) as b:
+        with RoutingNetworkClient.from_adapter_specs(
+            _specs({"a": a, "b": b}, max_retries=0), cooldown=30, clock=clock
+        ) as router:
+            # The creation failing on 'b' may have reached it: not retried on 'a'
+            failed = 0
+            for i in range(1, 21):
+                try:
+                    router.create_qod_session(camara_session(f"10.45.0.{i}"))
+                except CoreHttpError:
+                    failed += 1
+            assert failed == 1
+            assert len(_sessions(a)) == 19
+            assert router.stats()["failovers"] == 1
+            assert router.health() == {"a": True, "b": False}
+
+            # Listings still cover the unhealthy NEF, failing with it
+            with pytest.raises(CoreHttpError):
+                router.get_all_traffic_influence_resource()
+
+            # Probed again once the cooldown is over
+            b.error_rate = 0.0
+            clock.now = 30
+            for i in range(21, 41):
+                router.create_qod_session(camara_session(f"10.45.0.{i}"))
+            assert _sessions(b)
+            assert router.health() == {"a": True, "b": True}
+
+
+def test_unreachable_nefs_are_skipped():
+    with NefEmulator() as a:
+        unreachable = {"client_name": "oai", "base_url": "http://127.0.0.1:1"}
+        specs = _specs({"a": a}, max_retries=0)
+        specs["down"] = dict(unreachable, scs_as_id="scs", max_retries=0)
+        with RoutingNetworkClient.from_adapter_specs(specs) as router:
+            batch = router.create_qod_sessions(
+                [camara_session(f"10.45.0.{i}") for i in range(1, 11)]
+            )
+            assert batch.stats.succeeded == 10
+            assert len(_sessions(a)) == 10
+
+
+def test_rejected_requests_do_not_fail_over():
+    with NefEmulator() as a, NefEmulator() as b:
+        with RoutingNetworkClient.from_adapter_specs(
+            _specs({"a": a, "b": b})
+        ) as router:
+            with pytest.raises(CoreHttpError, match="404"):
+                router.get_qod_session("0d6d3f6c-6a5f-4a4c-9a43-3b9a4d7ae2a1")
+            assert router.stats()["failovers"] == 0
+
+
+def test_requests_go_to_capable_nefs():
+    with NefEmulator() as oai, NefEmulator() as open5gs:
+        specs = _specs({"oai": oai, "open5gs": open5gs})
+        specs["open5gs"]["client_name"] = "open5gs"
+        with RoutingNetworkClient.from_adapter_specs(specs) as router:
+            for i in range(10):
+                router.create_traffic_influence_resource(ti_info(i))
+            assert len(oai.subscriptions(TI_API, "scs")) == 10
+            assert len(router.get_all_traffic_influence_resource()) == 10
+
+            request = schemas.RetrievalLocationRequest(
+                device=schemas.Device(phoneNumber="+306912345678")
+            )
+            assert router.create_monitoring_event_subscription(request) is not None
+            assert open5gs.requests_served == 1
+
+    with RoutingNetworkClient.from_adapter_specs({"oai": specs["oai"]}) as router:
+        with pytest.raises(CapabilityNotSupported):
+            router.create_monitoring_event_subscription(request)
+
+
+def test_owners_are_bounded_and_forgotten_when_gone():
+    with NefEmulator() as a, NefEmulator() as b:
+        with RoutingNetworkClient.from_adapter_specs(
+            _specs({"a": a, "b": b}), owner_cache_size=5
+        ) as router:
+            created = [
+                str(
+                    router.create_qod_session(camara_session(f"10.45.0.{i}"))[
+                        "sessionId"
+                    ]
+                )
+                for i in range(1, 11)
+            ]
+            assert router.stats()["owned"] == 5
+            # Forgotten owners are looked up again
+            for session_id in created:
+                router.get_qod_session(session_id)
+            assert router.stats()["owned"] == 5
+
+            # A session deleted behind the router's back is forgotten
+            router.get_qod_session(created[0])
+            owner = "a" if created[0] in _sessions(a) else "b"
+            router.clients[owner].delete_qod_session(created[0])
+            with pytest.raises(CoreHttpError, match="404"):
+                router.get_qod_session(created[0])
+            assert router.stats()["owned"] == 4
+
+
+def test_sessions_of_unhealthy_nefs_are_not_reported_missing():
+    with NefEmulator() as a, NefEmulator() as b:
+        specs = _specs({"a": a, "b": b}, max_retries=0)
+        with RoutingNetworkClient.from_adapter_specs(specs) as router:
+            created = [
+                router.create_qod_session(camara_session(f"10.45.0.{i}"))
+                for i in range(1, 11)
+            ]
+        session_id = next(
+            str(session["sessionId"])
+            for session in created
+            if str(session["sessionId"]) in _sessions(b)
+        )
+
+        # A new router does not know the owners
+        b.error_rate = 1.0
+        with RoutingNetworkClient.from_adapter_specs(specs) as router:
+            with pytest.raises(CoreHttpError) as error:
+                router.get_qod_session(session_id)
+            assert "404" not in str(error.value)
+            assert router.health() == {"a": True, "b": False}
@@ -0,0 +1,203 @@
+# -*- coding: utf-8 -*-
+import asyncio
+
+import httpx
+
+from sunrise6g_opensdk.common.sdk import Sdk as sdkclient
+from sunrise6g_opensdk.network.core import schemas
+from sunrise6g_opensdk.network.notification_sink import (
+    MONITORING_EVENT,
+    QOD,
+    TRAFFIC_INFLUENCE,
+    NotificationSink,
+)
+
+NEF_URL = "http://nef.example.com"
+
+
+def _qod_notification(session_id: str, event: str = "QOS_GUARANTEED") -> dict:
+    return {
+        "transaction": f"{NEF_URL}/3gpp-as-session-with-qos/v1/scs/subscriptions/{session_id}",
+        "eventReports": [{"event": event}],
+    }
+
+
+def _monitoring_notification(subscription_id: str) -> dict:
+    return {
+        "subscription": f"{NEF_URL}/3gpp-monitoring-event/v1/scs/subscriptions/{subscription_id}",
+        "monitoringEventReports": [{"monitoringType": "LOCATION_REPORTING"}],
+    }
+
+
+def _ti_notification(af_trans_id: str) -> dict:
+    return {"afTransId": af_trans_id, "dnaiChgType": "EARLY", "targetDnai": "edge-1"}
+
+
+async def _drain(queue: asyncio.Queue) -> list:
+    notifications = []
+    while not queue.empty():
+        notifications.extend(queue.get_nowait())
+    return notifications
+
+
+def test_notifications_fan_out_by_subscription():
+    async def scenario():
+        async with NotificationSink() as sink:
+            session_queue = sink.subscribe("session-1")
+            location_queue = sink.subscribe("location-1")
+            ti_queue = sink.subscribe("transaction-1")
+            all_queue = sink.subscribe()
+            async with httpx.AsyncClient() as client:
+                posts = [
+                    (QOD, _qod_notification("session-1")),
+                    (QOD, _qod_notification("session-2")),
+                    (MONITORING_EVENT, _monitoring_notification("location-1")),
+                    (TRAFFIC_INFLUENCE, _ti_notification("transaction-1")),
+                ]
+                for kind, notification in posts:
+                    response = await client.post(sink.url(kind), json=notification)
+                    assert response.status_code == 204
+            await asyncio.sleep(0.05)
+            return (
+                await _drain(session_queue),
+                await _drain(location_queue),
+                await _drain(ti_queue),
+                await _drain(all_queue),
+                sink.stats(),
+            )
+
+    session, location, ti, everything, stats = asyncio.run(scenario())
+    assert [n.subscription_id for n in session] == ["session-1"]
+    assert session[0].kind == QOD
+    assert (
+        session[0].data.eventReports[0].event == schemas.UserPlaneEvent.QOS_GUARANTEED
+    )
+    assert isinstance(location[0].data, schemas.MonitoringNotification)
+    assert ti[0].data.dnaiChgType == schemas.DnaiChangeType.EARLY
+    assert len(everything) == 4
+    assert stats["received"] == stats["delivered"] - 3 == 4
+
+
+def test_invalid_requests_are_answered_and_counted():
+    async def scenario():
+        async with NotificationSink() as sink:
+            async with httpx.AsyncClient() as client:
+                unknown = await client.post(f"{sink.base_url}/unknown", json={})
+                wrong_method = await client.get(sink.url(QOD))
+                invalid = await client.post(sink.url(QOD), json={"eventReports": []})
+            await asyncio.sleep(0.05)
+            return unknown, wrong_method, invalid, sink.stats()
+
+    unknown, wrong_method, invalid, stats = asyncio.run(scenario())
+    assert unknown.status_code == 404
+    assert wrong_method.status_code == 405
+    assert invalid.status_code == 204  # validated off the request path
+    assert stats["invalid"] == 1
+
+
+def test_malformed_content_lengths_are_rejected():
+    async def send(sink: NotificationSink, length: str) -> bytes:
+        reader, writer = await asyncio.open_connection(sink.host, sink.port)
+        writer.write(
+            f"POST /{QOD} HTTP/1.1\r\nHost: sink\r\n"
+            f"Content-Length: {length}\r\n\r\n".encode("latin-1")
+        )
+        await writer.drain()
+        status_line = await reader.readline()
+        # The connection is closed after the reply
+        await reader.read()
+        writer.close()
+        return status_line
+
+    async def scenario():
+        async with NotificationSink() as sink:
+            return [await send(sink, length) for length in ("abc", "-1", "+5", "²")]
+
+    for status_line in asyncio.run(scenario()):
+        assert status_line.startswith(b"HTTP/1.1 400")
+
+
+def test_bursts_are_dispatched_in_batches():
+    async def scenario():
+        async with NotificationSink(batch_interval=0.02) as sink:
+            queue = sink.subscribe()
+            limits = httpx.Limits(max_connections=20)
+            async with httpx.AsyncClient(limits=limits) as client:
+                responses = await asyncio.gather(
+                    *(
+                        client.post(sink.url(QOD), json=_qod_notification(f"s{i}"))
+                        for i in range(100)
+                    )
+                )
+            await asyncio.sleep(0.05)
+            batches = []
+            while not queue.empty():
+                batches.append(queue.get_nowait())
+            return responses, batches
+
+    responses, batches = asyncio.run(scenario())
+    assert all(response.status_code == 204 for response in responses)
+    assert sum(len(batch) for batch in batches) == 100
+    assert len(batches) < 100
+
+
+def test_backpressure_rejects_when_pending_is_full():
+    async def scenario():
+        sink = NotificationSink(max_pending=1, batch_interval=0.5)
+        async with sink:
+            queue = sink.subscribe()
+            async with httpx.AsyncClient() as client:
+                statuses = []
+                for i in range(4):
+                    response = await client.post(
+                        sink.url(QOD), json=_qod_notification(f"s{i}")
+                    )
+                    statuses.append(response.status_code)
+                    retry_after = response.headers.get("Retry-After")
+        # Accepted notifications are delivered on stop
+        return statuses, retry_after, sink.stats(), await _drain(queue)
+
+    statuses, retry_after, stats, delivered = asyncio.run(scenario())
+    assert 503 in statuses
+    assert retry_after == "1"
+    assert stats["rejected"] == statuses.count(503)
+    assert len(delivered) == stats["delivered"] == statuses.count(204)
+
+
+def test_slow_subscribers_lose_batches_without_blocking():
+    async def scenario():
+        async with NotificationSink(batch_interval=0) as sink:
+            slow = sink.subscribe("session-1", maxsize=1)
+            fast = sink.subscribe("session-1")
+            async with httpx.AsyncClient() as client:
+                for _ in range(3):
+                    await client.post(
+                        sink.url(QOD), json=_qod_notification("session-1")
+                    )
+                    await asyncio.sleep(0.01)
+            return slow.qsize(), len(await _drain(fast)), sink.stats()
+
+    slow_size, fast_count, stats = asyncio.run(scenario())
+    assert slow_size == 1
+    assert fast_count == 3
+    assert stats["dropped"] == 2
+
+
+def test_open5gs_notification_destination_is_configurable():
+    adapter_specs = {
+        "network": {
+            "client_name": "open5gs",
+            "base_url": NEF_URL,
+            "scs_as_id": "scs",
+            "notification_destination": "http://10.0.0.1:8001/monitoring-event",
+        }
+    }
+    network_client = sdkclient.create_adapters_from(adapter_specs)["network"]
+    request = schemas.RetrievalLocationRequest.model_validate(
+        {"device": {"phoneNumber": "+34600000000"}}
+    )
+    subscription = network_client._build_monitoring_event_subscription(request)
+    assert (
+        str(subscription.notificationDestination)
+        == "http://10.0.0.1:8001/monitoring-event"
+    )
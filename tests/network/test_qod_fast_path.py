@@ -0,0 +1,109 @@
+# -*- coding: utf-8 -*-
+import json
+import uuid
+
+import pytest
+
+from benchmarks.network_adapters import qod_session_info
+from benchmarks.qod_cpu import CannedNefSession
+from benchmarks.qod_cpu import benchmark_adapter as benchmark_qod_cpu
+from sunrise6g_opensdk.common.sdk import Sdk as sdkclient
+from sunrise6g_opensdk.network.adapters.errors import NetworkPlatformError
+from sunrise6g_opensdk.network.core import base_network_client, schemas
+from sunrise6g_opensdk.network.core.base_network_client import qod_subscription_id
+
+ADAPTERS = ["open5gs", "oai", "open5gcore"]
+BASE_URL = "http://test-nef.url"
+
+
+def _network_client(client_name: str):
+    adapter_specs = {
+        "network": {
+            "client_name": client_name,
+            "base_url": BASE_URL,
+            "scs_as_id": "scs",
+        }
+    }
+    network_client = sdkclient.create_adapters_from(adapter_specs)["network"]
+    network_client.http_session = CannedNefSession()
+    return network_client
+
+
+def _payload(subscription: schemas.AsSessionWithQoSSubscription) -> str:
+    return subscription.model_dump_json(exclude_none=True, by_alias=True)
+
+
+@pytest.mark.parametrize("client_name", ADAPTERS)
+def test_subscription_payload_is_valid(client_name):
+    network_client = _network_client(client_name)
+    payload = _payload(network_client._build_qod_subscription(qod_session_info(1)))
+
+    reparsed = schemas.AsSessionWithQoSSubscription.model_validate_json(payload)
+    assert _payload(reparsed) == payload
+
+
+@pytest.mark.parametrize("client_name", ADAPTERS)
+def test_created_session_matches_validated_session_info(client_name):
+    network_client = _network_client(client_name)
+    session_info = qod_session_info(1)
+    subscription = json.loads(
+        _payload(network_client._build_qod_subscription(session_info))
+    )
+    session_id = network_client.http_session.prime(
+        f"{BASE_URL}/3gpp-as-session-with-qos/v1/scs/subscriptions", subscription
+    )
+
+    created = network_client.create_qod_session(session_info)
+
+    expected = schemas.SessionInfo(
+        sessionId=uuid.UUID(session_id),
+        qosStatus=schemas.QosStatus.REQUESTED,
+        **session_info,
+    ).model_dump()
+    assert created == expected
+    assert list(created) == list(expected)
+
+    retrieved = network_client.get_qod_session(session_id)
+    assert retrieved["sessionId"] == created["sessionId"]
+    assert retrieved["qosStatus"] == schemas.QosStatus.AVAILABLE
+    assert retrieved["duration"] == session_info["duration"]
+
+
+def test_templates_are_cached_per_adapter_and_profile():
+    open5gs = _network_client("open5gs")
+    oai = _network_client("oai")
+
+    assert open5gs._qod_template("qos-e") is _network_client("open5gs")._qod_template(
+        "qos-e"
+    )
+    assert open5gs._qod_template("qos-e") is not open5gs._qod_template("qos-l")
+    assert open5gs._qod_template("qos-e") is not oai._qod_template("qos-e")
+
+    # Arbitrary profiles do not grow the templates without bound
+    for i in range(2 * base_network_client._QOD_TEMPLATES_SIZE):
+        oai._qod_template(f"profile-{i}")
+    assert len(base_network_client._qod_templates) == (
+        base_network_client._QOD_TEMPLATES_SIZE
+    )
+
+    open5gs_payload = json.loads(
+        _payload(open5gs._build_qod_subscription(qod_session_info(1)))
+    )
+    assert open5gs_payload["supportedFeatures"] == "003C"
+    assert open5gs_payload["qosReference"] == "qos-e"
+    oai_payload = json.loads(_payload(oai._build_qod_subscription(qod_session_info(1))))
+    assert oai_payload["snssai"] == {"sst": 1, "sd": "FFFFFF"}
+    assert oai_payload["dnn"] == "oai"
+
+
+def test_subscription_id_requires_self_link():
+    assert qod_subscription_id({"self": f"{BASE_URL}/subscriptions/abc"}) == "abc"
+    with pytest.raises(NetworkPlatformError):
+        qod_subscription_id({})
+
+
+@pytest.mark.parametrize("client_name", ADAPTERS)
+def test_cpu_benchmark(client_name):
+    results = benchmark_qod_cpu(client_name, calls=5, repeats=1)
+    assert results["qod_create_cpu_us"] > 0
+    assert results["qod_get_cpu_us"] > 0
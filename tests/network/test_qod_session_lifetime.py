@@ -0,0 +1,163 @@
+# -*- coding: utf-8 -*-
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from sunrise6g_opensdk.network.core.lifetime import QodSessionLifetimeManager
+from sunrise6g_opensdk.network.nef_emulator import NefEmulator
+from tests.network.test_bulk_qod_sessions import camara_session
+from tests.network.test_qod_session_registry import QOS_API, _FakeClock, _network_client
+
+
+def _sessions(emulator: NefEmulator) -> set:
+    return set(emulator.subscriptions(QOS_API, "scs"))
+
+
+def _create(network_client, device_ip: str, duration: int) -> dict:
+    session_info = camara_session(device_ip)
+    session_info["duration"] = duration
+    return network_client.create_qod_session(session_info)
+
+
+def test_sessions_due_in_the_same_tick_are_deleted_together():
+    clock = _FakeClock()
+    with NefEmulator() as emulator:
+        with _network_client(emulator.base_url) as network_client:
+            manager = QodSessionLifetimeManager(
+                network_client, lead_time=5, tick=1, clock=clock
+            )
+            short = [_create(network_client, f"10.45.0.{i}", 60) for i in (2, 3)]
+            long = _create(network_client, "10.45.0.4", 120)
+            for session in [*short, long]:
+                manager.track(session)
+            assert manager.active_sessions == 3
+
+            clock.now = 54.9
+            assert manager.run_due() == 0
+            clock.now = 55
+            assert manager.run_due() == 2
+            assert _sessions(emulator) == {str(long["sessionId"])}
+            assert manager.active_sessions == 1
+
+            clock.now = 115
+            assert manager.run_due() == 1
+            assert _sessions(emulator) == set()
+            assert manager.stats() == {
+                "active": 0,
+                "deleted": 3,
+                "renewed": 0,
+                "failed": 0,
+                "batches": 2,
+            }
+
+
+def test_renewed_sessions_replace_the_expired_ones():
+    clock = _FakeClock()
+    expired = []
+    with NefEmulator() as emulator:
+        with _network_client(emulator.base_url) as network_client:
+            manager = QodSessionLifetimeManager(network_client, clock=clock)
+            session = _create(network_client, "10.45.0.2", 60)
+            manager.track(
+                session,
+                renew=True,
+                on_expiry=lambda old, new: expired.append((old, new)),
+            )
+
+            clock.now = 55
+            assert manager.run_due() == 1
+            ((old, new),) = expired
+            assert old is session
+            assert new["sessionId"] != session["sessionId"]
+            assert new["device"] == session["device"]
+            assert _sessions(emulator) == {str(new["sessionId"])}
+            # The replacement is tracked in turn
+            assert manager.active_sessions == 1
+            assert manager.stats()["renewed"] == 1
+
+
+def test_untracked_and_rescheduled_sessions():
+    clock = _FakeClock()
+    with NefEmulator() as emulator:
+        with _network_client(emulator.base_url) as network_client:
+            manager = QodSessionLifetimeManager(network_client, clock=clock)
+            kept = _create(network_client, "10.45.0.2", 60)
+            untracked = _create(network_client, "10.45.0.3", 60)
+            manager.track(kept)
+            manager.track(untracked)
+            assert manager.untrack(untracked["sessionId"])
+            assert not manager.untrack(untracked["sessionId"])
+            # Rescheduled with a later expiration
+            manager.track(dict(kept, duration=120))
+
+            clock.now = 60
+            assert manager.run_due() == 0
+            clock.now = 115
+            assert manager.run_due() == 1
+            assert _sessions(emulator) == {str(untracked["sessionId"])}
+
+
+def test_failed_deletions_are_counted():
+    clock = _FakeClock()
+    with NefEmulator() as emulator:
+        with _network_client(emulator.base_url, max_retries=0) as network_client:
+            manager = QodSessionLifetimeManager(network_client, clock=clock)
+            session = _create(network_client, "10.45.0.2", 60)
+            network_client.delete_qod_session(str(session["sessionId"]))
+            manager.track(session)
+            clock.now = 55
+            assert manager.run_due() == 1
+            assert manager.stats()["failed"] == 1
+
+
+def test_background_thread_handles_expirations():
+    with NefEmulator() as emulator:
+        with _network_client(emulator.base_url) as network_client:
+            with QodSessionLifetimeManager(
+                network_client, lead_time=0.5, tick=0.1
+            ) as manager:
+                for i in range(2, 12):
+                    manager.track(_create(network_client, f"10.45.0.{i}", 1))
+                deadline = time.monotonic() + 5
+                while manager.active_sessions and time.monotonic() < deadline:
+                    time.sleep(0.05)
+                assert manager.active_sessions == 0
+            assert _sessions(emulator) == set()
+            assert manager.stats()["deleted"] == 10
+
+
+def test_tracks_many_sessions():
+    manager = QodSessionLifetimeManager(client=None, clock=_FakeClock())
+    session_ids = [uuid.uuid4() for _ in range(100_000)]
+    for i, session_id in enumerate(session_ids):
+        manager.track({"sessionId": session_id, "duration": 60 + i % 3600})
+    for session_id in session_ids[::2]:
+        manager.untrack(session_id)
+    assert manager.active_sessions == 50_000
+    assert len(manager._heap) <= 2 * manager.active_sessions + 64
+
+
+def test_expiration_dates_are_read_as_utc():
+    clock = _FakeClock()
+    manager = QodSessionLifetimeManager(client=None, lead_time=0, tick=1, clock=clock)
+    expires_at = datetime.now(timezone.utc) + timedelta(seconds=600)
+    sessions = {
+        "zulu": expires_at.strftime("%Y-%m-%dT%H:%M:%SZ"),
+        "offset": expires_at.isoformat(),
+        "naive": expires_at.replace(tzinfo=None),
+        "naive-string": expires_at.replace(tzinfo=None).isoformat(),
+    }
+    for session_id, value in sessions.items():
+        manager.track({"sessionId": session_id, "expiresAt": value})
+    assert manager.active_sessions == 4
+    assert all(598 <= due <= 600 for due, _ in manager._heap)
+
+
+def test_sessions_without_expiration_are_rejected():
+    manager = QodSessionLifetimeManager(client=None)
+    with pytest.raises(ValueError):
+        manager.track({"sessionId": uuid.uuid4(), "duration": None})
+    with pytest.raises(ValueError):
+        QodSessionLifetimeManager(client=None, tick=0)
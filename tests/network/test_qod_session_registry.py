@@ -0,0 +1,191 @@
+# -*- coding: utf-8 -*-
+import asyncio
+import time
+
+import pytest
+
+from sunrise6g_opensdk.common.cache import TTLCache
+from sunrise6g_opensdk.common.sdk import Sdk as sdkclient
+from sunrise6g_opensdk.network.adapters.open5gs.async_client import (
+    AsyncNetworkManager as AsyncOpen5GSClient,
+)
+from sunrise6g_opensdk.network.core import schemas
+from sunrise6g_opensdk.network.nef_emulator import NefEmulator
+from tests.network.test_bulk_qod_sessions import camara_session
+
+QOS_API = "3gpp-as-session-with-qos"
+
+
+class _FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def _network_client(base_url: str, **kwargs):
+    adapter_specs = {
+        "network": {
+            "client_name": "open5gs",
+            "base_url": base_url,
+            "scs_as_id": "scs",
+            **kwargs,
+        }
+    }
+    return sdkclient.create_adapters_from(adapter_specs)["network"]
+
+
+def _notification(emulator: NefEmulator, session_id: str, event: str) -> dict:
+    return {
+        "transaction": f"{emulator.base_url}/{QOS_API}/v1/scs/subscriptions/{session_id}",
+        "eventReports": [{"event": event}],
+    }
+
+
+def test_cache_expiry_and_lru_eviction():
+    clock = _FakeClock()
+    cache = TTLCache(ttl=10, maxsize=2, clock=clock)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1  # "b" becomes the least recently used
+    cache.set("c", 3)
+    assert cache.get("b") is None
+    assert cache.get("c") == 3
+
+    clock.now = 10
+    assert cache.get("a") is None
+    assert cache.invalidate("c")
+    assert not cache.invalidate("c")
+    assert cache.snapshot() == {
+        "size": 0,
+        "maxsize": 2,
+        "ttl": 10,
+        "hits": 2,
+        "misses": 2,
+        "evictions": 1,
+        "expirations": 1,
+        "invalidations": 1,
+    }
+
+
+def test_cache_rejects_invalid_settings():
+    with pytest.raises(ValueError):
+        TTLCache(ttl=0)
+    with pytest.raises(ValueError):
+        TTLCache(ttl=1, maxsize=0)
+
+
+def test_registry_is_disabled_by_default():
+    with NefEmulator() as emulator:
+        with _network_client(emulator.base_url) as network_client:
+            session = network_client.create_qod_session(camara_session("10.45.0.2"))
+            network_client.get_qod_session(str(session["sessionId"]))
+            assert emulator.requests_served == 2
+            assert network_client.session_registry_stats() == {}
+
+
+def test_created_sessions_are_served_locally():
+    with NefEmulator() as emulator:
+        with _network_client(emulator.base_url, session_cache_ttl=60) as network_client:
+            session_info = camara_session("10.45.0.2")
+            session_info["devicePorts"] = {"ports": [5000]}
+            created = network_client.create_qod_session(session_info)
+            session_id = str(created["sessionId"])
+
+            for _ in range(5):
+                retrieved = network_client.get_qod_session(session_id)
+            assert emulator.requests_served == 1
+            assert retrieved == dict(created, qosStatus=schemas.QosStatus.AVAILABLE)
+            # The original request details survive, no flow description parsing
+            assert retrieved["devicePorts"] == {"ports": [5000], "ranges": None}
+
+            # Callers cannot alter the registered session, whether through the
+            # retrieved or the created one
+            retrieved["device"]["ipv4Address"]["publicAddress"] = "10.45.0.99"
+            assert network_client.get_qod_session(session_id) != retrieved
+            created["device"]["ipv4Address"]["publicAddress"] = "10.45.0.98"
+            registered = network_client.get_qod_session(session_id)
+            assert (
+                str(registered["device"]["ipv4Address"]["publicAddress"]) == "10.45.0.2"
+            )
+
+            stats = network_client.session_registry_stats()
+            assert stats["size"] == 1
+            assert stats["hits"] == 7
+
+            network_client.delete_qod_session(session_id)
+            assert network_client.session_registry_stats()["size"] == 0
+
+
+def test_reads_are_cached_until_expiry():
+    with NefEmulator() as emulator:
+        with _network_client(emulator.base_url) as creator:
+            session_id = str(
+                creator.create_qod_session(camara_session("10.45.0.2"))["sessionId"]
+            )
+        with _network_client(emulator.base_url, session_cache_ttl=0.1) as reader:
+            reader.get_qod_session(session_id)
+            reader.get_qod_session(session_id)
+            assert emulator.requests_served == 2
+            time.sleep(0.1)
+            reader.get_qod_session(session_id)
+            assert emulator.requests_served == 3
+            stats = reader.session_registry_stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 2
+    assert stats["expirations"] == 1
+
+
+def test_notifications_invalidate_sessions():
+    with NefEmulator() as emulator:
+        with _network_client(emulator.base_url, session_cache_ttl=60) as network_client:
+            session_id = str(
+                network_client.create_qod_session(camara_session("10.45.0.2"))[
+                    "sessionId"
+                ]
+            )
+            notification = network_client.handle_qod_notification(
+                _notification(emulator, session_id, "QOS_NOT_GUARANTEED")
+            )
+            assert notification.subscription_id == session_id
+            assert notification.eventReports[0].event == (
+                schemas.UserPlaneEvent.QOS_NOT_GUARANTEED
+            )
+
+            network_client.get_qod_session(session_id)
+            assert emulator.requests_served == 2
+            assert network_client.session_registry_stats()["invalidations"] == 1
+
+
+def test_batches_populate_and_invalidate_the_registry():
+    with NefEmulator() as emulator:
+        with _network_client(emulator.base_url, session_cache_ttl=60) as network_client:
+            batch = network_client.create_qod_sessions(
+                [camara_session(f"10.45.0.{i}") for i in range(1, 6)]
+            )
+            session_ids = [str(session["sessionId"]) for session in batch.results]
+            assert network_client.session_registry_stats()["size"] == 5
+
+            network_client.delete_qod_sessions(session_ids)
+            assert network_client.session_registry_stats()["size"] == 0
+
+
+def test_async_client_shares_the_registry_logic():
+    async def scenario(base_url):
+        async with AsyncOpen5GSClient(
+            base_url=base_url, scs_as_id="scs", session_cache_ttl=60
+        ) as network_client:
+            created = await network_client.create_qod_session(
+                camara_session("10.45.0.2")
+            )
+            session_id = str(created["sessionId"])
+            await network_client.get_qod_session(session_id)
+            await network_client.delete_qod_session(session_id)
+            return network_client.session_registry_stats()
+
+    with NefEmulator() as emulator:
+        stats = asyncio.run(scenario(emulator.base_url))
+        assert emulator.requests_served == 2
+    assert stats["hits"] == 1
+    assert stats["size"] == 0
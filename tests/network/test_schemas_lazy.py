@@ -0,0 +1,58 @@
+# -*- coding: utf-8 -*-
+import json
+import subprocess
+import sys
+
+from benchmarks.import_time import import_times
+from sunrise6g_opensdk.network.core import schemas
+
+# Runs in a fresh interpreter, other tests build models in this one
+_BUILT_MODELS_SNIPPET = """
+import json
+import pydantic
+import sunrise6g_opensdk
+from sunrise6g_opensdk.network.core import schemas
+
+def built():
+    return sorted(
+        name
+        for name, model in vars(schemas).items()
+        if isinstance(model, type)
+        and issubclass(model, pydantic.BaseModel)
+        and model.__module__ == schemas.__name__
+        and model not in (schemas.BaseModel, schemas.RootModel)
+        and model.__pydantic_complete__
+    )
+
+after_import = built()
+schemas.Snssai(sst=1)
+print(json.dumps({"after_import": after_import, "after_use": built()}))
+"""
+
+
+def test_models_are_built_on_first_use():
+    completed = subprocess.run(
+        [sys.executable, "-c", _BUILT_MODELS_SNIPPET],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    built = json.loads(completed.stdout.strip().splitlines()[-1])
+    assert built["after_import"] == []
+    assert built["after_use"] == ["Snssai"]
+
+
+def test_deferred_models_keep_their_config():
+    subscription = schemas.AsSessionWithQoSSubscription(
+        notificationDestination="https://endpoint.example.com/sink",
+        **{"self": "https://nef.example.com/subscriptions/1"},
+    )
+    # serialize_by_alias is merged with the deferred build setting
+    assert "self" in subscription.model_dump(exclude_none=True)
+    assert schemas.Port(5000).root == 5000
+    assert schemas.SessionInfo.model_config["defer_build"]
+
+
+def test_import_time_benchmark():
+    times = import_times("sunrise6g_opensdk.network.core.schemas")
+    assert times["sunrise6g_opensdk.network.core.schemas"] > 0
@@ -0,0 +1,130 @@
+# -*- coding: utf-8 -*-
+import asyncio
+import json
+
+import pytest
+
+from benchmarks.network_adapters import ti_info
+from sunrise6g_opensdk.common.sdk import Sdk as sdkclient
+from sunrise6g_opensdk.network.adapters.oai.async_client import (
+    AsyncNetworkManager as AsyncOaiClient,
+)
+from sunrise6g_opensdk.network.core import schemas
+from sunrise6g_opensdk.network.core.common import JsonArrayParser
+from sunrise6g_opensdk.network.nef_emulator import NefEmulator
+
+DOCUMENT = [
+    {"self": "http://nef/1", "flows": ["permit out ip from a to b"]},
+    {"text": "brackets ] and, commas [ in strings", "unicode": "ñ€😀"},
+    [1, 2, {"nested": []}],
+    12345,
+    "string",
+    None,
+]
+
+
+def _parse(chunks: list[bytes]) -> list:
+    parser = JsonArrayParser()
+    items = []
+    for chunk in chunks:
+        items.extend(parser.feed(chunk))
+    items.extend(parser.feed(b"", final=True))
+    return items
+
+
+def _network_client(base_url: str):
+    adapter_specs = {
+        "network": {"client_name": "oai", "base_url": base_url, "scs_as_id": "scs"}
+    }
+    return sdkclient.create_adapters_from(adapter_specs)["network"]
+
+
+def _populate(emulator: NefEmulator, count: int) -> None:
+    with _network_client(emulator.base_url) as network_client:
+        for i in range(count):
+            network_client.create_traffic_influence_resource(ti_info(i))
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 7, 1000])
+def test_parser_handles_any_chunking(chunk_size):
+    document = json.dumps(DOCUMENT, ensure_ascii=False, indent=1).encode()
+    chunks = [document[i : i + chunk_size] for i in range(0, len(document), chunk_size)]
+    assert _parse(chunks) == DOCUMENT
+
+
+def test_parser_yields_items_as_soon_as_complete():
+    parser = JsonArrayParser()
+    assert parser.feed(b'[{"a": 1}, {"b"') == [{"a": 1}]
+    assert parser.feed(b": 2}, 3") == [{"b": 2}]
+    assert parser.feed(b"4]") == [34]
+
+
+@pytest.mark.parametrize("document", [b"", b"[]", b" [ ] \n"])
+def test_parser_empty_listings(document):
+    assert _parse([document]) == []
+
+
+@pytest.mark.parametrize(
+    "document", [b"{}", b"[1,]", b"[1 2]", b"[1", b'[{"a": }]', b"[1] 2", b"[,1]"]
+)
+def test_parser_rejects_invalid_documents(document):
+    with pytest.raises(json.JSONDecodeError):
+        _parse([document])
+
+
+def test_iterates_over_the_whole_listing():
+    with NefEmulator() as emulator:
+        _populate(emulator, 25)
+        with _network_client(emulator.base_url) as network_client:
+            before = emulator.requests_served
+            resources = network_client.iter_traffic_influence_resources()
+            assert emulator.requests_served == before  # nothing sent until iterated
+            first = next(resources)
+            assert isinstance(first, schemas.CreateTrafficInfluence)
+            assert len([first, *resources]) == 25
+            assert emulator.requests_served == before + 1
+            assert len(network_client.get_all_traffic_influence_resource()) == 25
+
+
+@pytest.mark.parametrize("page_size, calls", [(10, 3), (5, 6), (100, 1)])
+def test_iterates_over_pages(page_size, calls):
+    with NefEmulator() as emulator:
+        _populate(emulator, 25)
+        with _network_client(emulator.base_url) as network_client:
+            before = emulator.requests_served
+            resources = list(
+                network_client.iter_traffic_influence_resources(page_size=page_size)
+            )
+            assert emulator.requests_served - before == calls
+    devices = [str(ti.device.ipv4Address.root.publicAddress.root) for ti in resources]
+    assert devices == [
+        ti_info(i)["device"]["ipv4Address"]["publicAddress"] for i in range(25)
+    ]
+
+
+def test_paging_ignored_by_the_nef():
+    with NefEmulator() as emulator:
+        _populate(emulator, 10)
+        with _network_client(emulator.base_url) as network_client:
+            network_client.core_specific_ti_paging_parameters = lambda offset, size: {}
+            before = emulator.requests_served
+            assert len(list(network_client.iter_traffic_influence_resources(10))) == 10
+            assert emulator.requests_served - before == 2
+            assert len(list(network_client.iter_traffic_influence_resources(4))) == 10
+            with pytest.raises(ValueError):
+                next(network_client.iter_traffic_influence_resources(0))
+
+
+def test_async_iteration():
+    async def scenario(base_url):
+        async with AsyncOaiClient(base_url=base_url, scs_as_id="scs") as network_client:
+            paged = [
+                ti async for ti in network_client.iter_traffic_influence_resources(4)
+            ]
+            return paged, await network_client.get_all_traffic_influence_resource()
+
+    with NefEmulator() as emulator:
+        _populate(emulator, 10)
+        paged, everything = asyncio.run(scenario(emulator.base_url))
+    assert len(paged) == len(everything) == 10
+    assert paged == everything